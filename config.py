@@ -3,10 +3,18 @@
 
 CONFIG = {
     # 파일 경로들
+    # 단일 파일, 디렉토리(order_list_*.xlsx 전체) 또는 glob 패턴 지정 가능
+    # 여러 파일이면 병렬 로드 후 주문번호+상품주문번호 기준으로 최신 export만 유지
     "INPUT_XLSX": "./files/order_list_20250818120157_497.xlsx",
     "CATEGORY_MAPPING_PATH": "./files/brich_category_250407.csv",
     "OUTPUT_DIR": "./reports",
     
+    # 증분 저장소 경로. 지정하면 새 export의 신규/변경 주문만 전처리해 누적 (None이면 매번 전체 처리)
+    "ORDER_STORE_DIR": None,     # 예: "./files/.store"
+    
+    # 고객 ID를 md5 12자리 대신 64비트 정수 해시로 생성 (더 빠르고 메모리 절약, ID 값은 달라짐)
+    "FAST_CUSTOMER_ID": False,
+    
     # 기간 필터 (결제일 기준). None이면 전체 사용
     "START_DATE": None,          # 예: "2025-08-11"
     "END_DATE":   None,          # 예: "2025-08-18"
@@ -14,6 +22,17 @@ CONFIG = {
     # 리포트 생성 대상 셀러명 리스트 (정확히 일치). 빈 리스트면 파일의 모든 셀러 자동 생성
     "SELLERS": ["포레스트핏"],     # 예: ["포레스트핏", "ABC몰"]  / []면 전체
     
+    # 벤치마크 범위. "category"면 대상 셀러의 주력 카테고리 행만 남기고 플랫폼 전체는 요약으로 보관
+    # (셀러 1~몇 개 실행 시 메모리/분석 시간 절약). "platform"이면 전체 데이터 유지
+    "BENCHMARK_SCOPE": "platform",
+    
+    # DataPipeline 분석/KPI 메모리 캐시 예산 (초과 시 가장 오래 안 쓴 결과부터 제거, None이면 제한 없음)
+    "PIPELINE_CACHE_MAX_ENTRIES": 128,
+    "PIPELINE_CACHE_MAX_BYTES": 256 * 1024 * 1024,
+    
+    # 셀러별 KPI/분석 결과 디스크 캐시 경로. 입력 파일·셀러·기간·코드가 같으면 분석을 건너뜀 (None이면 사용 안 함)
+    "RESULT_CACHE_DIR": "./files/.cache/results",
+    
     # 모든 셀러 합산 리포트도 생성할지
     "BUILD_OVERALL_REPORT": True,
     
@@ -9,6 +9,7 @@ COL_ORDER_AMOUNT   = "상품별 총 주문금액"
 COL_SELLER         = "입점사명"
 COL_CHANNEL        = "판매채널"
 COL_ORDER_ID       = "주문번호"
+COL_ITEM_ORDER_ID  = "상품주문번호"   # 주문 내 품목 라인 식별
 
 # 품목/수량
 COL_ITEM_NAME      = "상품명"
@@ -39,4 +40,27 @@ COL_SETTLEMENT     = "정산금액"
 COL_PRODUCT_PRICE  = "상품가격"
 
 # 환불/취소 키워드
-REFUND_REGEX_OPEN  = r"(?:환불|취소|반품|refund|cancel)"
\ No newline at end of file
+REFUND_REGEX_OPEN  = r"(?:환불|취소|반품|refund|cancel)"
+
+# 분석에 사용하는 칼럼 (로딩 시 이 칼럼만 디코딩)
+ANALYSIS_COLUMNS = [
+    COL_PAYMENT_DATE, COL_ORDER_AMOUNT, COL_SELLER, COL_CHANNEL,
+    COL_QTY, COL_STATUS, COL_REFUND_FIELD, COL_SHIP_DATE,
+    COL_DELIVERED_DATE, COL_CUSTOMER, COL_ITEM_NAME, COL_ORDER_ID,
+    COL_BUYER_NAME, COL_BUYER_PHONE, COL_ADDRESS, COL_POSTAL_CODE,
+    COL_CATEGORY, COL_SETTLEMENT, COL_PRODUCT_PRICE, COL_ITEM_ORDER_ID,
+]
+
+# 로딩 시 칼럼 타입 스키마 ("category" | "numeric" | "datetime" | "string")
+ORDER_SCHEMA = {
+    COL_ORDER_ID:       "string",
+    COL_ITEM_ORDER_ID:  "string",
+    COL_SELLER:         "category",
+    COL_CHANNEL:        "category",
+    COL_STATUS:         "category",
+    COL_ORDER_AMOUNT:   "numeric",
+    COL_QTY:            "numeric",
+    COL_PAYMENT_DATE:   "datetime",
+    COL_SHIP_DATE:      "datetime",
+    COL_DELIVERED_DATE: "datetime",
+}
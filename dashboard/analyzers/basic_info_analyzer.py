@@ -3,6 +3,7 @@
 from datetime import datetime
 from .base_analyzer import BaseAnalyzer
 from constants import COL_SELLER
+from data_processing import get_seller_main_category
 
 class BasicInfoAnalyzer(BaseAnalyzer):
     """기본 정보 분석"""
@@ -13,22 +14,22 @@ class BasicInfoAnalyzer(BaseAnalyzer):
         
         # 기본 통계
         info['seller_name'] = self.seller_name
-        info['analysis_date'] = datetime.now().strftime('%Y-%m-%d %H:%M')
+        info['analysis_date'] = self.current_analysis_date()
         info['period_start'] = self.seller_data['__dt__'].min().strftime('%Y-%m-%d')
         info['period_end'] = self.seller_data['__dt__'].max().strftime('%Y-%m-%d')
         info['total_days'] = (self.seller_data['__dt__'].max() - self.seller_data['__dt__'].min()).days + 1
         
         # 주력 카테고리
         if '__category_mapped__' in self.seller_data.columns:
-            cat_revenue = self.seller_data.groupby('__category_mapped__')['__amount__'].sum()
-            if not cat_revenue.empty:
-                info['main_category'] = cat_revenue.idxmax()
-                info['main_category_share'] = (cat_revenue.max() / self.seller_data['__amount__'].sum()) * 100
+            main_category = get_seller_main_category(self.seller_data)
+            if main_category is not None:
+                info['main_category'] = main_category['main_category']
+                info['main_category_share'] = (main_category['category_revenue'] / main_category['total_revenue']) * 100
                 
                 # 카테고리 내 순위 계산
                 if '__category_mapped__' in self.overall_data.columns and COL_SELLER in self.overall_data.columns:
                     category_data = self.overall_data[self.overall_data['__category_mapped__'] == info['main_category']]
-                    seller_perf = category_data.groupby(COL_SELLER)['__amount__'].sum().sort_values(ascending=False)
+                    seller_perf = category_data.groupby(COL_SELLER, observed=True)['__amount__'].sum().sort_values(ascending=False)
                     
                     if self.seller_name in seller_perf.index:
                         rank = seller_perf.index.get_loc(self.seller_name) + 1
@@ -40,4 +41,9 @@ class BasicInfoAnalyzer(BaseAnalyzer):
                         info['category_percentile'] = ((total_sellers - rank) / total_sellers) * 100
                         info['market_share'] = market_share
         
-        return info
\ No newline at end of file
+        return info
+    
+    @staticmethod
+    def current_analysis_date() -> str:
+        """분석일시 (실행 시각 - 결과 캐시 적중 시에도 다시 기록)"""
+        return datetime.now().strftime('%Y-%m-%d %H:%M')
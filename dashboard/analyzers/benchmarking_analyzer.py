@@ -5,6 +5,7 @@ import numpy as np
 import pandas as pd
 from .base_analyzer import BaseAnalyzer
 from constants import COL_SELLER
+from data_processing import get_seller_main_category, top_k, rank_matrix
 
 class BenchmarkingAnalyzer(BaseAnalyzer):
     """벤치마킹 분석"""
@@ -24,17 +25,20 @@ class BenchmarkingAnalyzer(BaseAnalyzer):
             category_data = self.overall_data[self.overall_data['__category_mapped__'] == main_category]
             
             # 셀러별 성과 집계
-            seller_performance = category_data.groupby(COL_SELLER).agg({
+            seller_performance = category_data.groupby(COL_SELLER, observed=True).agg({
                 '__amount__': ['sum', 'count', 'mean'],
                 '__customer_id__': 'nunique' if '__customer_id__' in category_data.columns else lambda x: np.nan
             }).round(2)
             
             seller_performance.columns = ['총매출', '주문수', 'AOV', '고객수']
-            seller_performance = seller_performance.sort_values('총매출', ascending=False)
+            
+            # 지표별 순위 행렬 (지표마다 argsort 한 번, 매출은 동률이면 원래 순서로 매출순위와 공유)
+            metrics = ['총매출', '주문수', 'AOV', '고객수']
+            ranks = rank_matrix(seller_performance, metrics, method={'총매출': 'first'})
             
             # 내 순위 정보
             if self.seller_name in seller_performance.index:
-                my_rank = seller_performance.index.get_loc(self.seller_name) + 1
+                my_rank = int(ranks['총매출'][self.seller_name])
                 total_sellers = len(seller_performance)
                 
                 position_metrics = {
@@ -43,15 +47,15 @@ class BenchmarkingAnalyzer(BaseAnalyzer):
                 }
                 
                 # 각 지표별 순위
-                for metric in ['총매출', '주문수', 'AOV', '고객수']:
+                for metric in metrics:
                     if not seller_performance[metric].isna().all():
-                        metric_rank = seller_performance[metric].rank(ascending=False)[self.seller_name]
+                        metric_rank = ranks[metric][self.seller_name]
                         position_metrics[f'{metric}_순위'] = f"{int(metric_rank)}/{total_sellers}"
                 
                 benchmarking['position_metrics'] = position_metrics
                 
-                # 경쟁사 TOP 5 (나를 포함)
-                top_competitors = seller_performance.head(10)
+                # 경쟁사 TOP 10 (나를 포함, 전체 정렬 없이 선택)
+                top_competitors = top_k(seller_performance, '총매출', 10)
                 benchmarking['top_competitors'] = top_competitors
         
         # B. 상대적 성과 분석
@@ -73,15 +77,15 @@ class BenchmarkingAnalyzer(BaseAnalyzer):
     def _get_main_category(self):
         """주력 카테고리 조회"""
         if '__category_mapped__' in self.seller_data.columns:
-            cat_revenue = self.seller_data.groupby('__category_mapped__')['__amount__'].sum()
-            if not cat_revenue.empty:
-                return cat_revenue.idxmax()
+            main_category = get_seller_main_category(self.seller_data)
+            if main_category is not None:
+                return main_category['main_category']
         return None
     
     def _get_performance_grade(self, value: float, metric_name: str) -> str:
         """성과 등급 계산"""
         # 낮을수록 좋은 지표들
-        if any(bad_word in metric_name for bad_word in ['cancel', 'delay', 'return']):
+        if any(bad_word in metric_name for bad_word in ['cancel', 'delay', 'return', 'claim']):
             if value <= 0.7: return 'A+'
             elif value <= 0.8: return 'A'
             elif value <= 0.9: return 'B+'
@@ -98,7 +102,7 @@ class BenchmarkingAnalyzer(BaseAnalyzer):
     def _get_improvement_potential(self, value: float, metric_name: str) -> str:
         """개선 여지 평가"""
         # 낮을수록 좋은 지표들
-        if any(bad_word in metric_name for bad_word in ['cancel', 'delay', 'return']):
+        if any(bad_word in metric_name for bad_word in ['cancel', 'delay', 'return', 'claim']):
             if value <= 0.8: return '유지'
             elif value <= 1.1: return '중간'
             else: return '높음'
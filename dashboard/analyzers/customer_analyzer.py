@@ -45,7 +45,7 @@ class CustomerAnalyzer(BaseAnalyzer):
         
         # C. 지역별 고객 분석
         if '__region__' in customer_data.columns:
-            region_analysis = customer_data.groupby('__region__').agg({
+            region_analysis = customer_data.groupby('__region__', observed=True).agg({
                 '__customer_id__': 'nunique',
                 '__amount__': ['sum', 'mean'],
                 '__dt__': 'count'
@@ -3,6 +3,7 @@
 import pandas as pd
 from .base_analyzer import BaseAnalyzer
 from constants import COL_STATUS, COL_SHIP_DATE, COL_DELIVERED_DATE, COL_REFUND_FIELD
+from data_processing import ship_lead_days, delivery_days, claim_flag
 
 class OperationsAnalyzer(BaseAnalyzer):
     """운영 분석"""
@@ -13,7 +14,8 @@ class OperationsAnalyzer(BaseAnalyzer):
         
         # A. 주문 처리 현황
         if COL_STATUS in self.seller_data.columns:
-            status_analysis = self.seller_data[COL_STATUS].value_counts()
+            # 범주형이면 동률이 범주 순서로 정렬되므로 문자열로 집계 (동률은 등장 순서)
+            status_analysis = self.seller_data[COL_STATUS].astype(str).value_counts()
             status_df = pd.DataFrame({
                 '상태': status_analysis.index,
                 '건수': status_analysis.values,
@@ -31,32 +33,29 @@ class OperationsAnalyzer(BaseAnalyzer):
                 '지연율': (status_analysis.get('배송지연', 0) / total_orders * 100),
                 '반품률': (status_analysis.get('반품', 0) / total_orders * 100)
             }
+            if COL_REFUND_FIELD in self.seller_data.columns:
+                # 환불/취소/반품 클레임 비율 (변환 단계 클레임 플래그의 평균)
+                operations['key_metrics']['클레임률'] = claim_flag(self.seller_data).mean() * 100
         
         # B. 배송 성과 분석
         shipping_metrics = {}
         
         if COL_SHIP_DATE in self.seller_data.columns:
-            ship_data = self.seller_data[self.seller_data[COL_SHIP_DATE].notna()].copy()
-            if not ship_data.empty:
-                ship_data['ship_dt'] = pd.to_datetime(ship_data[COL_SHIP_DATE], errors='coerce')
-                ship_data['출고소요시간'] = (ship_data['ship_dt'] - ship_data['__dt__']).dt.total_seconds() / 86400.0
+            has_ship = self.seller_data[COL_SHIP_DATE].notna()
+            if has_ship.any():
+                lead_times = ship_lead_days(self.seller_data)[has_ship]
                 
-                shipping_metrics['평균출고시간'] = ship_data['출고소요시간'].mean()
-                shipping_metrics['당일발송률'] = (ship_data['출고소요시간'] <= 1).mean() * 100
+                shipping_metrics['평균출고시간'] = lead_times.mean()
+                shipping_metrics['당일발송률'] = (lead_times <= 1).mean() * 100
                 
         if COL_DELIVERED_DATE in self.seller_data.columns and COL_SHIP_DATE in self.seller_data.columns:
-            delivery_data = self.seller_data[
-                self.seller_data[COL_DELIVERED_DATE].notna() & 
-                self.seller_data[COL_SHIP_DATE].notna()
-            ].copy()
+            has_delivery = self.seller_data[COL_DELIVERED_DATE].notna() & self.seller_data[COL_SHIP_DATE].notna()
             
-            if not delivery_data.empty:
-                delivery_data['delivery_dt'] = pd.to_datetime(delivery_data[COL_DELIVERED_DATE], errors='coerce')
-                delivery_data['ship_dt'] = pd.to_datetime(delivery_data[COL_SHIP_DATE], errors='coerce')
-                delivery_data['배송소요시간'] = (delivery_data['delivery_dt'] - delivery_data['ship_dt']).dt.total_seconds() / 86400.0
+            if has_delivery.any():
+                delivery_times = delivery_days(self.seller_data)[has_delivery]
                 
-                shipping_metrics['평균배송시간'] = delivery_data['배송소요시간'].mean()
-                shipping_metrics['빠른배송률'] = (delivery_data['배송소요시간'] <= 2).mean() * 100
+                shipping_metrics['평균배송시간'] = delivery_times.mean()
+                shipping_metrics['빠른배송률'] = (delivery_times <= 2).mean() * 100
         
         operations['shipping_metrics'] = shipping_metrics
         
@@ -3,6 +3,7 @@
 import pandas as pd
 from .base_analyzer import BaseAnalyzer
 from constants import COL_CHANNEL, COL_ITEM_NAME, COL_PRODUCT_PRICE
+from data_processing import get_aggregate_cube, top_k
 
 class SalesAnalyzer(BaseAnalyzer):
     """매출 분석"""
@@ -10,6 +11,7 @@ class SalesAnalyzer(BaseAnalyzer):
     def analyze(self) -> dict:
         """매출 분석"""
         sales = {}
+        cube = get_aggregate_cube(self.seller_data)
         
         # A. 기본 매출 지표
         basic_metrics = {
@@ -27,12 +29,15 @@ class SalesAnalyzer(BaseAnalyzer):
         
         # B. 채널별 매출 분석
         if COL_CHANNEL in self.seller_data.columns:
-            channel_analysis = self.seller_data.groupby(COL_CHANNEL).agg({
-                '__amount__': ['sum', 'count', 'mean'],
-                '__qty__': 'sum'
+            totals = cube.rollup(['channel'])
+            channel_analysis = pd.DataFrame({
+                '매출액': totals['revenue'],
+                '주문수': totals['orders'],
+                'AOV': totals['revenue'] / totals['orders'],
+                '판매수량': totals['qty'],
             }).round(2)
+            channel_analysis.index.name = COL_CHANNEL
             
-            channel_analysis.columns = ['매출액', '주문수', 'AOV', '판매수량']
             channel_analysis['매출비중'] = (channel_analysis['매출액'] / channel_analysis['매출액'].sum()) * 100
             channel_analysis = channel_analysis.sort_values('매출액', ascending=False)
             
@@ -47,24 +52,18 @@ class SalesAnalyzer(BaseAnalyzer):
             
             product_analysis.columns = ['매출액', '주문수', 'AOV', '판매수량']
             product_analysis['매출기여도'] = (product_analysis['매출액'] / product_analysis['매출액'].sum()) * 100
-            product_analysis = product_analysis.sort_values('매출액', ascending=False).head(20)
+            product_analysis = top_k(product_analysis, '매출액', 20)
             
             sales['product_analysis'] = product_analysis
         
         # D. 시간대별 매출 패턴
-        hourly_pattern = self.seller_data.groupby(self.seller_data['__dt__'].dt.hour).agg({
-            '__amount__': ['sum', 'count', 'mean']
-        }).round(2)
-        hourly_pattern.columns = ['매출액', '주문수', 'AOV']
+        hourly_pattern = _pattern_table(cube, 'hour')
         hourly_pattern['시간대'] = hourly_pattern.index.map(lambda x: f"{x:02d}-{x+1:02d}시")
         
         sales['hourly_pattern'] = hourly_pattern
         
         # E. 요일별 매출 패턴
-        daily_pattern = self.seller_data.groupby(self.seller_data['__dt__'].dt.day_name()).agg({
-            '__amount__': ['sum', 'count', 'mean']
-        }).round(2)
-        daily_pattern.columns = ['매출액', '주문수', 'AOV']
+        daily_pattern = _pattern_table(cube, 'day_name')
         
         # 요일 순서 정렬
         day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
@@ -72,4 +71,15 @@ class SalesAnalyzer(BaseAnalyzer):
         
         sales['daily_pattern'] = daily_pattern
         
-        return sales
\ No newline at end of file
+        return sales
+
+def _pattern_table(cube, dim: str) -> pd.DataFrame:
+    """시간 차원별 매출액/주문수/AOV (집계 큐브 롤업)"""
+    totals = cube.rollup([dim])
+    pattern = pd.DataFrame({
+        '매출액': totals['revenue'],
+        '주문수': totals['orders'],
+        'AOV': totals['revenue'] / totals['orders'],
+    }).round(2)
+    pattern.index.name = '__dt__'
+    return pattern
\ No newline at end of file
@@ -3,6 +3,7 @@
 import pandas as pd
 from datetime import timedelta
 from .base_analyzer import BaseAnalyzer
+from data_processing import get_aggregate_cube
 
 class TrendsAnalyzer(BaseAnalyzer):
     """트렌드 분석"""
@@ -10,15 +11,18 @@ class TrendsAnalyzer(BaseAnalyzer):
     def analyze(self) -> dict:
         """트렌드 분석"""
         trends = {}
+        cube = get_aggregate_cube(self.seller_data)
         
         # A. 월별 트렌드 (데이터 기간이 충분한 경우)
-        monthly_trend = self.seller_data.groupby(self.seller_data['__dt__'].dt.to_period('M')).agg({
-            '__amount__': ['sum', 'count', 'mean'],
-            '__customer_id__': 'nunique' if '__customer_id__' in self.seller_data.columns else lambda x: None
+        totals = cube.rollup(['month'])
+        customers = cube.distinct_customers(['month'])
+        monthly_trend = pd.DataFrame({
+            '매출액': totals['revenue'],
+            '주문수': totals['orders'],
+            'AOV': totals['revenue'] / totals['orders'],
+            '고객수': customers.reindex(totals.index, fill_value=0) if customers is not None else None,
         }).round(2)
-        
-        monthly_trend.columns = ['매출액', '주문수', 'AOV', '고객수']
-        monthly_trend.index = monthly_trend.index.astype(str)
+        monthly_trend.index = pd.Index(monthly_trend.index.astype(str), name='__dt__')
         
         # 성장률 계산
         if len(monthly_trend) > 1:
@@ -28,12 +32,12 @@ class TrendsAnalyzer(BaseAnalyzer):
         trends['monthly_trend'] = monthly_trend
         
         # B. 주별 트렌드
-        weekly_trend = self.seller_data.groupby(self.seller_data['__dt__'].dt.to_period('W')).agg({
-            '__amount__': ['sum', 'count'],
+        totals = cube.rollup(['week'])
+        weekly_trend = pd.DataFrame({
+            '매출액': totals['revenue'],
+            '주문수': totals['orders'],
         }).round(2)
-        
-        weekly_trend.columns = ['매출액', '주문수']
-        weekly_trend.index = weekly_trend.index.astype(str)
+        weekly_trend.index = pd.Index(weekly_trend.index.astype(str), name='__dt__')
         
         trends['weekly_trend'] = weekly_trend
         
@@ -1,8 +1,11 @@
 """셀러 성과 대시보드 메인 클래스"""
 
+from pathlib import Path
+from typing import Optional
 from config import CONFIG
-from file_manager import load_excel_data
-from data_processing import prepare_dataframe, slice_by_seller, calculate_comprehensive_kpis
+from file_manager import load_order_exports, sync_order_store, dataset_fingerprint
+from data_processing import prepare_dataframe, slice_by_seller, calculate_comprehensive_kpis, scope_benchmark_data, IncrementalOrderStore
+from data_processing.cache import PersistentResultCache, source_fingerprint
 from analyzers.basic_info_analyzer import BasicInfoAnalyzer
 from analyzers.sales_analyzer import SalesAnalyzer
 from analyzers.customer_analyzer import CustomerAnalyzer
@@ -11,6 +14,19 @@ from analyzers.benchmarking_analyzer import BenchmarkingAnalyzer
 from analyzers.trends_analyzer import TrendsAnalyzer
 from exporters.excel_exporter import ExcelExporter
 
+# 결과 캐시 포맷이 바뀌면 올려서 기존 캐시를 무효화
+RESULT_CACHE_VERSION = 1
+
+# 결과 캐시 키에 포함되는 코드 (내용이 바뀌면 캐시 무효화)
+_ROOT_DIR = Path(__file__).resolve().parents[2]
+RESULT_CACHE_SOURCES = [
+    _ROOT_DIR / "data_processing", _ROOT_DIR / "dashboard" / "analyzers", _ROOT_DIR / "dashboard" / "core",
+    _ROOT_DIR / "constants.py", _ROOT_DIR / "file_manager.py",
+]
+
+# 분석 결과에 영향을 주는 설정
+RESULT_CACHE_SETTINGS = ["FAST_CUSTOMER_ID", "BENCHMARK_SCOPE", "ORDER_STORE_DIR"]
+
 class SellerDashboard:
     """셀러 성과 대시보드"""
     
@@ -22,19 +38,40 @@ class SellerDashboard:
         self.overall_data = None
         self.kpis = None
         self.analysis_data = {}
+        self.from_cache = False
+        self.result_cache = PersistentResultCache(CONFIG["RESULT_CACHE_DIR"]) if CONFIG.get("RESULT_CACHE_DIR") else None
+        self._result_cache_key = None
         
     def load_data(self):
-        """데이터 로딩 및 전처리"""
+        """데이터 로딩 및 전처리 (같은 입력/셀러/기간/코드의 결과 캐시가 있으면 로딩 생략)"""
         try:
             input_path = CONFIG["INPUT_XLSX"]
-            self.df = load_excel_data(input_path)
-            self.dfp = prepare_dataframe(self.df, None, None)
-            self.overall_data = self.dfp.copy()
+            if self._load_cached_results():
+                print(f"✅ {self.seller_name} 캐시된 분석 결과 사용 (데이터 로딩/분석 생략)")
+                return True
             
+            if CONFIG.get("ORDER_STORE_DIR"):
+                # 증분 저장소: 새 export의 변경분만 전처리
+                self.dfp = sync_order_store(input_path, CONFIG["ORDER_STORE_DIR"],
+                                            CONFIG.get("START_DATE"), CONFIG.get("END_DATE"))
+                if self._result_cache_key:
+                    # 반영 후 저장소 상태로 키를 갱신해 다음 실행의 조회 키와 맞춤
+                    self._result_cache_key = self._make_result_cache_key()
+            else:
+                self.df = load_order_exports(input_path)
+                self.dfp = prepare_dataframe(self.df, CONFIG.get("START_DATE"), CONFIG.get("END_DATE"))
             if self.seller_name != "전체":
                 self.seller_data = slice_by_seller(self.dfp, self.seller_name)
             else:
                 self.seller_data = self.dfp.copy()
+            
+            if self.seller_name != "전체" and CONFIG.get("BENCHMARK_SCOPE") == "category":
+                # 경쟁 카테고리 행만 유지하고 전체 데이터는 해제
+                self.overall_data = scope_benchmark_data(self.dfp, [self.seller_name])
+                self.df = None
+                self.dfp = self.overall_data
+            else:
+                self.overall_data = self.dfp.copy()
                 
             self.kpis = calculate_comprehensive_kpis(self.seller_data, self.overall_data)
             return True
@@ -45,6 +82,8 @@ class SellerDashboard:
     
     def analyze_all_data(self):
         """모든 분석 데이터 생성"""
+        if self.from_cache:
+            return
         
         # 분석기 인스턴스 생성
         analyzers = {
@@ -61,6 +100,55 @@ class SellerDashboard:
             self.analysis_data[key] = analyzer.analyze()
         
         print(f"✅ {self.seller_name} 분석 완료 - {len(self.analysis_data)}개 영역")
+        
+        if self.result_cache is not None and self._result_cache_key:
+            self.result_cache.put(self._result_cache_key, {'kpis': self.kpis, 'analysis_data': self.analysis_data})
+    
+    def _load_cached_results(self) -> bool:
+        """결과 캐시 조회 - 적중하면 kpis/analysis_data 복원"""
+        if self.result_cache is None:
+            return False
+        
+        self._result_cache_key = self._make_result_cache_key()
+        if self._result_cache_key is None:
+            return False
+        
+        cached = self.result_cache.get(self._result_cache_key)
+        if cached is None:
+            return False
+        
+        self.kpis = cached['kpis']
+        self.analysis_data = cached['analysis_data']
+        # 분석일시는 캐시 시점이 아닌 이번 실행 시각으로
+        if 'basic_info' in self.analysis_data:
+            self.analysis_data['basic_info']['analysis_date'] = BasicInfoAnalyzer.current_analysis_date()
+        self.from_cache = True
+        return True
+    
+    def _make_result_cache_key(self) -> Optional[str]:
+        """데이터 지문 + 셀러 + 기간 + 코드 버전 (+ 증분 저장소 상태) 기반 캐시 키"""
+        dataset = dataset_fingerprint(CONFIG["INPUT_XLSX"], [CONFIG.get("CATEGORY_MAPPING_PATH")])
+        if dataset is None:
+            return None
+        return PersistentResultCache.make_key(
+            version=RESULT_CACHE_VERSION,
+            dataset=dataset,
+            seller=self.seller_name,
+            start=CONFIG.get("START_DATE"),
+            end=CONFIG.get("END_DATE"),
+            code=source_fingerprint(RESULT_CACHE_SOURCES),
+            settings={key: CONFIG.get(key) for key in RESULT_CACHE_SETTINGS},
+            store=self._order_store_state(),
+        )
+    
+    @staticmethod
+    def _order_store_state() -> Optional[dict]:
+        """증분 저장소에 반영된 export 목록/워터마크 (저장소는 이전 export 행도 보관하므로 키에 포함)"""
+        store_dir = CONFIG.get("ORDER_STORE_DIR")
+        if not store_dir:
+            return None
+        state = IncrementalOrderStore(store_dir).state
+        return {"exports": state.get("exports"), "watermark": state.get("watermark")}
     
     def export_to_excel(self, output_path: str = None):
         """엑셀 파일로 출력"""
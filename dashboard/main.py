@@ -11,7 +11,7 @@ parent_dir = current_dir.parent
 sys.path.insert(0, str(parent_dir))
 
 from config import CONFIG
-from file_manager import load_excel_data
+from file_manager import load_order_exports, resolve_input_files
 from constants import COL_SELLER
 from data_processing import prepare_dataframe
 from utils import format_currency  # excel_formatter에서 가져옴
@@ -22,13 +22,17 @@ def fix_config_paths():
     original_input = CONFIG["INPUT_XLSX"]
     
     # 원본 경로에 파일이 없으면 상위 디렉토리 기준으로 조정
-    if not Path(original_input).exists():
+    if not resolve_input_files(original_input):
         CONFIG["INPUT_XLSX"] = str(parent_dir / original_input)
         if CONFIG.get("CATEGORY_MAPPING_PATH"):
             CONFIG["CATEGORY_MAPPING_PATH"] = str(parent_dir / CONFIG["CATEGORY_MAPPING_PATH"])
         CONFIG["OUTPUT_DIR"] = str(parent_dir / CONFIG.get("OUTPUT_DIR", "./reports"))
+        if CONFIG.get("ORDER_STORE_DIR"):
+            CONFIG["ORDER_STORE_DIR"] = str(parent_dir / CONFIG["ORDER_STORE_DIR"])
+        if CONFIG.get("RESULT_CACHE_DIR"):
+            CONFIG["RESULT_CACHE_DIR"] = str(parent_dir / CONFIG["RESULT_CACHE_DIR"])
     
-    return Path(CONFIG["INPUT_XLSX"]).exists()
+    return bool(resolve_input_files(CONFIG["INPUT_XLSX"]))
 
 def main():
     """메인 실행 함수"""
@@ -47,11 +51,11 @@ def main():
     if not target_seller:
         # 매출 1위 셀러 자동 선택
         try:
-            df = load_excel_data(CONFIG["INPUT_XLSX"])
-            dfp = prepare_dataframe(df, None, None)
+            df = load_order_exports(CONFIG["INPUT_XLSX"])
+            dfp = prepare_dataframe(df, CONFIG.get("START_DATE"), CONFIG.get("END_DATE"))
             
             if COL_SELLER in dfp.columns:
-                seller_revenue = dfp.groupby(COL_SELLER)['__amount__'].sum().sort_values(ascending=False)
+                seller_revenue = dfp.groupby(COL_SELLER, observed=True)['__amount__'].sum().sort_values(ascending=False)
                 target_seller = seller_revenue.index[0]
                 print(f"💡 매출 1위 셀러 '{target_seller}' 자동 선택")
             else:
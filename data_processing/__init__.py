@@ -6,7 +6,8 @@ from .validation import (
     validate_dataframe, 
     prepare_dataframe, 
     slice_by_seller, 
-    safe_divide
+    safe_divide,
+    filter_valid_period
 )
 
 # 새로운 구조의 모듈들
@@ -14,6 +15,13 @@ from .transformers import *
 from .analyzers import *
 from .metrics import *
 from .pipeline import DataPipeline, get_pipeline, apply_all_transformations
+from .order_store import IncrementalOrderStore
+from .cache import LRUCache, frame_fingerprint
+from .seller_index import SellerIndex, get_seller_index
+from .cube import AggregateCube, get_aggregate_cube
+from .query import query, query_plan
+from .heatmap import HeatmapTensor, get_heatmap_tensor
+from .ranking import top_k, rank_matrix
 
 # 기존 코드 호환성을 위한 전체 함수 리스트
 __all__ = [
@@ -22,6 +30,7 @@ __all__ = [
     'prepare_dataframe', 
     'slice_by_seller',
     'safe_divide',
+    'filter_valid_period',
     
     # 변환기들 (transformers)
     'to_datetime_safe',
@@ -31,6 +40,13 @@ __all__ = [
     'load_category_mapping',
     'map_category_code_to_name',
     'apply_category_mapping',
+    'CategoryTree',
+    'CATEGORY_LEVEL_COLUMNS',
+    'get_category_tree',
+    'category_level_column',
+    'apply_category_levels',
+    'derive_columns',
+    'required_columns',
     
     # 분석기들 (analyzers)
     'get_channel_analysis',
@@ -50,9 +66,38 @@ __all__ = [
     'calculate_customer_metrics',
     'calculate_operational_metrics', 
     'calculate_benchmark_metrics',
+    'scope_benchmark_data',
+    'summarize_platform',
     
     # 파이프라인
     'DataPipeline',
     'get_pipeline',
-    'apply_all_transformations'
+    'apply_all_transformations',
+    
+    # 증분 저장소
+    'IncrementalOrderStore',
+    
+    # 캐시
+    'LRUCache',
+    'frame_fingerprint',
+    
+    # 셀러 인덱스
+    'SellerIndex',
+    'get_seller_index',
+    
+    # 집계 큐브
+    'AggregateCube',
+    'get_aggregate_cube',
+    
+    # 질의 API
+    'query',
+    'query_plan',
+    
+    # 히트맵 텐서
+    'HeatmapTensor',
+    'get_heatmap_tensor',
+    
+    # 순위
+    'top_k',
+    'rank_matrix'
 ]
\ No newline at end of file
@@ -11,6 +11,7 @@ from .relative_analyzer import (
     get_relative_channel_analysis,
     get_relative_region_analysis, 
     get_relative_time_analysis,
+    get_relative_heatmap_data,
     get_comprehensive_relative_analysis
 )
 
@@ -55,6 +56,7 @@ __all__ = [
     'get_relative_channel_analysis',
     'get_relative_region_analysis',
     'get_relative_time_analysis', 
+    'get_relative_heatmap_data',
     'get_comprehensive_relative_analysis',
     'get_comprehensive_analysis_with_benchmarks'
 ]
\ No newline at end of file
@@ -2,19 +2,30 @@
 """채널 분석기"""
 
 import pandas as pd
-from constants import COL_CHANNEL, COL_STATUS
+from constants import COL_CHANNEL
+from ..cube import AggregateCube, get_aggregate_cube
 
 def get_channel_analysis(sdf: pd.DataFrame) -> pd.DataFrame:
     """채널별 분석 (상세)"""
     if COL_CHANNEL not in sdf.columns or sdf.empty:
         return pd.DataFrame()
     
-    channel_stats = sdf.groupby(COL_CHANNEL).agg({
-        '__amount__': ['count', 'sum', 'mean'],
-        COL_STATUS: lambda x: (x == '결제취소').mean() if COL_STATUS in sdf.columns else 0
+    return channel_analysis_from_cube(get_aggregate_cube(sdf))
+
+def channel_analysis_from_cube(cube: AggregateCube) -> pd.DataFrame:
+    """채널별 분석 - 집계 큐브 롤업"""
+    if 'channel' not in cube.sources or cube.empty:
+        return pd.DataFrame()
+    
+    totals = cube.rollup(['channel'])
+    channel_stats = pd.DataFrame({
+        'orders': totals['orders'],
+        'revenue': totals['revenue'],
+        'aov': totals['revenue'] / totals['orders'],
+        'cancel_rate': totals['cancels'] / totals['orders'] if 'cancels' in totals.columns else 0,
     }).round(2)
+    channel_stats.index.name = cube.sources['channel']
     
-    channel_stats.columns = ['orders', 'revenue', 'aov', 'cancel_rate']
     channel_stats['revenue_share'] = channel_stats['revenue'] / channel_stats['revenue'].sum()
     
-    return channel_stats.sort_values('revenue', ascending=False)
\ No newline at end of file
+    return channel_stats.sort_values('revenue', ascending=False)
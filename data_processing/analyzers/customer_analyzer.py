@@ -2,21 +2,31 @@
 """고객 행동 분석기"""
 
 import pandas as pd
+from ..cube import AggregateCube, get_aggregate_cube
 
 def get_region_analysis(sdf: pd.DataFrame) -> pd.DataFrame:
     """지역별 분석"""
-    if "__region__" not in sdf.columns:
+    if "__region__" not in sdf.columns or sdf.empty:
         return pd.DataFrame()
     
-    region_data = sdf[sdf["__region__"].notna()]
-    if region_data.empty:
+    return region_analysis_from_cube(get_aggregate_cube(sdf))
+
+def region_analysis_from_cube(cube: AggregateCube) -> pd.DataFrame:
+    """지역별 분석 - 집계 큐브 롤업 (지역이 없는 주문 제외)"""
+    if 'region' not in cube.sources or cube.empty:
+        return pd.DataFrame()
+    
+    totals = cube.rollup(['region'])
+    if totals.empty:
         return pd.DataFrame()
     
-    region_stats = region_data.groupby("__region__").agg({
-        '__amount__': ['count', 'sum', 'mean']
+    region_stats = pd.DataFrame({
+        'orders': totals['orders'],
+        'revenue': totals['revenue'],
+        'aov': totals['revenue'] / totals['orders'],
     }).round(2)
+    region_stats.index.name = "__region__"
     
-    region_stats.columns = ['orders', 'revenue', 'aov']
     region_stats['revenue_share'] = region_stats['revenue'] / region_stats['revenue'].sum()
     
-    return region_stats.sort_values('revenue', ascending=False)
\ No newline at end of file
+    return region_stats.sort_values('revenue', ascending=False)
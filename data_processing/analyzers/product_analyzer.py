@@ -2,45 +2,72 @@
 """상품 분석기"""
 
 import pandas as pd
-from constants import COL_ITEM_NAME, COL_STATUS, COL_CATEGORY
+from typing import Optional
+from constants import COL_ITEM_NAME, COL_STATUS
+from ..transformers.category_tree import get_category_tree, category_level_column
+from ..cube import AggregateCube, get_aggregate_cube
+from ..ranking import top_k
+from ..transformers.status_transformer import status_flag
 
 def get_product_analysis(sdf: pd.DataFrame) -> pd.DataFrame:
     """상품 분석 (상세)"""
     if COL_ITEM_NAME not in sdf.columns or sdf.empty:
         return pd.DataFrame()
     
-    product_stats = sdf.groupby(COL_ITEM_NAME).agg({
-        '__amount__': ['count', 'sum', 'mean'],
-        '__qty__': 'sum',
-        COL_STATUS: lambda x: (x == '결제취소').mean() if COL_STATUS in sdf.columns else 0
+    # 취소율은 상태 플래그의 그룹 평균 (groupby 안의 lambda 없음)
+    grouped = sdf.groupby(COL_ITEM_NAME)
+    product_stats = pd.DataFrame({
+        'orders': grouped['__amount__'].count(),
+        'revenue': grouped['__amount__'].sum(),
+        'aov': grouped['__amount__'].mean(),
+        'quantity': grouped['__qty__'].sum(),
+        'cancel_rate': status_flag(sdf, '결제취소').groupby(sdf[COL_ITEM_NAME]).mean() if COL_STATUS in sdf.columns else 0,
     }).round(2)
     
-    product_stats.columns = ['orders', 'revenue', 'aov', 'quantity', 'cancel_rate']
-    product_stats = product_stats.sort_values('revenue', ascending=False)
     
-    return product_stats.reset_index().head(20)
+    # 매출 상위 20개 (전체 정렬 없이 선택)
+    return top_k(product_stats, 'revenue', 20).reset_index()
 
-def get_category_analysis(sdf: pd.DataFrame) -> pd.DataFrame:
-    """카테고리별 분석 - 매핑된 카테고리 사용"""
-    # 매핑된 카테고리 컬럼 우선 사용
-    category_col = None
-    
-    if '__category_mapped__' in sdf.columns:
-        category_col = '__category_mapped__'
-    elif COL_CATEGORY in sdf.columns:
-        category_col = COL_CATEGORY
-    else:
-        return pd.DataFrame()
+def get_category_analysis(sdf: pd.DataFrame, level: Optional[int] = None) -> pd.DataFrame:
+    """카테고리별 분석 - 매핑된 카테고리 사용 (level 지정 시 해당 깊이로 롤업)"""
+    level_col = category_level_column(level) if level else None
+    tree = get_category_tree() if level_col in sdf.columns else None
+    
+    if tree is None:
+        # 매핑된 카테고리(없으면 원본 카테고리) 기준은 집계 큐브에서 롤업
+        if sdf.empty:
+            return pd.DataFrame()
+        return category_analysis_from_cube(get_aggregate_cube(sdf))
     
-    category_data = sdf[sdf[category_col].notna()]
+    category_data = sdf[sdf[level_col].notna()]
     if category_data.empty:
         return pd.DataFrame()
     
-    category_stats = category_data.groupby(category_col).agg({
+    category_stats = category_data.groupby(level_col, observed=True).agg({
         '__amount__': ['count', 'sum', 'mean']
     }).round(2)
     
     category_stats.columns = ['orders', 'revenue', 'aov']
+    category_stats.index = pd.Index(tree.name_of(category_stats.index), name=level_col)
+    category_stats['revenue_share'] = category_stats['revenue'] / category_stats['revenue'].sum()
+    
+    return category_stats.sort_values('revenue', ascending=False)
+
+def category_analysis_from_cube(cube: AggregateCube) -> pd.DataFrame:
+    """카테고리별 분석 - 집계 큐브 롤업 (카테고리가 없는 주문 제외)"""
+    if 'category' not in cube.sources or cube.empty:
+        return pd.DataFrame()
+    
+    totals = cube.rollup(['category'])
+    if totals.empty:
+        return pd.DataFrame()
+    
+    category_stats = pd.DataFrame({
+        'orders': totals['orders'],
+        'revenue': totals['revenue'],
+        'aov': totals['revenue'] / totals['orders'],
+    }).round(2)
+    category_stats.index.name = cube.sources['category']
     category_stats['revenue_share'] = category_stats['revenue'] / category_stats['revenue'].sum()
     
-    return category_stats.sort_values('revenue', ascending=False)
\ No newline at end of file
+    return category_stats.sort_values('revenue', ascending=False)
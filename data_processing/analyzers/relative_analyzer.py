@@ -1,13 +1,31 @@
 # data_processing/analyzers/relative_analyzer.py
 """상대적 분석기 - 카테고리 평균 대비 성과"""
 
+import numpy as np
 import pandas as pd
-from typing import Dict
+from typing import Dict, Tuple
 from ..metrics.benchmark_calculator import get_benchmark_calculator
-from .channel_analyzer import get_channel_analysis
+from ..cache import LRUCache, frame_fingerprint
+from ..cube import AggregateCube, get_aggregate_cube
+from ..heatmap import get_heatmap_tensor
+from .channel_analyzer import get_channel_analysis, channel_analysis_from_cube
 from .product_analyzer import get_category_analysis
-from .customer_analyzer import get_region_analysis
-from .temporal_analyzer import get_time_analysis
+from .customer_analyzer import get_region_analysis, region_analysis_from_cube
+from .temporal_analyzer import get_time_analysis, get_heatmap_data, time_analysis_from_cube
+
+# 카테고리 대비 비율을 붙이는 지표, 성과 등급 구간 (calculate_relative_performance와 같은 기준)
+_RELATIVE_METRICS = ['orders', 'revenue', 'aov']
+_PERFORMANCE_LEVELS = [(1.2, 'excellent'), (1.1, 'good'), (0.9, 'average')]
+
+# 카테고리 평균 분석 종류 → 큐브 분석 함수
+_CATEGORY_ANALYSES = {
+    'channel': channel_analysis_from_cube,
+    'region': region_analysis_from_cube,
+    'time': time_analysis_from_cube,
+}
+
+# (데이터 지문, 카테고리, 분석 종류) → 카테고리 평균 분석 (셀러 순회 중 밀려나지 않도록 넉넉히)
+_category_tables = LRUCache(max_entries=1024)
 
 def get_relative_channel_analysis(sdf: pd.DataFrame, overall: pd.DataFrame) -> pd.DataFrame:
     """채널별 성과를 카테고리 평균 대비로 분석"""
@@ -22,14 +40,9 @@ def get_relative_channel_analysis(sdf: pd.DataFrame, overall: pd.DataFrame) -> p
     if my_channels.empty:
         return my_channels
     
-    # 카테고리 평균 채널 성과 계산
+    # 카테고리 평균 채널 성과 (카테고리별 캐시)
     try:
-        if '__category_mapped__' in overall.columns:
-            category_data = overall[overall['__category_mapped__'] == my_category]
-        else:
-            category_data = overall
-        
-        category_channels = get_channel_analysis(category_data) if not category_data.empty else pd.DataFrame()
+        category_channels = _category_analysis(overall, my_category, 'channel')
     except Exception as e:
         print(f"⚠️ 카테고리 채널 분석 실패: {e}")
         return my_channels
@@ -37,22 +50,8 @@ def get_relative_channel_analysis(sdf: pd.DataFrame, overall: pd.DataFrame) -> p
     if category_channels.empty:
         return my_channels
     
-    # 상대적 성과 계산
-    relative_channels = my_channels.copy()
-    
-    for channel in relative_channels.index:
-        if channel in category_channels.index:
-            cat_avg = category_channels.loc[channel]
-            
-            # 각 지표별 상대 비율 계산
-            for metric in ['orders', 'revenue', 'aov']:
-                if cat_avg[metric] > 0:
-                    relative_channels.loc[channel, f'{metric}_vs_category'] = \
-                        relative_channels.loc[channel, metric] / cat_avg[metric]
-                else:
-                    relative_channels.loc[channel, f'{metric}_vs_category'] = float('nan')
-    
-    return relative_channels
+    # 상대적 성과 계산 (채널 인덱스 정렬 후 지표별 비율)
+    return _relative_to_category(my_channels, category_channels)
 
 def get_relative_region_analysis(sdf: pd.DataFrame, overall: pd.DataFrame) -> pd.DataFrame:
     """지역별 성과를 카테고리 평균 대비로 분석"""
@@ -67,14 +66,9 @@ def get_relative_region_analysis(sdf: pd.DataFrame, overall: pd.DataFrame) -> pd
     if my_regions.empty:
         return my_regions
     
-    # 카테고리 평균 지역 성과
+    # 카테고리 평균 지역 성과 (카테고리별 캐시)
     try:
-        if '__category_mapped__' in overall.columns:
-            category_data = overall[overall['__category_mapped__'] == my_category]
-        else:
-            category_data = overall
-            
-        category_regions = get_region_analysis(category_data) if not category_data.empty else pd.DataFrame()
+        category_regions = _category_analysis(overall, my_category, 'region')
     except Exception as e:
         print(f"⚠️ 카테고리 지역 분석 실패: {e}")
         return my_regions
@@ -82,21 +76,8 @@ def get_relative_region_analysis(sdf: pd.DataFrame, overall: pd.DataFrame) -> pd
     if category_regions.empty:
         return my_regions
     
-    # 상대적 성과 계산
-    relative_regions = my_regions.copy()
-    
-    for region in relative_regions.index:
-        if region in category_regions.index:
-            cat_avg = category_regions.loc[region]
-            
-            for metric in ['orders', 'revenue', 'aov']:
-                if cat_avg[metric] > 0:
-                    relative_regions.loc[region, f'{metric}_vs_category'] = \
-                        relative_regions.loc[region, metric] / cat_avg[metric]
-                else:
-                    relative_regions.loc[region, f'{metric}_vs_category'] = float('nan')
-    
-    return relative_regions
+    # 상대적 성과 계산 (지역 인덱스 정렬 후 지표별 비율)
+    return _relative_to_category(my_regions, category_regions)
 
 def get_relative_time_analysis(sdf: pd.DataFrame, overall: pd.DataFrame) -> Dict[str, pd.DataFrame]:
     """시간 패턴을 카테고리 평균 대비로 분석"""
@@ -111,14 +92,9 @@ def get_relative_time_analysis(sdf: pd.DataFrame, overall: pd.DataFrame) -> Dict
     if not my_time:
         return my_time
     
-    # 카테고리 평균 시간 패턴
+    # 카테고리 평균 시간 패턴 (카테고리별 캐시)
     try:
-        if '__category_mapped__' in overall.columns:
-            category_data = overall[overall['__category_mapped__'] == my_category]
-        else:
-            category_data = overall
-            
-        category_time = get_time_analysis(category_data) if not category_data.empty else {}
+        category_time = _category_analysis(overall, my_category, 'time')
     except Exception as e:
         print(f"⚠️ 카테고리 시간 분석 실패: {e}")
         return my_time
@@ -143,11 +119,7 @@ def get_relative_time_analysis(sdf: pd.DataFrame, overall: pd.DataFrame) -> Dict
                 
                 if cat_avg_revenue > 0:
                     relative_df['revenue_vs_category'] = relative_df['revenue'] / cat_avg_revenue
-                    relative_df['performance_level'] = relative_df['revenue_vs_category'].apply(
-                        lambda x: 'excellent' if x >= 1.2 else 
-                                 'good' if x >= 1.1 else
-                                 'average' if x >= 0.9 else 'below_average'
-                    )
+                    relative_df['performance_level'] = _performance_level(relative_df['revenue_vs_category'])
                 
                 relative_time[time_type] = relative_df
             else:
@@ -157,10 +129,67 @@ def get_relative_time_analysis(sdf: pd.DataFrame, overall: pd.DataFrame) -> Dict
     
     return relative_time
 
+def get_relative_heatmap_data(sdf: pd.DataFrame, overall: pd.DataFrame) -> Tuple:
+    """요일×시간 매출 비중을 카테고리 비중 대비로 (카테고리 매출이 없는 칸은 NaN)"""
+    calculator = get_benchmark_calculator()
+    my_category = calculator.get_my_category(sdf)
+    
+    heat_arr, xlabels, ylabels = get_heatmap_data(sdf)
+    if my_category is None or heat_arr is None:
+        return heat_arr, xlabels, ylabels
+    
+    # 카테고리 패턴은 전체 데이터 히트맵 텐서의 셀러 평균 (내 히트맵과 같은 규모)
+    category_arr = get_heatmap_tensor(overall).category_mean(my_category)
+    my_total, category_total = heat_arr.sum(), category_arr.sum()
+    if my_total <= 0 or category_total <= 0:
+        return heat_arr, xlabels, ylabels
+    
+    category_share = np.where(category_arr > 0, category_arr / category_total, np.nan)
+    return (heat_arr / my_total) / category_share, xlabels, ylabels
+
 def get_comprehensive_relative_analysis(sdf: pd.DataFrame, overall: pd.DataFrame) -> Dict[str, pd.DataFrame]:
     """종합적인 상대 분석"""
     return {
         'relative_channel_analysis': get_relative_channel_analysis(sdf, overall),
         'relative_region_analysis': get_relative_region_analysis(sdf, overall),
         'relative_time_analysis': get_relative_time_analysis(sdf, overall)
-    }
\ No newline at end of file
+    }
+
+def _category_analysis(overall: pd.DataFrame, category, kind: str):
+    """카테고리 평균 채널/지역/시간 분석 (데이터셋 + 카테고리별 캐시, 셀러가 달라도 재사용)"""
+    cache_key = (frame_fingerprint(overall), str(category), kind)
+    result = _category_tables.get(cache_key)
+    if result is None:
+        category_cube = _category_cube(overall, category)
+        if category_cube.empty:
+            result = {} if kind == 'time' else pd.DataFrame()
+        else:
+            result = _CATEGORY_ANALYSES[kind](category_cube)
+        _category_tables.put(cache_key, result)
+    return result
+
+def _relative_to_category(mine: pd.DataFrame, category: pd.DataFrame) -> pd.DataFrame:
+    """카테고리 같은 항목 대비 지표 비율 칼럼 추가 (카테고리에 없는 항목, 카테고리 값이 0 이하면 NaN)"""
+    relative = mine.copy()
+    if not mine.index.isin(category.index).any():
+        return relative
+    
+    aligned = category.reindex(mine.index)
+    for metric in _RELATIVE_METRICS:
+        benchmark = aligned[metric].astype(float)
+        relative[f'{metric}_vs_category'] = relative[metric] / benchmark.where(benchmark > 0)
+    return relative
+
+def _performance_level(ratio: pd.Series) -> pd.Series:
+    """카테고리 대비 비율 → 성과 등급 (비율이 없으면 below_average)"""
+    values = ratio.to_numpy(dtype=float)
+    conditions = [values >= threshold for threshold, _ in _PERFORMANCE_LEVELS]
+    levels = np.select(conditions, [level for _, level in _PERFORMANCE_LEVELS], default='below_average')
+    return pd.Series(levels, index=ratio.index)
+
+def _category_cube(overall: pd.DataFrame, category) -> AggregateCube:
+    """전체 데이터 큐브에서 카테고리 셀만 선택 (매핑된 카테고리가 없으면 전체)"""
+    cube = get_aggregate_cube(overall)
+    if cube.sources.get('category') == '__category_mapped__':
+        cube = cube.slice(category=category)
+    return cube
\ No newline at end of file
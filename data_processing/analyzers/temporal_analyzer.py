@@ -2,67 +2,61 @@
 """시간 패턴 분석기"""
 
 import pandas as pd
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
+from ..cube import AggregateCube, get_aggregate_cube
+from ..heatmap import HEATMAP_HOURS, HEATMAP_WEEKDAYS, get_seller_heatmap
 
 def get_time_analysis(sdf: pd.DataFrame) -> Dict[str, pd.DataFrame]:
     """시간 분석 (시간대별, 요일별, 일별)"""
     if sdf.empty:
         return {}
     
+    return time_analysis_from_cube(get_aggregate_cube(sdf))
+
+def time_analysis_from_cube(cube: AggregateCube) -> Dict[str, pd.DataFrame]:
+    """시간 분석 - 집계 큐브의 일자/시간 롤업"""
+    if cube.empty:
+        return {}
+    
     result = {}
     
     # 일별 트렌드
-    daily = sdf.groupby(sdf["__dt__"].dt.date).agg({
-        '__amount__': ['sum', 'count', 'mean']
-    }).round(2)
-    daily.columns = ['revenue', 'orders', 'aov']
+    daily = _time_totals(cube, 'day', ['revenue', 'orders', 'aov'])
     result['daily'] = daily.reset_index()
     
     # 시간대별 분포
-    hourly = sdf.groupby(sdf["__dt__"].dt.hour).agg({
-        '__amount__': ['sum', 'count']
-    }).round(2)
-    hourly.columns = ['revenue', 'orders']
+    hourly = _time_totals(cube, 'hour', ['revenue', 'orders'])
     result['hourly'] = hourly.reset_index()
     
     # 요일별 분포
-    weekly = sdf.groupby(sdf["__dt__"].dt.day_name()).agg({
-        '__amount__': ['sum', 'count']
-    }).round(2)
-    weekly.columns = ['revenue', 'orders']
+    weekly = _time_totals(cube, 'day_name', ['revenue', 'orders'])
     result['weekly'] = weekly.reset_index()
     
     return result
 
+def _time_totals(cube: AggregateCube, dim: str, columns: List[str]) -> pd.DataFrame:
+    """시간 차원별 매출/주문수(/AOV), 인덱스명은 결제일 칼럼"""
+    totals = cube.rollup([dim])
+    stats = pd.DataFrame({
+        'revenue': totals['revenue'],
+        'orders': totals['orders'],
+        'aov': totals['revenue'] / totals['orders'],
+    })[columns].round(2)
+    stats.index.name = "__dt__"
+    return stats
+
 def get_daily_trend(sdf: pd.DataFrame) -> pd.DataFrame:
     """일자별 추이 (기존 호환성)"""
     time_analysis = get_time_analysis(sdf)
     return time_analysis.get('daily', pd.DataFrame())
 
 def get_heatmap_data(sdf: pd.DataFrame) -> Tuple:
-    """히트맵 데이터 (기존 호환성)"""
+    """히트맵 데이터 (기존 호환성) - 요일(월~일) × 시간(0~23시) 매출, 전체 데이터 히트맵 텐서에서 조회"""
     if sdf.empty:
         return None, None, None
     
     try:
-        sdf_copy = sdf.copy()
-        sdf_copy["__hour__"] = sdf_copy["__dt__"].dt.hour
-        sdf_copy["__dow__"] = sdf_copy["__dt__"].dt.weekday
-        
-        heat = sdf_copy.pivot_table(
-            index="__dow__", columns="__hour__", 
-            values="__amount__", aggfunc="sum", fill_value=0.0
-        )
-        
-        for h in range(24):
-            if h not in heat.columns:
-                heat[h] = 0.0
-        
-        heat = heat[sorted(heat.columns)]
-        heat_arr = heat.reindex(range(0,7)).fillna(0.0).values
-        xlabels = [str(h) for h in sorted(heat.columns)]
-        ylabels = ["Mon","Tue","Wed","Thu","Fri","Sat","Sun"]
-        
-        return heat_arr, xlabels, ylabels
+        heat_arr = get_seller_heatmap(sdf)
+        return heat_arr, list(HEATMAP_HOURS), list(HEATMAP_WEEKDAYS)
     except Exception:
-        return None, None, None
\ No newline at end of file
+        return None, None, None
@@ -0,0 +1,188 @@
+# data_processing/cache.py
+"""분석 결과 캐시 - 데이터 내용 지문(fingerprint) 키 LRU 메모리 캐시 + 실행 간 디스크 캐시"""
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+import weakref
+import pandas as pd
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence
+from constants import COL_SELLER, COL_ORDER_ID, COL_ITEM_ORDER_ID, COL_STATUS
+
+# 지문 계산에 사용하는 칼럼 (있는 것만)
+FINGERPRINT_COLUMNS = ["__dt__", "__amount__", COL_SELLER, COL_ORDER_ID, COL_ITEM_ORDER_ID, COL_STATUS]
+
+class FrameMemo:
+    """프레임 객체별 계산 결과 메모 - 객체가 사라지면 자동 제거, 형태/칼럼이 바뀌면 무효
+
+    값을 제자리에서 바꾸는 경우는 감지하지 않음
+    """
+
+    def __init__(self):
+        self._items = {}   # (id, key) -> (약한 참조, 형태, 값)
+
+    def get(self, df: pd.DataFrame, key=None):
+        entry = self._items.get((id(df), key))
+        if entry is not None and entry[0]() is df and entry[1] == _frame_layout(df):
+            return entry[2]
+        return None
+
+    def put(self, df: pd.DataFrame, value, key=None) -> None:
+        memo_key = (id(df), key)
+        items = self._items
+        ref = weakref.ref(df, lambda _: items.pop(memo_key, None))
+        items[memo_key] = (ref, _frame_layout(df), value)
+
+def _frame_layout(df: pd.DataFrame) -> tuple:
+    return df.shape, tuple(df.columns)
+
+# 같은 프레임 객체의 지문 재계산 방지
+_fingerprint_memo = FrameMemo()
+
+def frame_fingerprint(df: pd.DataFrame, columns: Optional[Sequence[str]] = None) -> str:
+    """데이터프레임 내용 지문 (형태 + 칼럼 목록 + 핵심 칼럼 행 해시, 같은 객체는 재사용)"""
+    memo_key = tuple(columns) if columns is not None else None
+    fingerprint = _fingerprint_memo.get(df, memo_key)
+    if fingerprint is not None:
+        return fingerprint
+
+    columns = FINGERPRINT_COLUMNS if columns is None else columns
+    key_cols = [col for col in columns if col in df.columns]
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((df.shape, list(df.columns))).encode("utf-8"))
+    if len(df) > 0:
+        digest.update(pd.util.hash_pandas_object(df.index).to_numpy().tobytes())
+        if key_cols:
+            digest.update(pd.util.hash_pandas_object(df[key_cols], index=False).to_numpy().tobytes())
+    fingerprint = digest.hexdigest()
+
+    _fingerprint_memo.put(df, fingerprint, memo_key)
+    return fingerprint
+
+def estimate_size(obj: Any) -> int:
+    """캐시 항목의 대략적인 메모리 크기 (bytes)"""
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=True, deep=False).sum())
+    if isinstance(obj, pd.Series):
+        return int(obj.memory_usage(index=True, deep=False))
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(estimate_size(k) + estimate_size(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(estimate_size(v) for v in obj)
+    return sys.getsizeof(obj)
+
+class LRUCache:
+    """항목 수 / 바이트 예산을 넘으면 가장 오래 안 쓴 항목부터 제거하는 캐시"""
+
+    def __init__(self, max_entries: Optional[int] = 128, max_bytes: Optional[int] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._items = OrderedDict()   # key -> (value, size)
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key) -> bool:
+        return key in self._items
+
+    def get(self, key, default=None):
+        """조회 (적중 시 최근 사용으로 갱신)"""
+        if key in self._items:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return self._items[key][0]
+        self.misses += 1
+        return default
+
+    def put(self, key, value) -> None:
+        """저장 후 예산 초과분 제거"""
+        if key in self._items:
+            self.total_bytes -= self._items.pop(key)[1]
+        size = estimate_size(value) if self.max_bytes is not None else 0
+        self._items[key] = (value, size)
+        self.total_bytes += size
+        self._evict()
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """적중/실패/제거 카운터와 현재 사용량"""
+        return {
+            'entries': len(self._items),
+            'bytes': self.total_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    def _evict(self) -> None:
+        # 방금 넣은 항목 하나는 예산을 넘어도 유지
+        while len(self._items) > 1 and (
+            (self.max_entries is not None and len(self._items) > self.max_entries)
+            or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            _, (_, size) = self._items.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+
+class PersistentResultCache:
+    """실행 간에 유지되는 결과 캐시 - 키별 pickle 파일로 저장"""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def make_key(**parts) -> str:
+        """키 구성요소(데이터 지문, 셀러, 기간, 코드 버전 등)로 캐시 키 생성"""
+        payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """저장된 결과 로드 (없거나 읽기 실패 시 None)"""
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"⚠️ 결과 캐시 로드 실패, 다시 계산합니다: {e}")
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """결과 저장 (실패해도 무시)"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"⚠️ 결과 캐시 저장 실패: {e}")
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+def source_fingerprint(paths: Iterable[str]) -> str:
+    """소스 코드 내용 지문 (코드가 바뀌면 결과 캐시 무효화용)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for root in paths:
+        root = Path(root)
+        files = sorted(root.rglob("*.py")) if root.is_dir() else [root]
+        for path in files:
+            if path.is_file():
+                digest.update(path.name.encode("utf-8"))
+                digest.update(path.read_bytes())
+    return digest.hexdigest()
@@ -0,0 +1,220 @@
+# data_processing/cube.py
+"""집계 큐브 - (셀러, 카테고리, 채널, 지역, 일자, 시간) 단위로 한 번 사전 집계하고 분석기는 롤업으로 응답"""
+
+import weakref
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+from constants import COL_SELLER, COL_CHANNEL, COL_CATEGORY, COL_STATUS
+from .cache import LRUCache, FrameMemo, frame_fingerprint
+from .transformers.status_transformer import status_flag
+
+# 큐브 차원 → 원본 칼럼 후보 (앞에서부터 있는 칼럼 사용)
+CUBE_DIMENSIONS = {
+    'seller': [COL_SELLER],
+    'category': ['__category_mapped__', COL_CATEGORY],
+    'channel': [COL_CHANNEL],
+    'region': ['__region__'],
+}
+
+# 셀 측정값 (건수/매출/수량/결제취소 건수)
+CUBE_MEASURES = ['orders', 'revenue', 'qty', 'cancels']
+
+# 일자 차원에서 파생되는 시간 차원 (고유 일자에만 적용)
+_TIME_DIMENSIONS = {
+    'day': lambda dates: dates.date,
+    'day_name': lambda dates: dates.day_name(),
+    'month': lambda dates: dates.to_period('M'),
+    'week': lambda dates: dates.to_period('W'),
+}
+
+# 데이터 지문 → 큐브 (내용이 같은 사본 공유), 프레임 객체 → 큐브
+_cube_cache = LRUCache(max_entries=8)
+_frame_cubes = FrameMemo()
+
+# 슬라이스 프레임 → (원본 프레임 약한 참조, 차원 필터)
+_slice_lineage = FrameMemo()
+
+class AggregateCube:
+    """사전 집계 큐브 - 셀 테이블(범주형 차원 + 측정값 합계) + 셀별 고유 고객 쌍
+
+    슬라이스는 셀 테이블의 부분집합이고 차원 값 목록과 고객 쌍은 원본 큐브와 공유
+    """
+
+    def __init__(self, cells: pd.DataFrame, customers: Optional[pd.DataFrame], sources: Dict[str, str],
+                 levels: Dict[str, pd.Index], date_maps: Dict[str, np.ndarray], n_cells: Optional[int] = None):
+        self.cells = cells            # 셀당 한 행 (index = 셀 ID)
+        self.customers = customers    # (cell, customer) 고유 쌍, 고객 ID 칼럼이 없으면 None
+        self.sources = sources        # 차원 → 원본 칼럼명
+        self.levels = levels          # 차원 → 롤업 인덱스 값 (차원 코드 순)
+        self.date_maps = date_maps    # 파생 시간 차원 → 일자 코드별 차원 코드
+        self.n_cells = len(cells) if n_cells is None else n_cells   # 원본 큐브 셀 수 (셀 ID 범위)
+        self._slices = LRUCache(max_entries=32)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'AggregateCube':
+        """원본 행에서 큐브 생성 (차원 코드 groupby 1회)"""
+        sources = {}
+        for dim, candidates in CUBE_DIMENSIONS.items():
+            col = next((col for col in candidates if col in df.columns), None)
+            if col is not None:
+                sources[dim] = col
+
+        keys = {dim: df[col] for dim, col in sources.items()}
+        keys['date'] = df["__dt__"].dt.normalize()
+        keys['hour'] = df["__dt__"].dt.hour
+
+        # 차원별 코드 (값이 비어 있으면 -1, 셀로는 유지하고 롤업 시 제외)
+        codes, dtypes, levels = {}, {}, {}
+        for dim, key in keys.items():
+            if isinstance(key.dtype, pd.CategoricalDtype):
+                codes[dim] = key.cat.codes.to_numpy()
+                dtypes[dim] = key.dtype
+                levels[dim] = pd.CategoricalIndex(key.cat.categories, dtype=key.dtype)
+            else:
+                codes[dim], uniques = pd.factorize(key, sort=True)
+                dtypes[dim] = pd.CategoricalDtype(uniques)
+                levels[dim] = pd.Index(uniques)
+
+        cell_ids = pd.DataFrame(codes).groupby(list(codes), sort=False).ngroup().to_numpy()
+        _, first = np.unique(cell_ids, return_index=True)
+        cells = pd.DataFrame({dim: pd.Categorical.from_codes(codes[dim][first], dtype=dtypes[dim])
+                              for dim in keys})
+
+        measures = pd.DataFrame({
+            'orders': df["__amount__"].notna().to_numpy(),
+            'revenue': df["__amount__"].to_numpy(),
+        })
+        if "__qty__" in df.columns:
+            measures['qty'] = df["__qty__"].to_numpy()
+        if COL_STATUS in df.columns:
+            measures['cancels'] = status_flag(df, '결제취소').to_numpy()
+        cells = cells.join(measures.groupby(cell_ids).sum())
+
+        customers = None
+        if "__customer_id__" in df.columns:
+            customer_codes, _ = pd.factorize(df["__customer_id__"])
+            known = customer_codes >= 0
+            customers = pd.DataFrame({'cell': cell_ids[known], 'customer': customer_codes[known]}).drop_duplicates()
+
+        # 파생 시간 차원은 고유 일자에서만 계산
+        date_maps = {}
+        for dim, derive in _TIME_DIMENSIONS.items():
+            date_maps[dim], uniques = pd.factorize(derive(pd.DatetimeIndex(levels['date'])), sort=True)
+            levels[dim] = pd.Index(uniques)
+
+        return cls(cells, customers, sources, levels, date_maps)
+
+    @property
+    def empty(self) -> bool:
+        return self.cells.empty
+
+    def slice(self, **filters) -> 'AggregateCube':
+        """차원 값으로 셀 선택 (예: slice(seller='A', category='B'), 값은 문자열로 비교)"""
+        slice_key = tuple(sorted((dim, str(value)) for dim, value in filters.items()))
+        cube = self._slices.get(slice_key)
+        if cube is None:
+            mask = np.ones(len(self.cells), dtype=bool)
+            for dim, value in slice_key:
+                matches = np.flatnonzero(self.levels[dim].astype(str) == value)
+                mask &= np.isin(self.cells[dim].cat.codes.to_numpy(), matches)
+            cube = self.select(mask)
+            self._slices.put(slice_key, cube)
+        return cube
+
+    def select(self, mask: np.ndarray) -> 'AggregateCube':
+        """셀 마스크로 부분 큐브 생성"""
+        return AggregateCube(self.cells[mask], self.customers, self.sources,
+                             self.levels, self.date_maps, self.n_cells)
+
+    def rollup(self, dims: List[str]) -> pd.DataFrame:
+        """차원별 측정값 합계 (차원 값이 비어 있는 셀은 제외, 차원 값 순 정렬, dims가 비면 전체 합계 한 행)"""
+        inverse, index, valid = self._group(dims, [self.codes(dim) for dim in dims], len(self.cells))
+
+        totals = {}
+        for measure in CUBE_MEASURES:
+            if measure not in self.cells.columns:
+                continue
+            values = self.cells[measure].to_numpy()
+            sums = np.bincount(inverse, weights=values[valid], minlength=len(index))
+            totals[measure] = sums.astype(values.dtype) if np.issubdtype(values.dtype, np.integer) else sums
+        return pd.DataFrame(totals, index=index)
+
+    def distinct_customers(self, dims: List[str]) -> Optional[pd.Series]:
+        """차원별 고유 고객 수 (셀별 고객 집합의 합집합 크기, 고객 ID가 없으면 None)"""
+        if self.customers is None:
+            return None
+
+        # 셀 ID → 이 큐브 안의 위치 (슬라이스에 없는 셀의 고객 쌍은 제외)
+        positions = np.full(self.n_cells, -1, dtype='int64')
+        positions[self.cells.index.to_numpy()] = np.arange(len(self.cells))
+        pair_positions = positions[self.customers['cell'].to_numpy()]
+        in_cube = pair_positions >= 0
+
+        pair_codes = [self.codes(dim)[pair_positions[in_cube]] for dim in dims]
+        inverse, index, valid = self._group(dims, pair_codes, int(in_cube.sum()))
+        customers = self.customers['customer'].to_numpy()[in_cube][valid]
+
+        unique_pairs = pd.DataFrame({'group': inverse, 'customer': customers}).drop_duplicates()
+        counts = np.bincount(unique_pairs['group'].to_numpy(), minlength=len(index))
+        return pd.Series(counts, index=index)
+
+    def codes(self, dim: str) -> np.ndarray:
+        """셀별 차원 코드 (levels[dim] 위치, 값이 없으면 -1)"""
+        if dim in self.date_maps:
+            date_codes = self.cells['date'].cat.codes.to_numpy()
+            return np.where(date_codes >= 0, self.date_maps[dim][date_codes], -1)
+        return self.cells[dim].cat.codes.to_numpy()
+
+    def _group(self, dims: List[str], codes: List[np.ndarray], n: int) -> Tuple[np.ndarray, pd.Index, np.ndarray]:
+        """차원 코드 조합별 그룹 번호, 그룹 인덱스(차원 값 순), 유효 행 마스크 (차원이 없으면 전체 한 그룹)"""
+        if not dims:
+            return np.zeros(n, dtype='int64'), pd.RangeIndex(1 if n else 0), np.ones(n, dtype=bool)
+
+        levels = [self.levels[dim] for dim in dims]
+        valid = np.logical_and.reduce([c >= 0 for c in codes])
+        shape = [len(level) for level in levels]
+        group_ids, inverse = np.unique(np.ravel_multi_index([c[valid] for c in codes], shape),
+                                       return_inverse=True)
+
+        positions = np.unravel_index(group_ids, shape)
+        arrays = [level.take(pos) for level, pos in zip(levels, positions)]
+        if len(arrays) == 1:
+            index = arrays[0].rename(dims[0])
+        else:
+            index = pd.MultiIndex.from_arrays(arrays, names=list(dims))
+        return inverse, index, valid
+
+def get_aggregate_cube(df: pd.DataFrame) -> AggregateCube:
+    """프레임의 집계 큐브 (같은 객체/내용이면 재사용, 셀러 슬라이스는 원본 큐브에서 잘라냄)"""
+    cube = _frame_cubes.get(df)
+    if cube is None:
+        cube = _cube_from_lineage(df)
+        if cube is None:
+            cache_key = frame_fingerprint(df)
+            cube = _cube_cache.get(cache_key)
+            if cube is None:
+                cube = AggregateCube.from_frame(df)
+                _cube_cache.put(cache_key, cube)
+        _frame_cubes.put(df, cube)
+    return cube
+
+def register_slice(parent: pd.DataFrame, child: pd.DataFrame, **filters) -> None:
+    """child가 parent의 차원 필터 결과임을 기록 (child 큐브를 parent 큐브에서 잘라내기 위함)"""
+    _slice_lineage.put(child, (weakref.ref(parent), filters))
+
+def get_slice_source(df: pd.DataFrame) -> Optional[Tuple[pd.DataFrame, Dict[str, str]]]:
+    """register_slice로 기록된 (원본 프레임, 차원 필터) - 기록이 없거나 원본이 사라졌으면 None"""
+    lineage = _slice_lineage.get(df)
+    if lineage is None:
+        return None
+    parent = lineage[0]()
+    if parent is None:
+        return None
+    return parent, lineage[1]
+
+def _cube_from_lineage(df: pd.DataFrame) -> Optional[AggregateCube]:
+    source = get_slice_source(df)
+    if source is None:
+        return None
+    return get_aggregate_cube(source[0]).slice(**source[1])
@@ -0,0 +1,103 @@
+# data_processing/heatmap.py
+"""요일×시간 히트맵 텐서 - 전체 데이터 bincount 한 번으로 (셀러/카테고리 × 요일 × 시간) 매출을 만들고 히트맵은 조회"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional
+from constants import COL_SELLER, COL_CATEGORY
+from .cache import FrameMemo
+from .cube import get_slice_source
+
+# 히트맵 축 라벨 (행: 요일 월~일, 열: 0~23시)
+HEATMAP_WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+HEATMAP_HOURS = [str(h) for h in range(24)]
+
+_SLOTS = len(HEATMAP_WEEKDAYS) * len(HEATMAP_HOURS)
+
+# 프레임별 히트맵 텐서
+_heatmap_memo = FrameMemo()
+
+class HeatmapTensor:
+    """전체/(셀러 × 요일 × 시간)/(카테고리 × 요일 × 시간) 매출 합계 텐서
+
+    결제일이 없는 행은 제외, 매출이 비어 있으면 0으로 합산 (pivot_table 합계와 동일)
+    카테고리별 주문이 있는 셀러 수를 함께 보관해 셀러 한 명과 같은 규모의 카테고리 평균 제공
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        dt = df["__dt__"]
+        slots = (dt.dt.weekday * 24 + dt.dt.hour).fillna(-1).to_numpy(dtype='int64')
+        amount = df["__amount__"].fillna(0).to_numpy(dtype=float)
+        known = slots >= 0
+
+        self.total = self._bincount(np.zeros(len(df), dtype='int64'), 1, slots, amount, known)[0]
+
+        self._sellers: Dict[str, int] = {}
+        self.by_seller = np.zeros((0, 7, 24))
+        seller_codes = None
+        if COL_SELLER in df.columns:
+            seller_codes, uniques = pd.factorize(df[COL_SELLER].astype(str))
+            self._sellers = {seller: i for i, seller in enumerate(uniques)}
+            self.by_seller = self._bincount(seller_codes, len(uniques), slots, amount, known)
+
+        self._categories: Dict[str, int] = {}
+        self.by_category = np.zeros((0, 7, 24))
+        self.category_sellers = np.zeros(0, dtype='int64')
+        category_col = next((col for col in ['__category_mapped__', COL_CATEGORY] if col in df.columns), None)
+        if category_col is not None:
+            codes, uniques = pd.factorize(df[category_col].astype(str).where(df[category_col].notna()))
+            self._categories = {category: i for i, category in enumerate(uniques)}
+            self.by_category = self._bincount(codes, len(uniques), slots, amount, known)
+            self.category_sellers = self._count_sellers(codes, len(uniques), seller_codes, known)
+
+    @staticmethod
+    def _bincount(codes: np.ndarray, n: int, slots: np.ndarray, amount: np.ndarray,
+                  known: np.ndarray) -> np.ndarray:
+        """그룹 코드 × 168 슬롯 bincount → (n, 7, 24)"""
+        valid = known & (codes >= 0)
+        flat = codes[valid] * _SLOTS + slots[valid]
+        return np.bincount(flat, weights=amount[valid], minlength=n * _SLOTS).reshape(n, 7, 24)
+
+    @staticmethod
+    def _count_sellers(codes: np.ndarray, n: int, seller_codes: Optional[np.ndarray],
+                       known: np.ndarray) -> np.ndarray:
+        """그룹별 주문이 있는 셀러 수 (셀러 칼럼이 없으면 데이터 전체를 한 셀러로)"""
+        valid = known & (codes >= 0)
+        if seller_codes is None:
+            return (np.bincount(codes[valid], minlength=n) > 0).astype('int64')
+        valid &= seller_codes >= 0
+        n_sellers = int(seller_codes.max()) + 1 if len(seller_codes) else 0
+        pairs = np.unique(codes[valid] * n_sellers + seller_codes[valid])
+        return np.bincount(pairs // max(n_sellers, 1), minlength=n)
+
+    def seller(self, seller) -> np.ndarray:
+        """셀러 히트맵 (7 × 24, 없는 셀러면 0)"""
+        position = self._sellers.get(str(seller))
+        return self.by_seller[position].copy() if position is not None else np.zeros((7, 24))
+
+    def category(self, category) -> np.ndarray:
+        """카테고리 전체 히트맵 (7 × 24, 없는 카테고리면 0)"""
+        position = self._categories.get(str(category))
+        return self.by_category[position].copy() if position is not None else np.zeros((7, 24))
+
+    def category_mean(self, category) -> np.ndarray:
+        """카테고리 셀러 평균 히트맵 (합계 / 주문이 있는 셀러 수, 셀러 히트맵과 같은 규모)"""
+        position = self._categories.get(str(category))
+        if position is None or self.category_sellers[position] == 0:
+            return np.zeros((7, 24))
+        return self.by_category[position] / self.category_sellers[position]
+
+def get_heatmap_tensor(df: pd.DataFrame) -> HeatmapTensor:
+    """프레임의 히트맵 텐서 (같은 프레임 객체면 재사용)"""
+    tensor = _heatmap_memo.get(df)
+    if tensor is None:
+        tensor = HeatmapTensor(df)
+        _heatmap_memo.put(df, tensor)
+    return tensor
+
+def get_seller_heatmap(sdf: pd.DataFrame) -> np.ndarray:
+    """셀러 데이터의 요일×시간 매출 (셀러 슬라이스면 원본 데이터 텐서에서 조회, 아니면 데이터 전체)"""
+    source = get_slice_source(sdf)
+    if source is not None and list(source[1]) == ['seller']:
+        return get_heatmap_tensor(source[0]).seller(source[1]['seller'])
+    return get_heatmap_tensor(sdf).total.copy()
@@ -9,6 +9,13 @@ from .sales_metrics import calculate_sales_metrics
 from .customer_metrics import calculate_customer_metrics
 from .operational_metrics import calculate_operational_metrics
 from .benchmark_metrics import calculate_benchmark_metrics
+from .benchmark_scope import scope_benchmark_data, summarize_platform
+from .benchmark_table import build_benchmark_table
+from .sales_metrics import calculate_grouped_sales_metrics
+from .customer_metrics import calculate_grouped_customer_metrics
+from .operational_metrics import calculate_grouped_operational_metrics, ship_lead_days, delivery_days
+from .grouped_metrics import calculate_grouped_kpis, metrics_row_to_dict
+from .main_category import build_main_category_table, get_main_category_table, get_seller_main_category
 
 def calculate_comprehensive_kpis(sdf: pd.DataFrame, overall: pd.DataFrame) -> Dict[str, Any]:
     """종합 KPI 계산 - 확장된 벤치마킹 포함"""
@@ -78,5 +85,18 @@ __all__ = [
     'calculate_sales_metrics',
     'calculate_customer_metrics', 
     'calculate_operational_metrics',
-    'calculate_benchmark_metrics'
+    'calculate_benchmark_metrics',
+    'scope_benchmark_data',
+    'summarize_platform',
+    'build_benchmark_table',
+    'calculate_grouped_kpis',
+    'calculate_grouped_sales_metrics',
+    'calculate_grouped_customer_metrics',
+    'calculate_grouped_operational_metrics',
+    'metrics_row_to_dict',
+    'build_main_category_table',
+    'get_main_category_table',
+    'get_seller_main_category',
+    'ship_lead_days',
+    'delivery_days'
 ]
\ No newline at end of file
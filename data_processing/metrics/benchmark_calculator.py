@@ -1,99 +1,95 @@
 # data_processing/metrics/benchmark_calculator.py
 """카테고리별 벤치마크 계산기"""
 
+import numpy as np
 import pandas as pd
 from typing import Dict, Optional
-from constants import COL_SELLER, COL_CATEGORY
-from .sales_metrics import calculate_sales_metrics
-from .customer_metrics import calculate_customer_metrics
-from .operational_metrics import calculate_operational_metrics
+from constants import COL_CATEGORY
+from ..transformers.category_tree import get_category_tree, category_level_column
+from ..cache import LRUCache, frame_fingerprint
+from .benchmark_table import build_benchmark_table
+from .grouped_metrics import metrics_row_to_dict
+from .main_category import get_seller_main_category
+
+# 카테고리 정보가 없을 때 전체 데이터를 한 그룹으로 묶는 키 이름
+_ALL_CATEGORIES = "__all__"
 
 class CategoryBenchmarkCalculator:
     """카테고리별 벤치마크 계산기"""
     
     def __init__(self):
-        self.benchmark_cache = {}
+        # 데이터셋(내용 지문) + 깊이별 전 카테고리 벤치마크 테이블
+        self.benchmark_cache = LRUCache(max_entries=8)
     
-    def calculate_category_benchmarks(self, overall_data: pd.DataFrame, target_category: str) -> Dict[str, float]:
-        """특정 카테고리의 평균 벤치마크 계산"""
-        
-        # 캐시 확인
-        cache_key = f"{target_category}_{len(overall_data)}"
-        if cache_key in self.benchmark_cache:
-            return self.benchmark_cache[cache_key]
-        
-        # 해당 카테고리 데이터만 필터링
-        if '__category_mapped__' in overall_data.columns:
-            category_data = overall_data[overall_data['__category_mapped__'] == target_category]
-        elif COL_CATEGORY in overall_data.columns:
-            category_data = overall_data[overall_data[COL_CATEGORY] == target_category]
-        else:
+    def calculate_category_benchmarks(self, overall_data: pd.DataFrame, target_category: str,
+                                      level: Optional[int] = None) -> Dict[str, float]:
+        """특정 카테고리의 평균 벤치마크 계산 (level 지정 시 해당 깊이 카테고리 기준)
+        
+        데이터셋마다 한 번 만든 전 카테고리 벤치마크 테이블에서 조회
+        """
+        table, category_name = self.get_benchmark_table(overall_data, level), target_category
+        
+        if level and category_level_column(level) in overall_data.columns:
+            tree = get_category_tree()
+            node_ids = tree.find(target_category) if tree is not None else []
+            category_name = tree.name_of(node_ids[:1])[0] if node_ids else None
+        elif table.index.name == _ALL_CATEGORIES:
             # 카테고리 정보가 없으면 전체 데이터 사용
-            category_data = overall_data.copy()
+            category_name = table.index[0] if len(table) else None
         
-        if category_data.empty:
+        if category_name is None or category_name not in table.index:
             return {}
         
-        # 카테고리 내 셀러들의 평균 성과 계산
-        seller_performances = []
-        
-        if COL_SELLER in category_data.columns:
-            for seller in category_data[COL_SELLER].unique():
-                seller_data = category_data[category_data[COL_SELLER] == seller]
-                if len(seller_data) >= 10:  # 최소 10건 이상인 셀러만
-                    seller_metrics = self._calculate_seller_metrics(seller_data)
-                    seller_performances.append(seller_metrics)
-        
-        if not seller_performances:
-            # 셀러별 분리가 안되면 전체 카테고리 데이터로 계산
-            benchmarks = self._calculate_seller_metrics(category_data)
-        else:
-            # 여러 셀러의 평균값 계산
-            benchmarks = self._average_seller_performances(seller_performances)
-        
-        # 캐시에 저장
-        self.benchmark_cache[cache_key] = benchmarks
-        return benchmarks
+        return metrics_row_to_dict(table.loc[category_name])
     
-    def _calculate_seller_metrics(self, seller_data: pd.DataFrame) -> Dict[str, float]:
-        """개별 셀러의 모든 지표 계산"""
-        metrics = {}
-        
-        # Sales Metrics
-        sales = calculate_sales_metrics(seller_data)
-        metrics.update(sales)
-        
-        # Customer Metrics  
-        customer = calculate_customer_metrics(seller_data)
-        metrics.update(customer)
-        
-        # Operational Metrics
-        operational = calculate_operational_metrics(seller_data)
-        metrics.update(operational)
-        
-        return metrics
+    def get_benchmark_table(self, overall_data: pd.DataFrame, level: Optional[int] = None) -> pd.DataFrame:
+        """전 카테고리 벤치마크 테이블 (카테고리당 한 행, 캐시)"""
+        cache_key = f"{frame_fingerprint(overall_data)}_{level}"
+        table = self.benchmark_cache.get(cache_key)
+        if table is None:
+            table = build_benchmark_table(overall_data, self._category_key(overall_data, level))
+            self.benchmark_cache.put(cache_key, table)
+        return table
     
-    def _average_seller_performances(self, performances: list) -> Dict[str, float]:
-        """여러 셀러 성과의 평균 계산"""
-        if not performances:
-            return {}
-        
-        # 모든 지표의 평균값 계산
-        avg_metrics = {}
-        all_keys = set()
-        for perf in performances:
-            all_keys.update(perf.keys())
-        
-        for key in all_keys:
-            values = [perf.get(key) for perf in performances if perf.get(key) is not None]
-            values = [v for v in values if not (isinstance(v, float) and pd.isna(v))]
-            
-            if values:
-                avg_metrics[key] = sum(values) / len(values)
-            else:
-                avg_metrics[key] = float('nan')
-        
-        return avg_metrics
+    def _category_key(self, data: pd.DataFrame, level: Optional[int] = None) -> pd.Series:
+        """벤치마크 테이블의 카테고리 그룹 키 (category_mask와 같은 칼럼 우선순위)"""
+        level_col = category_level_column(level) if level else None
+        tree = get_category_tree() if level_col in data.columns else None
+        
+        if tree is not None:
+            # 깊이별 노드 ID → 카테고리명 (이름으로 필터링하는 category_mask와 동일한 묶음)
+            unique_names, name_codes = np.unique(tree.names.astype(str), return_inverse=True)
+            node_ids = data[level_col].fillna(-1).to_numpy(dtype='int64')
+            codes = np.where(node_ids >= 0, name_codes[node_ids], -1)
+            names = pd.Series(pd.Categorical.from_codes(codes, categories=unique_names), index=data.index)
+            return names.rename(level_col)
+        if '__category_mapped__' in data.columns:
+            return data['__category_mapped__']
+        if COL_CATEGORY in data.columns:
+            return data[COL_CATEGORY]
+        return pd.Series(0, index=data.index, name=_ALL_CATEGORIES)
+    
+    def filter_category(self, data: pd.DataFrame, target_category, level: Optional[int] = None) -> pd.DataFrame:
+        """카테고리 데이터 필터링 - level 지정 시 깊이별 노드 ID 칼럼으로 비교"""
+        mask = self.category_mask(data, target_category, level)
+        if mask is None:
+            # 카테고리 정보가 없으면 전체 데이터 사용
+            return data.copy()
+        return data[mask]
+    
+    def category_mask(self, data: pd.DataFrame, target_category, level: Optional[int] = None) -> Optional[np.ndarray]:
+        """카테고리에 속하는 행 마스크 (카테고리 칼럼이 없으면 None)"""
+        level_col = category_level_column(level) if level else None
+        tree = get_category_tree() if level_col in data.columns else None
+        
+        if tree is not None:
+            node_ids = tree.find(target_category)
+            return data[level_col].isin(node_ids).fillna(False).to_numpy(dtype=bool)
+        if '__category_mapped__' in data.columns:
+            return (data['__category_mapped__'] == target_category).to_numpy(dtype=bool)
+        if COL_CATEGORY in data.columns:
+            return (data[COL_CATEGORY] == target_category).to_numpy(dtype=bool)
+        return None
     
     def calculate_relative_performance(self, my_metrics: Dict[str, float], benchmarks: Dict[str, float]) -> Dict[str, float]:
         """내 성과 vs 카테고리 평균 상대적 비교"""
@@ -123,21 +119,13 @@ class CategoryBenchmarkCalculator:
         
         return relative
     
-    def get_my_category(self, my_data: pd.DataFrame) -> Optional[str]:
-        """내 데이터에서 주요 카테고리 추출"""
-        if '__category_mapped__' in my_data.columns:
-            category_col = '__category_mapped__'
-        elif COL_CATEGORY in my_data.columns:
-            category_col = COL_CATEGORY
-        else:
-            return None
+    def get_my_category(self, my_data: pd.DataFrame, level: Optional[int] = None) -> Optional[str]:
+        """내 데이터에서 주요 카테고리 추출 (level 지정 시 해당 깊이의 카테고리명)
         
-        # 가장 많은 매출을 차지하는 카테고리 반환
-        category_revenue = my_data.groupby(category_col)['__amount__'].sum()
-        if not category_revenue.empty:
-            return category_revenue.idxmax()
-        
-        return None
+        가장 많은 매출을 차지하는 카테고리 - 셀러 슬라이스면 전 셀러 주력 카테고리 테이블에서 조회
+        """
+        profile = get_seller_main_category(my_data, level)
+        return profile['main_category'] if profile is not None else None
 
 # 전역 인스턴스
 _benchmark_calculator = CategoryBenchmarkCalculator()
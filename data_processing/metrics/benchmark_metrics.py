@@ -3,12 +3,14 @@
 
 import pandas as pd
 from typing import Dict
-from constants import COL_STATUS, COL_SELLER
+from constants import COL_SELLER
+from .benchmark_scope import PLATFORM_SUMMARY_ATTR, get_platform_summary
 
 def calculate_benchmark_metrics(sdf: pd.DataFrame, overall: pd.DataFrame) -> Dict[str, float]:
     """확장된 벤치마킹 지표 계산 - 모든 지표를 상대적 비교로"""
     if overall.empty:
-        return {}
+        # 범위 축소로 비었으면 플랫폼 요약으로 기존 방식 벤치마크
+        return _calculate_legacy_benchmarks(sdf, overall) if PLATFORM_SUMMARY_ATTR in overall.attrs else {}
     
     from .benchmark_calculator import get_benchmark_calculator
     calculator = get_benchmark_calculator()
@@ -64,18 +66,26 @@ def calculate_benchmark_metrics(sdf: pd.DataFrame, overall: pd.DataFrame) -> Dic
     return relative_metrics
 
 def _calculate_legacy_benchmarks(sdf: pd.DataFrame, overall: pd.DataFrame) -> Dict[str, float]:
-    """기존 벤치마킹 방식 (전체 평균 대비)"""
+    """기존 벤치마킹 방식 (전체 평균 대비) - 범위 축소된 데이터면 플랫폼 요약 사용"""
     metrics = {}
+    summary = get_platform_summary(overall)
+    orders = summary['orders']
     
     # 전체 평균 AOV
-    overall_aov = overall["__amount__"].sum() / len(overall) if len(overall) > 0 else 0
+    overall_aov = summary['revenue'] / orders if orders > 0 else 0
     metrics['benchmark_aov'] = overall_aov
     
     # 전체 평균 취소율
-    if COL_STATUS in overall.columns:
-        overall_cancel = (overall[COL_STATUS] == '결제취소').sum() / len(overall) if len(overall) > 0 else 0
+    if summary['cancel_orders'] is not None:
+        overall_cancel = summary['cancel_orders'] / orders if orders > 0 else 0
         metrics['benchmark_cancel_rate'] = overall_cancel
     else:
         metrics['benchmark_cancel_rate'] = float('nan')
     
+    # 전체 평균 클레임률
+    if summary.get('claim_orders') is not None:
+        metrics['benchmark_claim_rate'] = summary['claim_orders'] / orders if orders > 0 else 0
+    else:
+        metrics['benchmark_claim_rate'] = float('nan')
+    
     return metrics
\ No newline at end of file
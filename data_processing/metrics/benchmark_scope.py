@@ -0,0 +1,64 @@
+# data_processing/metrics/benchmark_scope.py
+"""벤치마크 범위 축소 - 대상 셀러가 경쟁하는 카테고리 행만 남기고 플랫폼 전체는 요약으로 보관"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+from constants import COL_SELLER, COL_STATUS, COL_REFUND_FIELD
+from .benchmark_calculator import get_benchmark_calculator
+from .main_category import get_main_category_table
+from ..transformers.status_transformer import status_flag, claim_flag
+
+# 축소된 overall 데이터의 attrs에 저장되는 플랫폼 전체 요약 키
+PLATFORM_SUMMARY_ATTR = "platform_summary"
+
+def summarize_platform(dfp: pd.DataFrame) -> Dict[str, float]:
+    """기존(전체 평균) 벤치마크에 필요한 플랫폼 전체 요약"""
+    summary = {
+        'orders': len(dfp),
+        'revenue': float(dfp["__amount__"].sum()) if len(dfp) > 0 else 0.0,
+        'cancel_orders': None,
+        'claim_orders': None,
+    }
+    if COL_STATUS in dfp.columns:
+        summary['cancel_orders'] = int(status_flag(dfp, '결제취소').sum())
+    if COL_REFUND_FIELD in dfp.columns:
+        summary['claim_orders'] = int(claim_flag(dfp).sum())
+    return summary
+
+def get_platform_summary(overall: pd.DataFrame) -> Dict[str, float]:
+    """축소된 데이터면 보관된 요약, 아니면 직접 계산"""
+    summary = overall.attrs.get(PLATFORM_SUMMARY_ATTR)
+    return summary if summary is not None else summarize_platform(overall)
+
+def scope_benchmark_data(dfp: pd.DataFrame, sellers: List[str], level: Optional[int] = None) -> pd.DataFrame:
+    """대상 셀러들의 주력 카테고리 행만 남긴 overall 데이터 (플랫폼 요약은 attrs에 보관)
+
+    주력 카테고리는 get_my_category와 같은 전 셀러 주력 카테고리 테이블에서 조회
+    """
+    calculator = get_benchmark_calculator()
+    summary = summarize_platform(dfp)
+
+    categories = []
+    if COL_SELLER in dfp.columns:
+        # 전 셀러 주력 카테고리 테이블 (이후 셀러 슬라이스의 get_my_category도 같은 테이블 사용)
+        table = get_main_category_table(dfp, level)
+        targets = table.index.intersection(pd.Index([str(s) for s in sellers]).unique())
+        for category in table.loc[targets.sort_values(), 'main_category']:
+            if category not in categories:
+                categories.append(category)
+
+    keep = np.zeros(len(dfp), dtype=bool)
+    for category in categories:
+        mask = calculator.category_mask(dfp, category, level)
+        if mask is None:
+            # 카테고리 정보가 없으면 축소하지 않음
+            keep[:] = True
+            break
+        keep |= mask
+
+    scoped = dfp[keep].copy()
+    scoped.attrs[PLATFORM_SUMMARY_ATTR] = summary
+
+    print(f"✅ 벤치마크 범위 축소: {len(dfp):,}행 → {len(scoped):,}행 (카테고리 {len(categories)}개)")
+    return scoped
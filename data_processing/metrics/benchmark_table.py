@@ -0,0 +1,22 @@
+# data_processing/metrics/benchmark_table.py
+"""전 카테고리 벤치마크 테이블 - (카테고리, 셀러) groupby 한 번으로 모든 셀러 지표 계산"""
+
+import pandas as pd
+from constants import COL_SELLER
+from .grouped_metrics import calculate_grouped_kpis
+
+# 벤치마크 평균에 포함되는 셀러의 최소 주문 건수
+MIN_SELLER_ORDERS = 10
+
+def build_benchmark_table(data: pd.DataFrame, category_key: pd.Series) -> pd.DataFrame:
+    """카테고리별 벤치마크 (10건 이상 셀러 지표 평균, 해당 셀러가 없으면 카테고리 전체 지표)"""
+    category_metrics = calculate_grouped_kpis(data, [category_key])
+    if COL_SELLER not in data.columns:
+        return category_metrics
+
+    seller_metrics = calculate_grouped_kpis(data, [category_key, data[COL_SELLER]])
+    qualified = seller_metrics[seller_metrics['total_orders'] >= MIN_SELLER_ORDERS]
+    averaged = qualified.groupby(level=0, observed=True).mean()
+
+    fallback = category_metrics[~category_metrics.index.isin(averaged.index)]
+    return pd.concat([averaged, fallback])
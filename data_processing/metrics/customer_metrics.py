@@ -1,9 +1,11 @@
 # data_processing/metrics/customer_metrics.py
 """고객 관련 지표 계산"""
 
+import numpy as np
 import pandas as pd
 import math
-from typing import Dict
+from typing import Dict, Sequence
+from .group_keys import GroupKey, resolve_group_keys
 
 def calculate_customer_metrics(sdf: pd.DataFrame) -> Dict[str, float]:
     """고객 관련 지표 계산"""
@@ -28,4 +30,26 @@ def calculate_customer_metrics(sdf: pd.DataFrame) -> Dict[str, float]:
         metrics['avg_orders_per_customer'] = float('nan')
         metrics['customer_ltv'] = float('nan')
     
-    return metrics
\ No newline at end of file
+    return metrics
+
+def calculate_grouped_customer_metrics(df: pd.DataFrame, keys: Sequence[GroupKey]) -> pd.DataFrame:
+    """그룹별 고객 지표 (그룹당 한 행, 고객 식별이 안되는 그룹은 NaN)"""
+    keys = resolve_group_keys(df, keys)
+    group = df.groupby(keys, observed=True, sort=True)
+    orders = group.size()
+
+    if "__customer_id__" in df.columns:
+        per_customer = df.groupby(keys + [df["__customer_id__"]], observed=True).size()
+        levels = list(range(len(keys)))
+        unique = per_customer.groupby(level=levels).size().reindex(orders.index)
+        repeat = (per_customer >= 2).groupby(level=levels).sum().reindex(orders.index)
+    else:
+        unique = repeat = pd.Series(np.nan, index=orders.index)
+
+    table = pd.DataFrame(index=orders.index)
+    table['unique_customers'] = unique
+    table['repeat_customers'] = repeat
+    table['repeat_rate'] = repeat / unique
+    table['avg_orders_per_customer'] = orders / unique
+    table['customer_ltv'] = group["__amount__"].sum().astype(float) / unique
+    return table
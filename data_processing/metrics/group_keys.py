@@ -0,0 +1,51 @@
+# data_processing/metrics/group_keys.py
+"""그룹별 지표 계산용 그룹 키 - 별칭(seller/category/month/channel 등)을 groupby 키로 변환"""
+
+import pandas as pd
+from typing import List, Sequence, Union
+from constants import COL_SELLER, COL_CHANNEL, COL_CATEGORY
+
+GroupKey = Union[str, pd.Series]
+
+def _category_key(df: pd.DataFrame) -> pd.Series:
+    col = '__category_mapped__' if '__category_mapped__' in df.columns else COL_CATEGORY
+    return df[col].rename('category')
+
+def _month_key(df: pd.DataFrame) -> pd.Series:
+    # 파티션과 같은 "YYYY-MM" 형식
+    return df["__dt__"].dt.strftime("%Y-%m").rename('month')
+
+# 그룹 키 별칭 → 키 Series 생성 함수
+GROUP_KEY_ALIASES = {
+    'seller': lambda df: df[COL_SELLER].rename('seller'),
+    'category': _category_key,
+    'month': _month_key,
+    'channel': lambda df: df[COL_CHANNEL].rename('channel'),
+    'region': lambda df: df["__region__"].rename('region'),
+    'date': lambda df: df["__dt__"].dt.normalize().rename('date'),
+    'day': lambda df: df["__dt__"].dt.date.rename('day'),
+    'hour': lambda df: df["__dt__"].dt.hour.rename('hour'),
+    'day_name': lambda df: df["__dt__"].dt.day_name().rename('day_name'),
+    'week': lambda df: df["__dt__"].dt.to_period('W').astype(str).rename('week'),
+}
+
+def resolve_group_keys(df: pd.DataFrame, keys: Sequence[GroupKey]) -> List[pd.Series]:
+    """그룹 키 목록을 groupby용 Series 목록으로 (별칭, 칼럼명, Series 허용)"""
+    if isinstance(keys, (str, pd.Series)):
+        keys = [keys]
+
+    resolved = []
+    for key in keys:
+        if isinstance(key, pd.Series):
+            resolved.append(key)
+        elif key in df.columns:
+            resolved.append(df[key])
+        elif key in GROUP_KEY_ALIASES:
+            resolved.append(GROUP_KEY_ALIASES[key](df))
+        else:
+            raise KeyError(f"알 수 없는 그룹 키입니다: {key} (별칭: {list(GROUP_KEY_ALIASES)})")
+    return resolved
+
+def group_sum(values: pd.Series, keys: List[pd.Series], index: pd.Index) -> pd.Series:
+    """그룹별 합계 (그룹 인덱스에 맞춤)"""
+    return values.groupby(keys, observed=True).sum().reindex(index)
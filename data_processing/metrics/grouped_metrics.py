@@ -0,0 +1,35 @@
+# data_processing/metrics/grouped_metrics.py
+"""그룹별 KPI 테이블 - 매출/고객/운영 지표를 그룹당 한 행으로 계산"""
+
+import pandas as pd
+from typing import Dict, Sequence
+from .sales_metrics import calculate_grouped_sales_metrics
+from .customer_metrics import calculate_grouped_customer_metrics
+from .operational_metrics import calculate_grouped_operational_metrics
+from .group_keys import GroupKey, resolve_group_keys
+
+# 정수로 돌려주는 지표 (단일 그룹 dict와 같은 타입 유지)
+INT_METRICS = ['total_orders', 'total_quantity', 'unique_customers', 'repeat_customers']
+
+def calculate_grouped_kpis(df: pd.DataFrame, keys: Sequence[GroupKey]) -> pd.DataFrame:
+    """그룹별 매출 + 고객 + 운영 지표 (키 값이 비어 있는 행은 제외)
+
+    keys: 별칭('seller', 'category', 'month', 'channel'), 칼럼명 또는 Series 목록
+    """
+    keys = resolve_group_keys(df, keys)
+    return pd.concat([
+        calculate_grouped_sales_metrics(df, keys),
+        calculate_grouped_customer_metrics(df, keys),
+        calculate_grouped_operational_metrics(df, keys),
+    ], axis=1)
+
+def metrics_row_to_dict(row: pd.Series) -> Dict[str, float]:
+    """그룹 테이블의 한 행을 calculate_*_metrics와 같은 dict로 (정수 지표는 int)"""
+    return {key: _to_metric_value(key, value) for key, value in row.items()}
+
+def _to_metric_value(key: str, value):
+    if pd.isna(value):
+        return float('nan')
+    if key in INT_METRICS and float(value).is_integer():
+        return int(value)
+    return float(value)
@@ -0,0 +1,95 @@
+# data_processing/metrics/main_category.py
+"""셀러 주력 카테고리 테이블 - (셀러, 카테고리) 매출 groupby 한 번으로 전 셀러의 주력 카테고리를 구해 공유"""
+
+import pandas as pd
+from typing import Any, Dict, Optional
+from constants import COL_SELLER, COL_CATEGORY
+from ..cache import FrameMemo
+from ..cube import get_slice_source
+from ..transformers.category_tree import get_category_tree, category_level_column
+
+# 셀러 칼럼이 없거나 셀러 슬라이스가 아닌 데이터를 한 셀러로 묶는 키
+_ALL_SELLERS = "__all__"
+
+# 프레임별 주력 카테고리 테이블 (깊이/셀러 구분 여부별)
+_main_category_memo = FrameMemo()
+
+def build_main_category_table(data: pd.DataFrame, level: Optional[int] = None,
+                              by_seller: bool = True) -> pd.DataFrame:
+    """셀러별 주력 카테고리 테이블 (index = 셀러명 문자열)
+
+    main_category: 카테고리별 매출 최대 (동률이면 카테고리 순 첫 번째, level 지정 시 해당 깊이 카테고리명)
+    category_revenue: 주력 카테고리 매출, total_revenue: 셀러 전체 매출
+    """
+    columns = ['main_category', 'category_revenue', 'total_revenue']
+    category, tree = _category_key(data, level)
+    if category is None:
+        return pd.DataFrame(columns=columns)
+
+    if by_seller and COL_SELLER in data.columns:
+        sellers = data[COL_SELLER]
+    else:
+        sellers = pd.Series(_ALL_SELLERS, index=data.index, name=COL_SELLER)
+
+    amount = data['__amount__']
+    revenue = amount.groupby([sellers, category], observed=True).sum()
+    if revenue.empty:
+        return pd.DataFrame(columns=columns)
+
+    main = revenue.groupby(level=0, observed=True).idxmax()
+    main_categories = [key[1] for key in main]
+    if tree is not None:
+        main_categories = list(tree.name_of(main_categories))
+
+    table = pd.DataFrame({
+        'main_category': main_categories,
+        'category_revenue': revenue.loc[list(main)].to_numpy(),
+        'total_revenue': amount.groupby(sellers, observed=True).sum().reindex(main.index).to_numpy(),
+    }, index=main.index.astype(str))
+    table.index.name = 'seller'
+    return table
+
+def get_main_category_table(data: pd.DataFrame, level: Optional[int] = None,
+                            by_seller: bool = True) -> pd.DataFrame:
+    """프레임의 주력 카테고리 테이블 (같은 프레임 객체면 재사용)"""
+    memo_key = (level, by_seller)
+    table = _main_category_memo.get(data, memo_key)
+    if table is None:
+        table = build_main_category_table(data, level, by_seller)
+        _main_category_memo.put(data, table, memo_key)
+    return table
+
+def get_seller_main_category(seller_data: pd.DataFrame, level: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """셀러 데이터의 주력 카테고리 정보 (카테고리 정보가 없으면 None)
+
+    셀러 슬라이스(slice_by_seller)면 원본 데이터의 전 셀러 테이블에서 조회해
+    KPI/상대 분석/대시보드가 같은 테이블을 공유하고, 아니면 데이터 전체를 한 셀러로 계산
+    """
+    source = get_slice_source(seller_data)
+    if source is not None and list(source[1]) == ['seller']:
+        table = get_main_category_table(source[0], level)
+        seller = source[1]['seller']
+    else:
+        table = get_main_category_table(seller_data, level, by_seller=False)
+        seller = _ALL_SELLERS
+
+    if seller not in table.index:
+        return None
+    row = table.loc[seller]
+    return {
+        'main_category': row['main_category'],
+        'category_revenue': row['category_revenue'],
+        'total_revenue': row['total_revenue'],
+    }
+
+def _category_key(data: pd.DataFrame, level: Optional[int] = None):
+    """주력 카테고리 그룹 키와 깊이별 카테고리 트리 (level 지정 시 노드 ID로 묶음)"""
+    level_col = category_level_column(level) if level else None
+    tree = get_category_tree() if level_col in data.columns else None
+    if tree is not None:
+        return data[level_col], tree
+    if '__category_mapped__' in data.columns:
+        return data['__category_mapped__'], None
+    if COL_CATEGORY in data.columns:
+        return data[COL_CATEGORY], None
+    return None, None
@@ -1,11 +1,23 @@
 # data_processing/metrics/operational_metrics.py
 """운영 효율성 지표 계산"""
 
+import numpy as np
 import pandas as pd
 import math
-from typing import Dict
-from constants import COL_STATUS, COL_SHIP_DATE, COL_DELIVERED_DATE
-from ..transformers.datetime_transformer import to_datetime_safe
+from typing import Dict, Sequence
+from constants import COL_STATUS, COL_SHIP_DATE, COL_DELIVERED_DATE, COL_REFUND_FIELD
+from ..transformers.datetime_transformer import to_datetime_safe, derive_ship_times, derive_delivery_times
+from ..transformers.status_transformer import status_flag, claim_flag
+from .group_keys import GroupKey, resolve_group_keys, group_sum
+
+# 상태별 비율 지표 (지표명 → 주문 상태)
+STATUS_RATE_METRICS = {
+    'completion_rate': '배송완료',
+    'cancel_rate': '결제취소',
+    'delay_rate': '배송지연',
+    'return_rate': '반품',
+    'exchange_rate': '교환',
+}
 
 def calculate_operational_metrics(sdf: pd.DataFrame) -> Dict[str, float]:
     """운영 효율성 지표 계산"""
@@ -14,30 +26,20 @@ def calculate_operational_metrics(sdf: pd.DataFrame) -> Dict[str, float]:
     
     metrics = {}
     
-    # 주문 상태 지표 (5개)
-    if COL_STATUS in sdf.columns:
-        status_counts = sdf[COL_STATUS].value_counts()
-        total = len(sdf)
-        metrics['completion_rate'] = status_counts.get('배송완료', 0) / total if total > 0 else 0
-        metrics['cancel_rate'] = status_counts.get('결제취소', 0) / total if total > 0 else 0
-        metrics['delay_rate'] = status_counts.get('배송지연', 0) / total if total > 0 else 0
-        metrics['return_rate'] = status_counts.get('반품', 0) / total if total > 0 else 0
-        metrics['exchange_rate'] = status_counts.get('교환', 0) / total if total > 0 else 0
-    else:
-        metrics['completion_rate'] = float('nan')
-        metrics['cancel_rate'] = float('nan')
-        metrics['delay_rate'] = float('nan')
-        metrics['return_rate'] = float('nan')
-        metrics['exchange_rate'] = float('nan')
+    # 주문 상태 지표 (5개) - 변환 단계 상태 플래그의 평균
+    for metric, status in STATUS_RATE_METRICS.items():
+        metrics[metric] = status_flag(sdf, status).mean() if COL_STATUS in sdf.columns else float('nan')
+    
+    # 클레임률 - 환불/취소/반품 클레임 플래그의 평균
+    metrics['claim_rate'] = claim_flag(sdf).mean() if COL_REFUND_FIELD in sdf.columns else float('nan')
     
-    # 배송 효율성 지표 (3개)
+    # 배송 효율성 지표 (3개) - 변환 단계에서 계산된 소요일 칼럼을 복사 없이 집계
     if COL_SHIP_DATE in sdf.columns:
-        ship_data = sdf[sdf[COL_SHIP_DATE].notna()].copy()
-        if not ship_data.empty:
-            ship_data['ship_dt'] = to_datetime_safe(ship_data[COL_SHIP_DATE])
-            lead_times = (ship_data['ship_dt'] - ship_data["__dt__"]).dt.total_seconds() / 86400.0
+        has_ship = sdf[COL_SHIP_DATE].notna()
+        if has_ship.any():
+            lead_times = ship_lead_days(sdf)[has_ship]
             metrics['avg_ship_leadtime'] = float(lead_times.mean())
-            metrics['same_day_ship_rate'] = (lead_times <= 1).sum() / len(lead_times) if len(lead_times) > 0 else 0
+            metrics['same_day_ship_rate'] = (lead_times <= 1).sum() / len(lead_times)
         else:
             metrics['avg_ship_leadtime'] = float('nan')
             metrics['same_day_ship_rate'] = float('nan')
@@ -46,15 +48,59 @@ def calculate_operational_metrics(sdf: pd.DataFrame) -> Dict[str, float]:
         metrics['same_day_ship_rate'] = float('nan')
     
     if COL_DELIVERED_DATE in sdf.columns and COL_SHIP_DATE in sdf.columns:
-        delivery_data = sdf[sdf[COL_DELIVERED_DATE].notna() & sdf[COL_SHIP_DATE].notna()].copy()
-        if not delivery_data.empty:
-            delivery_data['delivery_dt'] = to_datetime_safe(delivery_data[COL_DELIVERED_DATE])
-            delivery_data['ship_dt'] = to_datetime_safe(delivery_data[COL_SHIP_DATE])
-            delivery_times = (delivery_data['delivery_dt'] - delivery_data['ship_dt']).dt.total_seconds() / 86400.0
-            metrics['avg_delivery_time'] = float(delivery_times.mean())
+        has_delivery = sdf[COL_DELIVERED_DATE].notna() & sdf[COL_SHIP_DATE].notna()
+        if has_delivery.any():
+            metrics['avg_delivery_time'] = float(delivery_days(sdf)[has_delivery].mean())
         else:
             metrics['avg_delivery_time'] = float('nan')
     else:
         metrics['avg_delivery_time'] = float('nan')
     
-    return metrics
\ No newline at end of file
+    return metrics
+
+def calculate_grouped_operational_metrics(df: pd.DataFrame, keys: Sequence[GroupKey]) -> pd.DataFrame:
+    """그룹별 운영 효율성 지표 (그룹당 한 행, 배송 지표는 발송일이 있는 행 기준)"""
+    keys = resolve_group_keys(df, keys)
+    orders = df.groupby(keys, observed=True, sort=True).size()
+    table = pd.DataFrame(index=orders.index)
+
+    # 주문 상태 지표
+    for metric, status in STATUS_RATE_METRICS.items():
+        if COL_STATUS in df.columns:
+            table[metric] = group_sum(status_flag(df, status), keys, orders.index) / orders
+        else:
+            table[metric] = np.nan
+    if COL_REFUND_FIELD in df.columns:
+        table['claim_rate'] = group_sum(claim_flag(df), keys, orders.index) / orders
+    else:
+        table['claim_rate'] = np.nan
+
+    # 배송 효율성 지표
+    table['avg_ship_leadtime'] = np.nan
+    table['same_day_ship_rate'] = np.nan
+    table['avg_delivery_time'] = np.nan
+    if COL_SHIP_DATE in df.columns:
+        has_ship = df[COL_SHIP_DATE].notna()
+        lead_times = ship_lead_days(df).where(has_ship)
+        shipped = group_sum(has_ship, keys, orders.index)
+        table['avg_ship_leadtime'] = lead_times.groupby(keys, observed=True).mean().where(shipped > 0)
+        table['same_day_ship_rate'] = (group_sum(lead_times <= 1, keys, orders.index) / shipped).where(shipped > 0)
+
+        if COL_DELIVERED_DATE in df.columns:
+            has_delivery = has_ship & df[COL_DELIVERED_DATE].notna()
+            table['avg_delivery_time'] = delivery_days(df).where(has_delivery).groupby(keys, observed=True).mean()
+
+    return table
+
+def ship_lead_days(df: pd.DataFrame) -> pd.Series:
+    """결제 → 발송 소요일 (변환 단계의 __ship_lead_days__, 없으면 발송처리일 파싱)"""
+    if "__ship_lead_days__" in df.columns:
+        return df["__ship_lead_days__"]
+    return derive_ship_times(df[COL_SHIP_DATE], df["__dt__"])["__ship_lead_days__"]
+
+def delivery_days(df: pd.DataFrame) -> pd.Series:
+    """발송 → 배송완료 소요일 (변환 단계의 __delivery_days__, 없으면 배송완료일/발송처리일 파싱)"""
+    if "__delivery_days__" in df.columns:
+        return df["__delivery_days__"]
+    ship_dt = df["__ship_dt__"] if "__ship_dt__" in df.columns else to_datetime_safe(df[COL_SHIP_DATE])
+    return derive_delivery_times(df[COL_DELIVERED_DATE], ship_dt)["__delivery_days__"]
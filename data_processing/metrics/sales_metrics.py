@@ -2,9 +2,10 @@
 """매출 관련 지표 계산"""
 
 import pandas as pd
-from typing import Dict
+from typing import Dict, Sequence
 from constants import COL_PRODUCT_PRICE
 from ..transformers.numeric_transformer import to_number_safe
+from .group_keys import GroupKey, resolve_group_keys, group_sum
 
 def calculate_sales_metrics(sdf: pd.DataFrame) -> Dict[str, float]:
     """매출 관련 지표 계산"""
@@ -22,4 +23,21 @@ def calculate_sales_metrics(sdf: pd.DataFrame) -> Dict[str, float]:
     if COL_PRODUCT_PRICE in sdf.columns:
         metrics['avg_product_price'] = float(to_number_safe(sdf[COL_PRODUCT_PRICE]).mean())
     
-    return metrics
\ No newline at end of file
+    return metrics
+
+def calculate_grouped_sales_metrics(df: pd.DataFrame, keys: Sequence[GroupKey]) -> pd.DataFrame:
+    """그룹별 매출 지표 (그룹당 한 행, 칼럼은 calculate_sales_metrics와 동일)"""
+    keys = resolve_group_keys(df, keys)
+    group = df.groupby(keys, observed=True, sort=True)
+    orders = group.size()
+
+    table = pd.DataFrame(index=orders.index)
+    table['total_orders'] = orders
+    table['total_revenue'] = group["__amount__"].sum().astype(float)
+    table['avg_order_value'] = table['total_revenue'] / orders
+    table['total_quantity'] = group_sum(df["__qty__"], keys, orders.index)
+
+    if COL_PRODUCT_PRICE in df.columns:
+        table['avg_product_price'] = to_number_safe(df[COL_PRODUCT_PRICE]).groupby(keys, observed=True).mean()
+
+    return table
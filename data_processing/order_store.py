@@ -0,0 +1,210 @@
+# data_processing/order_store.py
+"""증분 주문 저장소 - 전처리된 주문을 결제월 단위 Parquet 파티션으로 보관"""
+
+import json
+import os
+import pandas as pd
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+from constants import COL_ORDER_ID, COL_ITEM_ORDER_ID
+from .validation import prepare_dataframe, concat_preserving_categories
+
+# 저장소 메타 파일 / 파티션 디렉토리 접두어
+STATE_FILE = "_state.json"
+INDEX_FILE = "_index.parquet"
+PARTITION_PREFIX = "pay_month="
+STORE_VERSION = 2
+
+# 파티션에 저장되는 행 식별 키 칼럼
+KEY_COL = "__store_key__"
+
+class IncrementalOrderStore:
+    """전처리 결과를 보관하고 새 export의 신규/변경 주문만 반영하는 저장소"""
+
+    def __init__(self, store_dir: str):
+        self.store_dir = Path(store_dir)
+        self.state = self._load_state()
+        self._index = None
+
+    # ---------- 조회 ----------
+
+    @property
+    def watermark(self) -> Optional[pd.Timestamp]:
+        """지금까지 반영된 결제일 최댓값"""
+        value = self.state.get("watermark")
+        return pd.Timestamp(value) if value else None
+
+    def is_ingested(self, export_name: str, export_key: str, signature: Dict[str, int]) -> bool:
+        """이미 반영했거나 마지막 반영분보다 오래된 export인지 여부"""
+        if self.state["exports"].get(export_name) == signature:
+            return True
+        # 오래된 export가 최신 상태를 덮어쓰지 않도록 export 시각 워터마크 이전 파일은 건너뜀
+        last_key = self.state.get("last_export_key") or ""
+        return bool(export_key) and export_key < last_key
+
+    def load(self, start: Optional[str] = None, end: Optional[str] = None) -> pd.DataFrame:
+        """저장된 전처리 데이터 로드 (기간에 걸치는 파티션만 읽음)"""
+        start_ts = pd.to_datetime(start) if start else None
+        end_ts = pd.to_datetime(end) + pd.to_timedelta(1, "D") if end else None
+
+        frames = []
+        for month, part_path in self._partitions():
+            month_start = pd.Timestamp(f"{month}-01")
+            if start_ts is not None and month_start + pd.offsets.MonthBegin(1) <= start_ts:
+                continue
+            if end_ts is not None and month_start >= end_ts:
+                continue
+            frames.append(pd.read_parquet(part_path))
+
+        if not frames:
+            raise ValueError("저장소에 유효한 데이터가 없습니다.")
+
+        dfp = concat_preserving_categories(frames).drop(columns=[KEY_COL])
+        if start_ts is not None: dfp = dfp[dfp["__dt__"] >= start_ts]
+        if end_ts is not None:   dfp = dfp[dfp["__dt__"] < end_ts]
+        return dfp.reset_index(drop=True)
+
+    # ---------- 반영 ----------
+
+    def upsert(self, raw: pd.DataFrame, export_name: str, export_key: str = "",
+               signature: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """원본 export에서 신규/변경된 주문 라인만 전처리하여 저장소에 반영"""
+        raw = raw.reset_index(drop=True)
+        keys = _row_keys(raw)
+        hashes = pd.util.hash_pandas_object(raw, index=False)
+
+        # 같은 export 안에서 중복된 키는 마지막 행 유지
+        last = ~keys.duplicated(keep="last")
+        raw, keys, hashes = raw[last], keys[last], hashes[last]
+
+        # 처음 보는 키이거나 내용 해시가 달라진 행만 변경분
+        index = self._load_index()
+        known = keys.isin(index.index).to_numpy()
+        changed = ~known
+        previous = index["row_hash"].to_numpy()[index.index.get_indexer(keys[known])]
+        changed[known] = previous != hashes.to_numpy()[known]
+        inserted = int((~known).sum())
+
+        stats = {"export": export_name, "rows": len(raw), "inserted": inserted,
+                 "updated": int(changed.sum()) - inserted}
+
+        if changed.any():
+            delta = raw[changed]
+            delta_keys = keys[changed]
+            delta_hashes = hashes[changed]
+
+            try:
+                transformed = prepare_dataframe(delta, None, None)
+            except ValueError:
+                transformed = delta.iloc[0:0]
+
+            if not transformed.empty:
+                transformed = transformed.copy()
+                transformed[KEY_COL] = delta_keys.loc[transformed.index].astype(str).to_numpy()
+                months = transformed["__dt__"].dt.strftime("%Y-%m")
+            else:
+                months = pd.Series(dtype=str)
+
+            # 변경 행이 기존에 있던 파티션 + 새로 들어갈 파티션만 다시 씀
+            old_parts = index["partition"].reindex(delta_keys.to_numpy()).dropna()
+            affected = sorted(set(months.unique()) | set(old_parts.unique()))
+            replaced = set(delta_keys.astype(str))
+            for month in affected:
+                self._rewrite_partition(month, replaced, transformed[months == month] if not transformed.empty else None)
+
+            entries = pd.DataFrame({
+                "row_hash": delta_hashes.to_numpy(),
+                "partition": months.reindex(delta.index).to_numpy() if not transformed.empty else None,
+            }, index=pd.Index(delta_keys.astype(str).to_numpy(), name=KEY_COL))
+            index = pd.concat([index[~index.index.isin(entries.index)], entries])
+            self._save_index(index)
+
+            if not transformed.empty:
+                latest = transformed["__dt__"].max()
+                if self.watermark is None or latest > self.watermark:
+                    self.state["watermark"] = latest.isoformat()
+
+        self.state["exports"][export_name] = signature or {}
+        if export_key and export_key > (self.state.get("last_export_key") or ""):
+            self.state["last_export_key"] = export_key
+        self._save_state()
+        return stats
+
+    # ---------- 내부 ----------
+
+    def _partitions(self) -> List[tuple]:
+        """(결제월, 파티션 파일) 목록"""
+        if not self.store_dir.exists():
+            return []
+        parts = []
+        for part_dir in sorted(self.store_dir.glob(f"{PARTITION_PREFIX}*")):
+            part_path = part_dir / "part.parquet"
+            if part_path.exists():
+                parts.append((part_dir.name[len(PARTITION_PREFIX):], part_path))
+        return parts
+
+    def _rewrite_partition(self, month: str, replaced: set, additions: Optional[pd.DataFrame]) -> None:
+        """파티션에서 교체 대상 키를 지우고 새 행을 추가하여 다시 저장"""
+        part_path = self.store_dir / f"{PARTITION_PREFIX}{month}" / "part.parquet"
+        frames = []
+        if part_path.exists():
+            existing = pd.read_parquet(part_path)
+            frames.append(existing[~existing[KEY_COL].isin(replaced)])
+        if additions is not None and not additions.empty:
+            frames.append(additions)
+
+        merged = concat_preserving_categories(frames)
+        if merged.empty:
+            if part_path.exists():
+                part_path.unlink()
+            return
+
+        part_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = part_path.with_suffix(".tmp")
+        merged.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, part_path)
+
+    def _load_index(self) -> pd.DataFrame:
+        """키 → (행 해시, 파티션) 인덱스"""
+        if self._index is None:
+            index_path = self.store_dir / INDEX_FILE
+            if index_path.exists():
+                self._index = pd.read_parquet(index_path)
+            else:
+                self._index = pd.DataFrame({"row_hash": pd.Series(dtype="uint64"),
+                                            "partition": pd.Series(dtype=object)},
+                                           index=pd.Index([], name=KEY_COL, dtype=object))
+        return self._index
+
+    def _save_index(self, index: pd.DataFrame) -> None:
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.store_dir / f"{INDEX_FILE}.tmp"
+        index.to_parquet(tmp_path)
+        os.replace(tmp_path, self.store_dir / INDEX_FILE)
+        self._index = index
+
+    def _load_state(self) -> Dict[str, Any]:
+        state_path = self.store_dir / STATE_FILE
+        if state_path.exists():
+            state = json.loads(state_path.read_text(encoding="utf-8"))
+            if state.get("version") == STORE_VERSION:
+                return state
+            print(f"⚠️ 저장소 버전이 달라 새로 구축합니다: {self.store_dir}")
+        return {"version": STORE_VERSION, "watermark": None, "last_export_key": None, "exports": {}}
+
+    def _save_state(self) -> None:
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.store_dir / f"{STATE_FILE}.tmp"
+        tmp_path.write_text(json.dumps(self.state, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.store_dir / STATE_FILE)
+
+def _row_keys(raw: pd.DataFrame) -> pd.Series:
+    """주문번호+상품주문번호 키 (없으면 행 내용 해시)"""
+    content_key = "h:" + pd.util.hash_pandas_object(raw, index=False).astype(str)
+    if COL_ORDER_ID not in raw.columns or COL_ITEM_ORDER_ID not in raw.columns:
+        return content_key
+
+    order_id = raw[COL_ORDER_ID].astype("string")
+    item_id = raw[COL_ITEM_ORDER_ID].astype("string")
+    keys = (order_id + "|" + item_id).astype(object)
+    return keys.where(order_id.notna() & item_id.notna(), content_key)
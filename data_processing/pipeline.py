@@ -2,14 +2,14 @@
 """메인 데이터 처리 파이프라인"""
 
 import pandas as pd
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from constants import *
 
 # 변환기들
-from .transformers import (
-    to_datetime_safe, to_number_safe, create_customer_id, 
-    extract_region_from_address, apply_category_mapping
-)
+from .transformers.registry import derive_columns
+from .cache import LRUCache, frame_fingerprint
+from .validation import filter_valid_period, slice_by_seller
+from .query import query
 
 # 분석기들
 from .analyzers import (
@@ -21,67 +21,35 @@ from .analyzers import (
 # 지표 계산기들
 from .metrics import calculate_comprehensive_kpis, calculate_kpis
 
-def apply_all_transformations(df: pd.DataFrame) -> pd.DataFrame:
-    """모든 변환을 한 번에 적용하는 통합 함수"""
-    result_df = df.copy()
-    
-    # 1. 기본 데이터 변환
-    if COL_PAYMENT_DATE in result_df.columns:
-        result_df["__dt__"] = to_datetime_safe(result_df[COL_PAYMENT_DATE])
-    
-    if COL_ORDER_AMOUNT in result_df.columns:
-        result_df["__amount__"] = to_number_safe(result_df[COL_ORDER_AMOUNT])
-    
-    if COL_QTY in result_df.columns:
-        result_df["__qty__"] = to_number_safe(result_df[COL_QTY])
-    else:
-        result_df["__qty__"] = 1
-    
-    # 2. 고객 식별 ID 생성
-    if COL_BUYER_NAME in result_df.columns and COL_BUYER_PHONE in result_df.columns:
-        result_df["__customer_id__"] = create_customer_id(
-            result_df[COL_BUYER_NAME], 
-            result_df[COL_BUYER_PHONE]
-        )
-    elif COL_CUSTOMER in result_df.columns:
-        result_df["__customer_id__"] = result_df[COL_CUSTOMER].astype(str)
-    else:
-        result_df["__customer_id__"] = None
-    
-    # 3. 지역 정보 추출
-    if COL_ADDRESS in result_df.columns:
-        result_df["__region__"] = extract_region_from_address(result_df[COL_ADDRESS])
-    
-    # 4. 카테고리 매핑 적용 (기존에 누락되었던 부분!)
-    if COL_CATEGORY in result_df.columns:
-        result_df["__category_mapped__"] = apply_category_mapping(result_df[COL_CATEGORY])
-    
-    return result_df
+def apply_all_transformations(df: pd.DataFrame, analyzers: Optional[List[str]] = None) -> pd.DataFrame:
+    """모든 변환을 한 번에 적용하는 통합 함수 (원본 칼럼 유지, prepare_dataframe과 같은 레지스트리 사용)"""
+    return derive_columns(df, analyzers)
 
 class DataPipeline:
     """데이터 처리 파이프라인 클래스"""
     
-    def __init__(self):
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        # 캐시 예산: 인자 → 설정파일 순
+        try:
+            from config import CONFIG
+        except:
+            CONFIG = {}
+        if max_entries is None:
+            max_entries = CONFIG.get("PIPELINE_CACHE_MAX_ENTRIES", 128)
+        if max_bytes is None:
+            max_bytes = CONFIG.get("PIPELINE_CACHE_MAX_BYTES")
+        
         self.processed_data = None
-        self.analysis_cache = {}
-        self.metrics_cache = {}
+        self.analysis_cache = LRUCache(max_entries, max_bytes)
+        self.metrics_cache = LRUCache(max_entries, max_bytes)
     
-    def process(self, df: pd.DataFrame, start: Optional[str] = None, end: Optional[str] = None) -> pd.DataFrame:
+    def process(self, df: pd.DataFrame, start: Optional[str] = None, end: Optional[str] = None,
+                analyzers: Optional[List[str]] = None, sellers: Optional[List[str]] = None) -> pd.DataFrame:
         """전체 데이터 처리 파이프라인 실행"""
         
-        # 1. 데이터 변환
-        processed = apply_all_transformations(df)
-        
-        # 2. 유효성 검증
-        processed = processed[processed["__dt__"].notna() & processed["__amount__"].notna()]
-        if processed.empty:
-            raise ValueError("유효한 데이터가 없습니다.")
-        
-        # 3. 기간 필터
-        if start: 
-            processed = processed[processed["__dt__"] >= pd.to_datetime(start)]
-        if end:   
-            processed = processed[processed["__dt__"] < pd.to_datetime(end) + pd.to_timedelta(1, "D")]
+        # 결제일/금액 변환 → 유효성·기간·셀러 필터 → 남은 행만 나머지 변환
+        processed = derive_columns(df, analyzers,
+                                   row_filter=lambda frame: filter_valid_period(frame, start, end, sellers))
         
         self.processed_data = processed
         return processed
@@ -91,33 +59,43 @@ class DataPipeline:
         if self.processed_data is None:
             raise ValueError("데이터를 먼저 처리해야 합니다.")
         
-        if seller_name and COL_SELLER in self.processed_data.columns:
-            filtered = self.processed_data[self.processed_data[COL_SELLER].astype(str) == str(seller_name)].copy()
-            if filtered.empty:
-                raise ValueError(f"셀러 '{seller_name}'의 데이터가 없습니다.")
-            return filtered
-        
-        return self.processed_data.copy()
+        return slice_by_seller(self.processed_data, seller_name)
+    
+    def query(self, measures: Optional[List[str]] = None, by: Optional[List[str]] = None,
+              where: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        """처리된 데이터 드릴다운 질의 (파이프라인 재실행 없이 집계 큐브 재사용)"""
+        if self.processed_data is None:
+            raise ValueError("데이터를 먼저 처리해야 합니다.")
+        return query(self.processed_data, measures, by, where)
     
     def analyze(self, seller_data: pd.DataFrame) -> Dict[str, Any]:
-        """종합 분석 실행 (캐싱으로 중복 계산 방지)"""
-        data_hash = str(hash(str(seller_data.shape) + str(seller_data.columns.tolist())))
+        """종합 분석 실행 (데이터 내용 지문 기준 캐싱으로 중복 계산 방지)"""
+        cache_key = frame_fingerprint(seller_data)
         
-        if data_hash not in self.analysis_cache:
-            self.analysis_cache[data_hash] = get_comprehensive_analysis(seller_data)
+        result = self.analysis_cache.get(cache_key)
+        if result is None:
+            result = get_comprehensive_analysis(seller_data)
+            self.analysis_cache.put(cache_key, result)
         
-        return self.analysis_cache[data_hash]
+        return result
     
     def calculate_metrics(self, seller_data: pd.DataFrame, overall_data: pd.DataFrame) -> Dict[str, Any]:
-        """KPI 계산 (캐싱으로 중복 계산 방지)"""
-        seller_hash = str(hash(str(seller_data.shape)))
-        overall_hash = str(hash(str(overall_data.shape)))
-        cache_key = f"{seller_hash}_{overall_hash}"
+        """KPI 계산 (셀러/전체 데이터 내용 지문 기준 캐싱으로 중복 계산 방지)"""
+        cache_key = f"{frame_fingerprint(seller_data)}_{frame_fingerprint(overall_data)}"
         
-        if cache_key not in self.metrics_cache:
-            self.metrics_cache[cache_key] = calculate_comprehensive_kpis(seller_data, overall_data)
+        result = self.metrics_cache.get(cache_key)
+        if result is None:
+            result = calculate_comprehensive_kpis(seller_data, overall_data)
+            self.metrics_cache.put(cache_key, result)
         
-        return self.metrics_cache[cache_key]
+        return result
+    
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """캐시 적중/실패/제거 통계"""
+        return {
+            'analysis': self.analysis_cache.stats(),
+            'metrics': self.metrics_cache.stats(),
+        }
     
     def clear_cache(self):
         """캐시 초기화"""
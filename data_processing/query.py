@@ -0,0 +1,143 @@
+# data_processing/query.py
+"""드릴다운 질의 API - query(measures, by, where)를 집계 큐브/셀러 인덱스로 계획하고 안 되면 벡터화 스캔"""
+
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional, Sequence
+from constants import COL_SELLER
+from .cube import get_aggregate_cube
+from .seller_index import get_seller_index
+from .metrics.grouped_metrics import calculate_grouped_kpis
+from .metrics.group_keys import resolve_group_keys
+
+# 큐브에서 바로 계산되는 지표 (calculate_grouped_kpis와 같은 이름/정의)
+CUBE_QUERY_MEASURES = [
+    'total_orders', 'total_revenue', 'avg_order_value', 'total_quantity', 'cancel_rate', 'unique_customers'
+]
+
+# 큐브 차원이 아닌 시간 차원은 결제일에서 파생 (큐브 차원 + 파생 차원)
+_CUBE_QUERY_DIMENSIONS = ['seller', 'category', 'channel', 'region', 'date', 'hour',
+                          'day', 'day_name', 'month', 'week']
+
+# 범위 조건 (시작, 끝)을 쓸 수 있는 차원 - 끝 포함
+_RANGE_DIMENSIONS = ['date', 'hour']
+
+def query(df: pd.DataFrame, measures: Optional[Sequence[str]] = None, by: Optional[Sequence[str]] = None,
+          where: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+    """처리된 주문 데이터 질의 - by 차원별 measures (by가 없으면 전체 한 행)
+
+    where 값: 단일 값(같음), 리스트/집합(포함), (시작, 끝) 튜플(date/hour 범위, 끝 포함)
+    예: query(dfp, ['total_revenue'], by=['day'], where={'seller': 'A', 'channel': 'B', 'date': ('2025-08-11', '2025-08-17')})
+
+    단일 셀러가 데이터에 없으면 ValueError (slice_by_seller와 동일), 그 밖에 조건에 맞는 행이 없으면 빈 결과
+    """
+    measures = list(measures) if measures else ['total_orders', 'total_revenue']
+    by = [by] if isinstance(by, str) else list(by or [])
+    where = dict(where or {})
+    _check_seller(df, where.get('seller'))
+
+    if query_plan(df, measures, by, where) == 'cube':
+        return _query_cube(df, measures, by, where)
+    return _query_scan(df, measures, by, where)
+
+def query_plan(df: pd.DataFrame, measures: Sequence[str], by: Sequence[str],
+               where: Dict[str, Any]) -> str:
+    """실행 계획 - 'cube'(사전 집계 롤업) 또는 'scan'(셀러 인덱스 + 벡터화 스캔)"""
+    if not all(measure in CUBE_QUERY_MEASURES for measure in measures):
+        return 'scan'
+    dims = list(by) + list(where)
+    if not all(dim in _CUBE_QUERY_DIMENSIONS for dim in dims):
+        return 'scan'
+    cube = get_aggregate_cube(df)
+    return 'cube' if all(dim in cube.levels for dim in dims) else 'scan'
+
+def _query_cube(df: pd.DataFrame, measures: List[str], by: List[str], where: Dict[str, Any]) -> pd.DataFrame:
+    cube = get_aggregate_cube(df)
+    if where:
+        mask = np.ones(len(cube.cells), dtype=bool)
+        for dim, condition in where.items():
+            level_mask = _condition_mask(dim, pd.Series(cube.levels[dim]), condition)
+            codes = cube.codes(dim)
+            mask &= (codes >= 0) & level_mask[np.maximum(codes, 0)]
+        cube = cube.select(mask)
+
+    totals = cube.rollup(by)
+    orders = totals['orders']
+    result = pd.DataFrame(index=totals.index)
+    for measure in measures:
+        if measure == 'total_orders':
+            result[measure] = orders
+        elif measure == 'total_revenue':
+            result[measure] = totals['revenue'].astype(float)
+        elif measure == 'avg_order_value':
+            result[measure] = totals['revenue'] / orders
+        elif measure == 'total_quantity':
+            result[measure] = totals['qty'] if 'qty' in totals.columns else np.nan
+        elif measure == 'cancel_rate':
+            result[measure] = totals['cancels'] / orders if 'cancels' in totals.columns else np.nan
+        elif measure == 'unique_customers':
+            customers = cube.distinct_customers(by)
+            result[measure] = customers.reindex(totals.index) if customers is not None else np.nan
+
+    # 스캔 결과와 같은 문자열 표기 (월: YYYY-MM, 주: 시작일/종료일)
+    return _stringify_periods(result)
+
+def _query_scan(df: pd.DataFrame, measures: List[str], by: List[str], where: Dict[str, Any]) -> pd.DataFrame:
+    rows = df
+    seller = where.get('seller')
+    if seller is not None and not isinstance(seller, (list, tuple, set)):
+        # 단일 셀러는 셀러 인덱스 구간에서 시작
+        rows = get_seller_index(df).get(seller)
+
+    if where:
+        mask = np.ones(len(rows), dtype=bool)
+        for dim, condition in where.items():
+            mask &= _condition_mask(dim, resolve_group_keys(rows, [dim])[0], condition)
+        rows = rows[mask]
+
+    keys = resolve_group_keys(rows, by) if by else [pd.Series(0, index=rows.index)]
+    table = calculate_grouped_kpis(rows, keys)
+    missing = [measure for measure in measures if measure not in table.columns]
+    if missing:
+        raise KeyError(f"알 수 없는 지표입니다: {missing} (사용 가능: {list(table.columns)})")
+
+    result = table[measures]
+    if not by:
+        result = result.reset_index(drop=True)
+    return result
+
+def _condition_mask(dim: str, values: pd.Series, condition) -> np.ndarray:
+    """차원 값이 조건에 맞는지 (값은 문자열로 비교, 범위는 date/hour만)"""
+    if isinstance(condition, tuple):
+        if dim not in _RANGE_DIMENSIONS or len(condition) != 2:
+            raise ValueError(f"범위 조건은 {_RANGE_DIMENSIONS} 차원에 (시작, 끝)으로만 지정할 수 있습니다: {dim}")
+        start, end = condition
+        if dim == 'date':
+            values = pd.to_datetime(values)
+            start = pd.to_datetime(start) if start is not None else None
+            end = pd.to_datetime(end) if end is not None else None
+        mask = values.notna()
+        if start is not None:
+            mask &= values >= start
+        if end is not None:
+            mask &= values <= end
+        return mask.to_numpy(dtype=bool)
+
+    if isinstance(condition, (list, set)):
+        return values.astype(str).isin([str(v) for v in condition]).to_numpy(dtype=bool)
+    return (values.notna() & (values.astype(str) == str(condition))).to_numpy(dtype=bool)
+
+def _stringify_periods(result: pd.DataFrame) -> pd.DataFrame:
+    if isinstance(result.index, pd.MultiIndex):
+        levels = [level.astype(str) if isinstance(level, pd.PeriodIndex) else level for level in result.index.levels]
+        result.index = result.index.set_levels(levels)
+    elif isinstance(result.index, pd.PeriodIndex):
+        result.index = result.index.astype(str)
+    return result
+
+def _check_seller(df: pd.DataFrame, seller) -> None:
+    """단일 셀러 조건이 데이터에 없는 셀러면 ValueError"""
+    if seller is None or isinstance(seller, (list, tuple, set)) or COL_SELLER not in df.columns:
+        return
+    if seller not in get_seller_index(df):
+        raise ValueError(f"셀러 '{seller}'의 데이터가 없습니다.")
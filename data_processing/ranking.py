@@ -0,0 +1,48 @@
+# data_processing/ranking.py
+"""순위 헬퍼 - 전체 정렬 없이 상위 K개 선택, 지표별 argsort 한 번으로 순위 행렬"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Sequence, Union
+
+def top_k(frame: pd.DataFrame, column: str, k: int) -> pd.DataFrame:
+    """column 내림차순 상위 k행 (nlargest 선택 후 k개만 정렬, 동률은 원래 순서, 값이 없는 행은 맨 뒤)"""
+    top = frame.nlargest(k, column)
+    if len(top) < min(k, len(frame)):
+        missing = frame[frame[column].isna()]
+        top = pd.concat([top, missing.head(k - len(top))])
+    return top
+
+def rank_matrix(frame: pd.DataFrame, columns: Sequence[str],
+                method: Union[str, Dict[str, str]] = 'average') -> pd.DataFrame:
+    """지표별 내림차순 순위 (1부터, 값이 없으면 NaN)
+
+    method: 'average'(동률은 평균 순위, Series.rank와 동일) 또는 'first'(동률은 원래 순서),
+    칼럼별로 다르게 하려면 {칼럼: 방식} (지정하지 않은 칼럼은 'average')
+    """
+    methods = method if isinstance(method, dict) else dict.fromkeys(columns, method)
+    for value in methods.values():
+        if value not in ('average', 'first'):
+            raise ValueError(f"지원하지 않는 순위 방식입니다: {value} (average, first)")
+
+    ranks = {}
+    for column in columns:
+        values = frame[column].to_numpy(dtype=float)
+        ranks[column] = _descending_ranks(values, methods.get(column, 'average'))
+    return pd.DataFrame(ranks, index=frame.index)
+
+def _descending_ranks(values: np.ndarray, method: str) -> np.ndarray:
+    missing = np.isnan(values)
+    order = np.argsort(-values, kind='stable')   # NaN은 맨 뒤
+    positions = np.arange(1, len(values) + 1, dtype=float)
+
+    if method == 'average':
+        ordered = values[order]
+        starts = np.r_[True, ordered[1:] != ordered[:-1]] if len(values) else np.zeros(0, dtype=bool)
+        groups = np.cumsum(starts) - 1
+        positions = (np.bincount(groups, weights=positions) / np.bincount(groups))[groups]
+
+    ranks = np.empty(len(values))
+    ranks[order] = positions
+    ranks[missing] = np.nan
+    return ranks
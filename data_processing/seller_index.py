@@ -0,0 +1,71 @@
+# data_processing/seller_index.py
+"""셀러 인덱스 - 셀러 코드로 한 번 argsort해 두고 셀러별 행 위치를 연속 구간으로 조회"""
+
+import weakref
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterator, List, Tuple
+from constants import COL_SELLER
+from .cache import FrameMemo
+
+# 프레임별 셀러 인덱스 (같은 프레임에 대한 반복 슬라이싱은 정렬 1회)
+_seller_index_memo = FrameMemo()
+
+class SellerIndex:
+    """셀러별 행 구간 인덱스 (셀러 안에서는 원래 행 순서 유지)
+
+    정렬된 사본 대신 셀러 코드 순 행 위치(argsort)와 셀러별 구간만 보관하고
+    조회 시 원본 프레임에서 해당 셀러 행만 take
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        codes, uniques = pd.factorize(df[COL_SELLER].astype(str))
+        # 셀러 코드 순 행 위치 (셀러가 비어 있는 행이 맨 앞)
+        self._order = np.argsort(codes, kind='stable')
+        # 인덱스는 프레임 메모에 보관되므로 원본은 약한 참조 (원본이 사라지면 인덱스도 제거)
+        self._frame = weakref.ref(df)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        stops = np.cumsum(counts) + int((codes < 0).sum())
+        self._bounds: Dict[str, Tuple[int, int]] = {
+            seller: (int(stop - count), int(stop))
+            for seller, count, stop in zip(uniques, counts, stops)
+        }
+
+    def __len__(self) -> int:
+        return len(self._bounds)
+
+    def __contains__(self, seller) -> bool:
+        return str(seller) in self._bounds
+
+    @property
+    def sellers(self) -> List[str]:
+        return list(self._bounds)
+
+    def get(self, seller) -> pd.DataFrame:
+        """셀러의 행 (원본 프레임에서 셀러 행만 take한 사본, 없는 셀러면 빈 프레임)"""
+        start, stop = self._bounds.get(str(seller), (0, 0))
+        return self._take(start, stop)
+
+    def size(self, seller) -> int:
+        """셀러의 행 수"""
+        start, stop = self._bounds.get(str(seller), (0, 0))
+        return stop - start
+
+    def items(self) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """(셀러명, 셀러 행) 순회"""
+        for seller, (start, stop) in self._bounds.items():
+            yield seller, self._take(start, stop)
+
+    def _take(self, start: int, stop: int) -> pd.DataFrame:
+        df = self._frame()
+        if df is None:
+            raise ValueError("셀러 인덱스의 원본 데이터가 해제되었습니다.")
+        return df.take(self._order[start:stop])
+
+def get_seller_index(df: pd.DataFrame) -> SellerIndex:
+    """프레임의 셀러 인덱스 (같은 프레임 객체면 재사용)"""
+    index = _seller_index_memo.get(df)
+    if index is None:
+        index = SellerIndex(df)
+        _seller_index_memo.put(df, index)
+    return index
@@ -1,7 +1,7 @@
 # data_processing/transformers/__init__.py
 """데이터 변환기 패키지"""
 
-from .datetime_transformer import to_datetime_safe
+from .datetime_transformer import to_datetime_safe, derive_ship_times, derive_delivery_times
 from .numeric_transformer import to_number_safe
 from .region_transformer import extract_region_from_address, standardize_sido
 from .category_transformer import (
@@ -9,15 +9,51 @@ from .category_transformer import (
     map_category_code_to_name, 
     apply_category_mapping
 )
+from .category_tree import (
+    CategoryTree,
+    CATEGORY_LEVEL_COLUMNS,
+    get_category_tree,
+    category_level_column,
+    apply_category_levels
+)
 from .customer_transformer import create_customer_id
+from .status_transformer import (
+    STATUS_FLAG_COLUMNS, CLAIM_FLAG_COLUMN, derive_status_flags, derive_claim_flag, status_flag,
+    claim_flag
+)
+from .registry import (
+    DerivedTransform, TRANSFORMS, ANALYZER_COLUMNS, STATUS_FLAGS, SHIP_COLUMNS, DELIVERY_COLUMNS,
+    required_columns, derive_columns
+)
 
 __all__ = [
     'to_datetime_safe',
+    'derive_ship_times',
+    'derive_delivery_times',
     'to_number_safe',
     'extract_region_from_address',
     'standardize_sido',
     'load_category_mapping',
     'map_category_code_to_name',
     'apply_category_mapping',
-    'create_customer_id'
+    'CategoryTree',
+    'CATEGORY_LEVEL_COLUMNS',
+    'get_category_tree',
+    'category_level_column',
+    'apply_category_levels',
+    'create_customer_id',
+    'STATUS_FLAG_COLUMNS',
+    'CLAIM_FLAG_COLUMN',
+    'derive_status_flags',
+    'derive_claim_flag',
+    'status_flag',
+    'claim_flag',
+    'DerivedTransform',
+    'TRANSFORMS',
+    'ANALYZER_COLUMNS',
+    'STATUS_FLAGS',
+    'SHIP_COLUMNS',
+    'DELIVERY_COLUMNS',
+    'required_columns',
+    'derive_columns'
 ]
\ No newline at end of file
@@ -1,20 +1,43 @@
 # data_processing/transformers/category_transformer.py
 """카테고리 매핑 변환기"""
 
+import os
+import pickle
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from pathlib import Path
 
 # 전역 카테고리 매핑 캐시
 _category_mapping_cache = None
 
+# 카테고리 코드는 4자리 단위 계층 (예: 0001 / 00010001 / ...)
+CODE_SEGMENT_LENGTH = 4
+MAPPING_PICKLE_VERSION = 2
+
 def load_category_mapping(csv_path: Optional[str] = None) -> Dict[str, str]:
-    """카테고리 매핑 파일 로드 및 캐시"""
+    """카테고리 매핑 파일 로드 및 캐시
+    
+    Code는 문자열로 읽어 앞자리 0을 보존하고, CSV 옆에 pickle 사본을 두어 재사용
+    """
     global _category_mapping_cache
     
     if _category_mapping_cache is not None:
         return _category_mapping_cache
     
+    table = load_category_table(csv_path)
+    if table is None:
+        _category_mapping_cache = {}
+        return _category_mapping_cache
+    
+    # Code -> Name 매핑 딕셔너리 생성 (중복 코드는 마지막 행 우선)
+    mapping = dict(zip(table['Code'], table['Name']))
+    _category_mapping_cache = mapping
+    print(f"✅ 카테고리 매핑 로드 완료: {len(mapping):,}개")
+    return mapping
+
+def load_category_table(csv_path: Optional[str] = None) -> Optional[pd.DataFrame]:
+    """카테고리 CSV의 Code/Name/Depth 테이블 로드 (없거나 실패하면 None)"""
     # 경로 우선순위: 1) 파라미터 2) 설정파일
     if csv_path is None:
         try:
@@ -26,29 +49,25 @@ def load_category_mapping(csv_path: Optional[str] = None) -> Dict[str, str]:
     if csv_path is None or not Path(csv_path).exists():
         print(f"⚠️ 카테고리 매핑 파일을 찾을 수 없음: {csv_path}")
         print(f"    config.py에서 CATEGORY_MAPPING_PATH를 확인하세요.")
-        _category_mapping_cache = {}
-        return _category_mapping_cache
+        return None
     
     try:
-        # CSV 파일 로드
-        df = pd.read_csv(csv_path, encoding='utf-8')
-        
-        # Code -> Name 매핑 딕셔너리 생성
-        mapping = {}
-        for _, row in df.iterrows():
-            code = str(row['Code']).strip()
-            name = str(row['Name']).strip()
-            if code and name and code != 'nan' and name != 'nan':
-                mapping[code] = name
-        
-        _category_mapping_cache = mapping
-        print(f"✅ 카테고리 매핑 로드 완료: {len(mapping):,}개")
-        return mapping
+        table = _load_mapping_pickle(csv_path)
+        if table is None:
+            # CSV 파일 로드 (Code/Name은 문자열로)
+            df = pd.read_csv(csv_path, encoding='utf-8', dtype={'Code': str, 'Name': str})
+            codes = df['Code'].str.strip()
+            names = df['Name'].str.strip()
+            valid = codes.notna() & names.notna() & (codes != '') & (names != '')
+            table = pd.DataFrame({'Code': codes[valid], 'Name': names[valid]}).reset_index(drop=True)
+            # 깊이는 4자리 세그먼트 수 기준
+            table['Depth'] = (table['Code'].str.len() // CODE_SEGMENT_LENGTH).astype('int8')
+            _save_mapping_pickle(csv_path, table)
+        return table
         
     except Exception as e:
         print(f"⚠️ 카테고리 매핑 파일 로드 실패: {e}")
-        _category_mapping_cache = {}
-        return _category_mapping_cache
+        return None
 
 def map_category_code_to_name(category_code, mapping: Optional[Dict[str, str]] = None) -> str:
     """카테고리 코드를 한글명으로 변환"""
@@ -61,22 +80,84 @@ def map_category_code_to_name(category_code, mapping: Optional[Dict[str, str]] =
         mapping = load_category_mapping()
     
     # 코드를 문자열로 변환 (소수점 제거)
-    if isinstance(category_code, float):
-        code_str = str(int(category_code))
-    else:
-        code_str = str(category_code).strip()
+    code_str = _normalize_code(category_code)
     
-    # 매핑에서 찾기
-    if code_str in mapping:
-        return mapping[code_str]
+    # 매핑에서 찾기 (숫자로 읽혀 사라진 앞자리 0 복원)
+    name = mapping.get(_pad_code(code_str))
+    if name is not None:
+        return name
     
     # 매핑에서 찾지 못한 경우 원본 반환
     return f"미분류_{code_str}"
 
 def apply_category_mapping(category_series: pd.Series) -> pd.Series:
-    """카테고리 Series에 매핑 적용"""
+    """카테고리 Series에 매핑 적용
+    
+    고유 코드만 매핑한 뒤 factorize 코드로 전체 행에 펼쳐 categorical로 반환
+    """
     mapping = load_category_mapping()
     if not mapping:
         return category_series
     
-    return category_series.apply(lambda x: map_category_code_to_name(x, mapping))
\ No newline at end of file
+    codes, uniques = pd.factorize(category_series)
+    unique_names = pd.Series([map_category_code_to_name(code, mapping) for code in uniques], dtype="str")
+    
+    name_codes, names = pd.factorize(unique_names, sort=True)
+    row_codes = np.full(len(category_series), -1, dtype=name_codes.dtype)
+    found = codes >= 0
+    row_codes[found] = name_codes[codes[found]]
+    
+    return pd.Series(pd.Categorical.from_codes(row_codes, categories=names), index=category_series.index)
+
+def normalize_category_codes(uniques) -> List[str]:
+    """고유 카테고리 코드들을 CSV 형식(4자리 단위, 앞자리 0 포함) 문자열로"""
+    return [_pad_code(_normalize_code(code)) for code in uniques]
+
+def _normalize_code(category_code) -> str:
+    """엑셀 float 코드(1000100060001.0) 등을 문자열 코드로"""
+    if isinstance(category_code, (float, np.floating)) and float(category_code).is_integer():
+        return str(int(category_code))
+    return str(category_code).strip()
+
+def _pad_code(code_str: str) -> str:
+    """앞자리 0이 빠진 숫자 코드를 4자리 단위 길이로 복원"""
+    if not code_str.isdigit():
+        return code_str
+    width = -(-len(code_str) // CODE_SEGMENT_LENGTH) * CODE_SEGMENT_LENGTH
+    return code_str.zfill(width)
+
+def _mapping_pickle_path(csv_path: str) -> Path:
+    """CSV 옆에 두는 매핑 pickle 경로"""
+    csv_path = Path(csv_path)
+    return csv_path.with_name(f"{csv_path.stem}.mapping.pkl")
+
+def _load_mapping_pickle(csv_path: str) -> Optional[pd.DataFrame]:
+    """CSV가 바뀌지 않았으면 pickle 사본에서 카테고리 테이블 로드"""
+    pickle_path = _mapping_pickle_path(csv_path)
+    if not pickle_path.exists():
+        return None
+    try:
+        with open(pickle_path, 'rb') as f:
+            payload = pickle.load(f)
+        stat = os.stat(csv_path)
+        if (payload.get('version') == MAPPING_PICKLE_VERSION
+                and payload.get('size') == stat.st_size
+                and payload.get('mtime_ns') == stat.st_mtime_ns):
+            return payload['table']
+    except Exception as e:
+        print(f"⚠️ 카테고리 매핑 캐시 로드 실패: {e}")
+    return None
+
+def _save_mapping_pickle(csv_path: str, table: pd.DataFrame) -> None:
+    """카테고리 테이블을 CSV 옆 pickle로 저장 (실패해도 무시)"""
+    pickle_path = _mapping_pickle_path(csv_path)
+    stat = os.stat(csv_path)
+    payload = {'version': MAPPING_PICKLE_VERSION, 'size': stat.st_size,
+               'mtime_ns': stat.st_mtime_ns, 'table': table}
+    try:
+        tmp_path = pickle_path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, pickle_path)
+    except Exception as e:
+        print(f"⚠️ 카테고리 매핑 캐시 저장 실패: {e}")
@@ -0,0 +1,114 @@
+# data_processing/transformers/category_tree.py
+"""카테고리 계층 트리 - 노드별 부모/조상 배열을 미리 계산하여 깊이별 집계 지원"""
+
+import numpy as np
+import pandas as pd
+from typing import Optional, List
+from .category_transformer import load_category_table, normalize_category_codes, CODE_SEGMENT_LENGTH
+
+# 카테고리 최대 깊이 (대/중/소/세)
+MAX_CATEGORY_DEPTH = 4
+
+# 깊이별 카테고리 노드 ID 칼럼
+CATEGORY_LEVEL_COLUMNS = [f"__category_l{level}__" for level in range(1, MAX_CATEGORY_DEPTH + 1)]
+
+# 전역 카테고리 트리 캐시
+_category_tree_cache = None
+
+class CategoryTree:
+    """카테고리 코드 트리 (노드 ID = 코드 정렬 순서)"""
+
+    def __init__(self, table: pd.DataFrame):
+        # 중복 코드는 마지막 행 우선 (매핑 딕셔너리와 동일)
+        table = table.drop_duplicates('Code', keep='last').sort_values('Code').reset_index(drop=True)
+
+        self.codes = table['Code'].to_numpy(dtype=object)
+        self.names = table['Name'].to_numpy(dtype=object)
+        self.depth = table['Depth'].to_numpy(dtype='int8')
+        self.code_index = dict(zip(self.codes, range(len(self.codes))))
+
+        # ancestors[i, d-1] = 노드 i의 d단계 조상 ID (자기 자신 포함, 없으면 -1)
+        codes = table['Code']
+        self.ancestors = np.full((len(table), MAX_CATEGORY_DEPTH), -1, dtype='int32')
+        for level in range(1, MAX_CATEGORY_DEPTH + 1):
+            prefix_ids = codes.str[:level * CODE_SEGMENT_LENGTH].map(self.code_index)
+            has_level = (self.depth >= level) & prefix_ids.notna().to_numpy()
+            self.ancestors[has_level, level - 1] = prefix_ids[has_level].astype('int32')
+
+        # parent[i] = 바로 위 단계 조상 ID (최상위는 -1)
+        self.parent = np.full(len(table), -1, dtype='int32')
+        has_parent = self.depth > 1
+        self.parent[has_parent] = self.ancestors[has_parent, self.depth[has_parent] - 2]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def node_ids(self, category_series: pd.Series) -> np.ndarray:
+        """행별 카테고리 노드 ID (트리에 없는 코드는 가장 깊은 상위 노드, 그것도 없으면 -1)"""
+        codes, uniques = pd.factorize(category_series)
+        unique_ids = np.array([self._deepest_known(code) for code in normalize_category_codes(uniques)],
+                              dtype='int32')
+        row_ids = np.full(len(category_series), -1, dtype='int32')
+        found = codes >= 0
+        row_ids[found] = unique_ids[codes[found]]
+        return row_ids
+
+    def level_frame(self, category_series: pd.Series) -> pd.DataFrame:
+        """__category_l1__ ~ __category_l4__ 정수 코드 칼럼 (없는 단계는 NA)"""
+        row_ids = self.node_ids(category_series)
+        levels = self.ancestors[row_ids]
+        levels[row_ids < 0] = -1
+        return pd.DataFrame({
+            col: pd.arrays.IntegerArray(levels[:, i], levels[:, i] < 0)
+            for i, col in enumerate(CATEGORY_LEVEL_COLUMNS)
+        }, index=category_series.index)
+
+    def find(self, category) -> List[int]:
+        """노드 ID / 코드 / 카테고리명으로 노드 ID 목록 조회"""
+        if category is None:
+            return []
+        if isinstance(category, (int, np.integer)) and 0 <= category < len(self):
+            return [int(category)]
+        code = normalize_category_codes([category])[0]
+        if code in self.code_index:
+            return [self.code_index[code]]
+        return np.flatnonzero(self.names == str(category)).tolist()
+
+    def name_of(self, node_ids) -> np.ndarray:
+        """노드 ID 배열을 카테고리명으로"""
+        return self.names[np.asarray(node_ids, dtype='int64')]
+
+    def children(self, node_id: int) -> np.ndarray:
+        """직계 하위 노드 ID"""
+        return np.flatnonzero(self.parent == node_id)
+
+    def _deepest_known(self, code: str) -> int:
+        """코드 자신 또는 트리에 있는 가장 깊은 상위 코드의 노드 ID"""
+        for level in range(min(len(code) // CODE_SEGMENT_LENGTH, MAX_CATEGORY_DEPTH), 0, -1):
+            node_id = self.code_index.get(code[:level * CODE_SEGMENT_LENGTH])
+            if node_id is not None:
+                return node_id
+        return -1
+
+def get_category_tree(csv_path: Optional[str] = None) -> Optional[CategoryTree]:
+    """카테고리 트리 로드 및 캐시 (매핑 파일이 없으면 None)"""
+    global _category_tree_cache
+
+    if _category_tree_cache is None:
+        table = load_category_table(csv_path)
+        _category_tree_cache = CategoryTree(table) if table is not None else False
+
+    return _category_tree_cache if _category_tree_cache is not False else None
+
+def category_level_column(level: int) -> str:
+    """깊이(1~4)에 해당하는 카테고리 칼럼명"""
+    if not 1 <= level <= MAX_CATEGORY_DEPTH:
+        raise ValueError(f"카테고리 깊이는 1~{MAX_CATEGORY_DEPTH} 사이여야 합니다: {level}")
+    return CATEGORY_LEVEL_COLUMNS[level - 1]
+
+def apply_category_levels(category_series: pd.Series) -> pd.DataFrame:
+    """카테고리 Series에 깊이별 노드 ID 칼럼 생성 (트리가 없으면 빈 DataFrame)"""
+    tree = get_category_tree()
+    if tree is None:
+        return pd.DataFrame(index=category_series.index)
+    return tree.level_frame(category_series)
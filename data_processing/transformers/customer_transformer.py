@@ -2,23 +2,44 @@
 """고객 식별 변환기"""
 
 import pandas as pd
+import numpy as np
 import hashlib
+from typing import Optional
 
-def create_customer_id(name_series: pd.Series, phone_series: pd.Series) -> pd.Series:
-    """구매자명 + 전화번호로 고유 고객 ID 생성"""
-    def make_customer_id(name, phone):
-        if pd.isna(name) or pd.isna(phone):
-            return None
-        
-        # 전화번호 정규화 (하이픈, 공백 제거)
-        clean_phone = str(phone).replace('-', '').replace(' ', '').replace('(', '').replace(')', '')
-        clean_name = str(name).strip()
-        
-        if not clean_name or not clean_phone:
-            return None
-            
-        # 이름+전화번호 조합으로 해시 생성
-        combined = f"{clean_name}_{clean_phone}"
-        return hashlib.md5(combined.encode('utf-8')).hexdigest()[:12]
-    
-    return pd.Series([make_customer_id(name, phone) for name, phone in zip(name_series, phone_series)])
\ No newline at end of file
+def create_customer_id(name_series: pd.Series, phone_series: pd.Series,
+                       fast_hash: Optional[bool] = None) -> pd.Series:
+    """구매자명 + 전화번호로 고유 고객 ID 생성
+
+    고유한 (이름, 전화번호) 조합마다 한 번만 해시한 뒤 factorize 코드로 전체 행에 매핑.
+    fast_hash=True면 md5 12자리 대신 64비트 비암호화 해시(UInt64)를 사용 (None이면 config 설정)
+    """
+    if fast_hash is None:
+        try:
+            from config import CONFIG
+            fast_hash = bool(CONFIG.get("FAST_CUSTOMER_ID", False))
+        except:
+            fast_hash = False
+
+    # 이름 공백 제거, 전화번호 정규화 (하이픈, 공백, 괄호 제거)
+    valid = name_series.notna() & phone_series.notna()
+    clean_name = name_series[valid].astype(str).str.strip()
+    clean_phone = phone_series[valid].astype(str).str.replace(r"[- ()]", "", regex=True)
+
+    non_empty = (clean_name != "") & (clean_phone != "")
+    combined = (clean_name + "_" + clean_phone)[non_empty]
+
+    # 고유 조합만 해시하고 factorize 코드로 원래 행 위치에 매핑
+    codes, uniques = pd.factorize(combined)
+    positions = np.flatnonzero(valid.to_numpy())[non_empty.to_numpy()]
+
+    if fast_hash:
+        values = np.zeros(len(name_series), dtype="uint64")
+        missing = np.ones(len(name_series), dtype=bool)
+        values[positions] = pd.util.hash_array(np.asarray(uniques, dtype=object))[codes]
+        missing[positions] = False
+        return pd.Series(pd.arrays.IntegerArray(values, missing), index=name_series.index)
+
+    hashed = np.array([hashlib.md5(u.encode('utf-8')).hexdigest()[:12] for u in uniques], dtype=object)
+    values = np.full(len(name_series), None, dtype=object)
+    values[positions] = hashed[codes]
+    return pd.Series(values, index=name_series.index)
@@ -5,4 +5,20 @@ import pandas as pd
 
 def to_datetime_safe(s: pd.Series) -> pd.Series:
     """안전한 날짜 변환"""
-    return pd.to_datetime(s, errors="coerce")
\ No newline at end of file
+    return pd.to_datetime(s, errors="coerce")
+
+def derive_ship_times(ship_date: pd.Series, dt: pd.Series) -> pd.DataFrame:
+    """발송처리일 파싱 + 결제 → 발송 소요일 (__ship_dt__, __ship_lead_days__)"""
+    ship_dt = to_datetime_safe(ship_date)
+    return pd.DataFrame({
+        "__ship_dt__": ship_dt,
+        "__ship_lead_days__": (ship_dt - dt).dt.total_seconds() / 86400.0,
+    })
+
+def derive_delivery_times(delivered_date: pd.Series, ship_dt: pd.Series) -> pd.DataFrame:
+    """배송완료일 파싱 + 발송 → 배송완료 소요일 (__delivered_dt__, __delivery_days__)"""
+    delivered_dt = to_datetime_safe(delivered_date)
+    return pd.DataFrame({
+        "__delivered_dt__": delivered_dt,
+        "__delivery_days__": (delivered_dt - ship_dt).dt.total_seconds() / 86400.0,
+    })
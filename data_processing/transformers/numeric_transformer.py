@@ -5,4 +5,6 @@ import pandas as pd
 
 def to_number_safe(s: pd.Series) -> pd.Series:
     """안전한 숫자 변환"""
+    if pd.api.types.is_numeric_dtype(s):
+        return pd.to_numeric(s, errors="coerce")
     return pd.to_numeric(s.astype(str).str.replace(r"[^0-9\.-]", "", regex=True), errors="coerce")
\ No newline at end of file
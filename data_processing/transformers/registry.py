@@ -0,0 +1,153 @@
+# data_processing/transformers/registry.py
+"""파생 칼럼 변환 레지스트리 - 파생 칼럼별 원본 칼럼과 벡터화 함수 선언"""
+
+import pandas as pd
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+from constants import (
+    COL_PAYMENT_DATE, COL_ORDER_AMOUNT, COL_QTY, COL_BUYER_NAME, COL_BUYER_PHONE,
+    COL_CUSTOMER, COL_ADDRESS, COL_CATEGORY, COL_SHIP_DATE, COL_DELIVERED_DATE,
+    COL_STATUS, COL_REFUND_FIELD
+)
+from .datetime_transformer import to_datetime_safe, derive_ship_times, derive_delivery_times
+from .numeric_transformer import to_number_safe
+from .customer_transformer import create_customer_id
+from .region_transformer import extract_region_from_address
+from .status_transformer import (
+    STATUS_FLAG_COLUMNS, CLAIM_FLAG_COLUMN, derive_status_flags, derive_claim_flag
+)
+from .category_transformer import apply_category_mapping
+from .category_tree import apply_category_levels, CATEGORY_LEVEL_COLUMNS
+
+# 기본값이 없는 변환 (원본 칼럼이 없으면 파생 칼럼도 만들지 않음)
+_NO_DEFAULT = object()
+
+class DerivedTransform:
+    """파생 칼럼 정의 - 원본 칼럼 조합(rule)을 순서대로 시도하고 없으면 기본값"""
+
+    def __init__(self, outputs: Sequence[str], rules: List[tuple], default=_NO_DEFAULT,
+                 pushdown: bool = False):
+        self.outputs = list(outputs)
+        self.rules = rules          # [(원본 칼럼 목록, 함수), ...]
+        self.default = default
+        self.pushdown = pushdown    # 행 필터 전에 계산 (필터 조건에 쓰이는 칼럼)
+
+    @property
+    def sources(self) -> List[str]:
+        """이 변환이 읽을 수 있는 모든 원본 칼럼"""
+        sources = []
+        for cols, _ in self.rules:
+            sources.extend(col for col in cols if col not in sources)
+        return sources
+
+    def compute(self, df: pd.DataFrame) -> Dict[str, object]:
+        """적용 가능한 첫 rule로 파생 칼럼 계산 (칼럼명 → 값)"""
+        for cols, func in self.rules:
+            if all(col in df.columns for col in cols):
+                result = func(*(df[col] for col in cols))
+                if isinstance(result, pd.DataFrame):
+                    return {col: result[col] for col in result.columns}
+                return {self.outputs[0]: result}
+        if self.default is _NO_DEFAULT:
+            return {}
+        return {col: self.default for col in self.outputs}
+
+# 상태 플래그 파생 칼럼
+STATUS_FLAGS = list(STATUS_FLAG_COLUMNS.values())
+
+# 배송 파생 칼럼
+SHIP_COLUMNS = ["__ship_dt__", "__ship_lead_days__"]
+DELIVERY_COLUMNS = ["__delivered_dt__", "__delivery_days__"]
+
+# 파생 칼럼 레지스트리 (선언 순서대로 계산)
+TRANSFORMS: List[DerivedTransform] = [
+    # 기본 데이터 변환
+    DerivedTransform(["__dt__"], [([COL_PAYMENT_DATE], to_datetime_safe)], pushdown=True),
+    DerivedTransform(["__amount__"], [([COL_ORDER_AMOUNT], to_number_safe)], pushdown=True),
+    DerivedTransform(["__qty__"], [([COL_QTY], to_number_safe)], default=1),
+
+    # 주문 상태/클레임 플래그 (상태 문자열 비교는 여기서 한 번만)
+    DerivedTransform(STATUS_FLAGS, [([COL_STATUS], derive_status_flags)]),
+    DerivedTransform([CLAIM_FLAG_COLUMN], [([COL_REFUND_FIELD], derive_claim_flag)]),
+
+    # 발송/배송완료 시각과 소요일 (지표/분석기마다 다시 파싱하지 않도록 한 번만)
+    DerivedTransform(SHIP_COLUMNS, [([COL_SHIP_DATE, "__dt__"], derive_ship_times)]),
+    DerivedTransform(DELIVERY_COLUMNS, [([COL_DELIVERED_DATE, "__ship_dt__"], derive_delivery_times)]),
+
+    # 고객 식별 ID
+    DerivedTransform(["__customer_id__"], [
+        ([COL_BUYER_NAME, COL_BUYER_PHONE], create_customer_id),
+        ([COL_CUSTOMER], lambda s: s.astype(str)),
+    ], default=None),
+
+    # 지역 / 카테고리
+    DerivedTransform(["__region__"], [([COL_ADDRESS], extract_region_from_address)]),
+    DerivedTransform(["__category_mapped__"], [([COL_CATEGORY], apply_category_mapping)]),
+    DerivedTransform(CATEGORY_LEVEL_COLUMNS, [([COL_CATEGORY], apply_category_levels)]),
+]
+
+# 분석기별로 읽는 파생 칼럼
+ANALYZER_COLUMNS: Dict[str, List[str]] = {
+    "channel": ["__amount__", "__is_cancelled__"],
+    "product": ["__amount__", "__qty__", "__is_cancelled__"],
+    "category": ["__amount__", "__category_mapped__", *CATEGORY_LEVEL_COLUMNS],
+    "region": ["__amount__", "__region__"],
+    "time": ["__dt__", "__amount__"],
+    "status": [*STATUS_FLAGS, CLAIM_FLAG_COLUMN],
+    "sales": ["__amount__", "__qty__"],
+    "customer": ["__amount__", "__customer_id__", "__region__"],
+    "operational": ["__dt__", *STATUS_FLAGS, CLAIM_FLAG_COLUMN, *SHIP_COLUMNS, *DELIVERY_COLUMNS],
+    "benchmark": ["__amount__", "__qty__", "__customer_id__", "__category_mapped__", *CATEGORY_LEVEL_COLUMNS,
+                  *STATUS_FLAGS, CLAIM_FLAG_COLUMN, *SHIP_COLUMNS, *DELIVERY_COLUMNS],
+}
+
+# 유효성 검사에 항상 필요한 파생 칼럼
+REQUIRED_COLUMNS = ["__dt__", "__amount__"]
+
+def required_columns(analyzers: Optional[Iterable[str]] = None) -> Optional[List[str]]:
+    """요청한 분석기들이 읽는 파생 칼럼 목록 (None이면 전체)"""
+    if analyzers is None:
+        return None
+
+    columns = list(REQUIRED_COLUMNS)
+    for name in analyzers:
+        if name not in ANALYZER_COLUMNS:
+            raise KeyError(f"알 수 없는 분석기입니다: {name} (사용 가능: {list(ANALYZER_COLUMNS)})")
+        columns.extend(col for col in ANALYZER_COLUMNS[name] if col not in columns)
+    return columns
+
+def derive_columns(df: pd.DataFrame, analyzers: Optional[Iterable[str]] = None,
+                   keep_columns: Optional[Sequence[str]] = None,
+                   row_filter: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None) -> pd.DataFrame:
+    """레지스트리의 파생 칼럼을 한 번에 계산하여 원본 칼럼과 함께 반환
+
+    analyzers를 주면 해당 분석기가 읽는 파생 칼럼만 계산하고,
+    keep_columns를 주면 원본 칼럼은 그 중 존재하는 것만 유지 (전체 복사 없이 칼럼 선택).
+    row_filter는 pushdown 칼럼(__dt__, __amount__)만 계산된 상태에서 적용되어
+    나머지 변환은 남은 행에 대해서만 수행
+    """
+    wanted = required_columns(analyzers)
+    transforms = [t for t in TRANSFORMS
+                  if wanted is None or any(col in wanted for col in t.outputs)]
+
+    if keep_columns is None:
+        result = df.copy(deep=False)
+    else:
+        result = df[[col for col in keep_columns if col in df.columns]]
+
+    for transform in transforms:
+        if transform.pushdown:
+            result = _assign(result, transform.compute(result))
+
+    if row_filter is not None:
+        result = row_filter(result)
+
+    for transform in transforms:
+        if not transform.pushdown:
+            result = _assign(result, transform.compute(result))
+
+    return result
+
+def _assign(result: pd.DataFrame, columns: Dict[str, object]) -> pd.DataFrame:
+    for col, values in columns.items():
+        result[col] = values
+    return result
@@ -0,0 +1,47 @@
+# data_processing/transformers/status_transformer.py
+"""주문 상태/클레임 플래그 변환기 - 상태 문자열 비교를 변환 단계에서 한 번만"""
+
+import numpy as np
+import pandas as pd
+from constants import COL_STATUS, COL_REFUND_FIELD, REFUND_REGEX_OPEN
+
+# 주문 상태 → 플래그 칼럼
+STATUS_FLAG_COLUMNS = {
+    '결제취소': '__is_cancelled__',
+    '배송완료': '__is_delivered__',
+    '배송지연': '__is_delayed__',
+    '반품': '__is_returned__',
+    '교환': '__is_exchanged__',
+}
+
+# 클레임 칼럼이 환불/취소/반품 키워드를 포함하는 주문
+CLAIM_FLAG_COLUMN = '__is_claim__'
+
+def derive_status_flags(status: pd.Series) -> pd.DataFrame:
+    """주문 상태를 범주형 코드로 한 번 인코딩한 뒤 상태별 bool 플래그 (상태가 없으면 False)"""
+    status = status.astype('category')
+    codes = status.cat.codes.to_numpy()
+    categories = status.cat.categories.astype(str)
+    flags = {col: np.isin(codes, np.flatnonzero(categories == value))
+             for value, col in STATUS_FLAG_COLUMNS.items()}
+    return pd.DataFrame(flags, index=status.index)
+
+def derive_claim_flag(claim: pd.Series) -> pd.Series:
+    """클레임 내용이 환불/취소/반품 키워드를 포함하는지 (고유 값에만 정규식 적용, 비어 있으면 False)"""
+    codes, uniques = pd.factorize(claim)
+    matched = pd.Series(uniques.astype(str)).str.contains(REFUND_REGEX_OPEN, case=False, regex=True)
+    lookup = np.append(matched.to_numpy(dtype=bool), False)   # 코드 -1 → 마지막 False
+    return pd.Series(lookup[codes], index=claim.index)
+
+def status_flag(df: pd.DataFrame, status: str) -> pd.Series:
+    """주문 상태 플래그 (변환 단계 플래그 칼럼, 없으면 상태 칼럼과 비교)"""
+    col = STATUS_FLAG_COLUMNS.get(status)
+    if col is not None and col in df.columns:
+        return df[col]
+    return df[COL_STATUS] == status
+
+def claim_flag(df: pd.DataFrame) -> pd.Series:
+    """환불/취소/반품 클레임 플래그 (변환 단계 플래그 칼럼, 없으면 클레임 칼럼에서 계산)"""
+    if CLAIM_FLAG_COLUMN in df.columns:
+        return df[CLAIM_FLAG_COLUMN]
+    return derive_claim_flag(df[COL_REFUND_FIELD])
@@ -2,12 +2,11 @@
 """데이터 검증 및 전처리 모듈 - import 경로 수정"""
 
 import pandas as pd
-from typing import Optional
+from typing import List, Optional
 from constants import *
-from .transformers import (
-    to_datetime_safe, to_number_safe, create_customer_id, 
-    extract_region_from_address, apply_category_mapping
-)
+from .transformers.registry import derive_columns
+from .seller_index import get_seller_index
+from .cube import register_slice
 
 def validate_dataframe(df: pd.DataFrame) -> None:
     """데이터프레임 유효성 검사"""
@@ -19,41 +18,22 @@ def validate_dataframe(df: pd.DataFrame) -> None:
     if missing_cols:
         raise KeyError(f"필수 컬럼이 없습니다: {missing_cols}")
 
-def prepare_dataframe(df: pd.DataFrame, start: Optional[str], end: Optional[str]) -> pd.DataFrame:
-    """데이터프레임 전처리"""
-    validate_dataframe(df)
-    
-    # 필요한 컬럼만 선택
-    needed_cols = [COL_PAYMENT_DATE, COL_ORDER_AMOUNT, COL_SELLER, COL_CHANNEL, 
-                   COL_QTY, COL_STATUS, COL_REFUND_FIELD, COL_SHIP_DATE, 
-                   COL_DELIVERED_DATE, COL_CUSTOMER, COL_ITEM_NAME, COL_ORDER_ID,
-                   COL_BUYER_NAME, COL_BUYER_PHONE, COL_ADDRESS, COL_POSTAL_CODE,
-                   COL_CATEGORY, COL_SETTLEMENT, COL_PRODUCT_PRICE]
-    available_cols = [col for col in needed_cols if col in df.columns]
+def prepare_dataframe(df: pd.DataFrame, start: Optional[str], end: Optional[str],
+                      analyzers: Optional[List[str]] = None,
+                      sellers: Optional[List[str]] = None) -> pd.DataFrame:
+    """데이터프레임 전처리 (analyzers를 주면 해당 분석기가 읽는 파생 칼럼만 계산)
     
-    dfp = df[available_cols].copy()
+    결제일/금액만 먼저 변환해 유효성·기간·셀러 필터를 적용한 뒤 남은 행에 나머지 변환 수행
+    """
+    validate_dataframe(df)
     
-    # 기본 데이터 변환
-    dfp["__dt__"] = to_datetime_safe(dfp[COL_PAYMENT_DATE])
-    dfp["__amount__"] = to_number_safe(dfp[COL_ORDER_AMOUNT])
-    dfp["__qty__"] = to_number_safe(dfp[COL_QTY]) if COL_QTY in dfp.columns else 1
-
-    # 고객 식별 ID 생성
-    if COL_BUYER_NAME in dfp.columns and COL_BUYER_PHONE in dfp.columns:
-        dfp["__customer_id__"] = create_customer_id(dfp[COL_BUYER_NAME], dfp[COL_BUYER_PHONE])
-    elif COL_CUSTOMER in dfp.columns:
-        dfp["__customer_id__"] = dfp[COL_CUSTOMER].astype(str)
-    else:
-        dfp["__customer_id__"] = None
-
-    # 지역 정보 추출
-    if COL_ADDRESS in dfp.columns:
-        dfp["__region__"] = extract_region_from_address(dfp[COL_ADDRESS])
-
-    # 카테고리 매핑 적용
-    if COL_CATEGORY in dfp.columns:
-        dfp["__category_mapped__"] = apply_category_mapping(dfp[COL_CATEGORY])
+    # 필요한 컬럼만 선택 + 필터 후 파생 칼럼 계산
+    return derive_columns(df, analyzers, keep_columns=ANALYSIS_COLUMNS,
+                          row_filter=lambda dfp: filter_valid_period(dfp, start, end, sellers))
 
+def filter_valid_period(dfp: pd.DataFrame, start: Optional[str], end: Optional[str],
+                        sellers: Optional[List[str]] = None) -> pd.DataFrame:
+    """유효 데이터(결제일/금액 존재) + 기간 필터 (+ 셀러 필터)"""
     # 유효 데이터만
     dfp = dfp[dfp["__dt__"].notna() & dfp["__amount__"].notna()]
     if dfp.empty:
@@ -63,14 +43,20 @@ def prepare_dataframe(df: pd.DataFrame, start: Optional[str], end: Optional[str]
     if start: dfp = dfp[dfp["__dt__"] >= pd.to_datetime(start)]
     if end:   dfp = dfp[dfp["__dt__"] < pd.to_datetime(end) + pd.to_timedelta(1, "D")]
 
+    # 셀러 필터
+    if sellers and COL_SELLER in dfp.columns:
+        dfp = dfp[dfp[COL_SELLER].astype(str).isin([str(s) for s in sellers])]
+
     return dfp
 
 def slice_by_seller(df: pd.DataFrame, seller_name: Optional[str]) -> pd.DataFrame:
-    """셀러별 데이터 슬라이싱"""
+    """셀러별 데이터 슬라이싱 (프레임별 셀러 인덱스로 조회, 여러 셀러를 잘라도 정렬 1회)"""
     if seller_name and COL_SELLER in df.columns:
-        filtered = df[df[COL_SELLER].astype(str) == str(seller_name)].copy()
+        filtered = get_seller_index(df).get(seller_name)
         if filtered.empty:
             raise ValueError(f"셀러 '{seller_name}'의 데이터가 없습니다.")
+        # 셀러 집계 큐브는 전체 데이터 큐브에서 잘라냄
+        register_slice(df, filtered, seller=str(seller_name))
         return filtered
     return df.copy()
 
@@ -78,4 +64,22 @@ def safe_divide(a, b):
     """안전한 나누기"""
     if b == 0 or pd.isna(b):
         return float("nan")
-    return a / b
\ No newline at end of file
+    return a / b
+
+def concat_preserving_categories(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """카테고리 칼럼의 범주를 합친 뒤 병합 (병합 후에도 category 타입 유지, 입력 프레임은 변경하지 않음)"""
+    frames = [f for f in frames if f is not None]
+    if not frames:
+        return pd.DataFrame()
+    
+    unified = {}
+    for col in frames[0].columns:
+        series = [f[col] for f in frames if col in f.columns]
+        if len(series) != len(frames) or not all(isinstance(s.dtype, pd.CategoricalDtype) for s in series):
+            continue
+        unified[col] = pd.api.types.union_categoricals(series).categories
+    
+    if unified:
+        frames = [f.assign(**{col: f[col].cat.set_categories(categories) for col, categories in unified.items()})
+                  for f in frames]
+    return pd.concat(frames, ignore_index=True)
\ No newline at end of file
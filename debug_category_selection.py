@@ -6,7 +6,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config import CONFIG
-from file_manager import load_excel_data
+from file_manager import load_order_data
 from data_processing import prepare_dataframe, slice_by_seller
 from utils import format_currency
 
@@ -14,6 +14,7 @@ def get_available_sellers(overall_data):
     """전체 데이터에서 사용 가능한 셀러 목록 반환"""
     if '입점사명' in overall_data.columns:
         sellers = overall_data['입점사명'].value_counts()
+        sellers = sellers[sellers > 0]
         return sellers.to_dict()
     return {}
 
@@ -24,7 +25,7 @@ def debug_category_selection(seller_name=None):
     print("=" * 60)
     
     # 데이터 로드
-    df = load_excel_data(CONFIG["INPUT_XLSX"])
+    df = load_order_data(CONFIG["INPUT_XLSX"])
     dfp = prepare_dataframe(df, None, None)
     
     # 사용 가능한 셀러 목록 확인
@@ -59,7 +60,7 @@ def debug_category_selection(seller_name=None):
     # 카테고리별 매출 분석
     if '__category_mapped__' in seller_data.columns:
         print(f"\n📂 {seller_name}의 카테고리별 매출 분석:")
-        category_revenue = seller_data.groupby('__category_mapped__')['__amount__'].agg(['count', 'sum']).round(0)
+        category_revenue = seller_data.groupby('__category_mapped__', observed=True)['__amount__'].agg(['count', 'sum']).round(0)
         category_revenue.columns = ['주문수', '매출액']
         category_revenue = category_revenue.sort_values('매출액', ascending=False)
         
@@ -103,7 +104,7 @@ def analyze_category_competition(top_category, target_seller, overall_data):
         
         if '입점사명' in category_data.columns:
             # 셀러별 성과
-            seller_performance = category_data.groupby('입점사명')['__amount__'].agg(['count', 'sum']).round(0)
+            seller_performance = category_data.groupby('입점사명', observed=True)['__amount__'].agg(['count', 'sum']).round(0)
             seller_performance.columns = ['주문수', '매출액']
             seller_performance = seller_performance.sort_values('매출액', ascending=False)
             
@@ -172,12 +173,12 @@ def analyze_sellers_by_category():
     print(f"\n📊 카테고리별 주요 셀러 현황")
     print("=" * 60)
     
-    df = load_excel_data(CONFIG["INPUT_XLSX"])
+    df = load_order_data(CONFIG["INPUT_XLSX"])
     dfp = prepare_dataframe(df, None, None)
     
     if '__category_mapped__' in dfp.columns:
         # 카테고리별 매출 상위 10개
-        category_revenue = dfp.groupby('__category_mapped__')['__amount__'].sum().sort_values(ascending=False)
+        category_revenue = dfp.groupby('__category_mapped__', observed=True)['__amount__'].sum().sort_values(ascending=False)
         
         print(f"📂 매출 상위 10개 카테고리:")
         for idx, (category, revenue) in enumerate(category_revenue.head(10).items(), 1):
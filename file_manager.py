@@ -1,36 +1,196 @@
 # file_manager.py
 """파일 입출력 관리"""
 
+import glob
+import hashlib
+import json
+import os
+import re
+import zipfile
+import xml.etree.ElementTree as ET
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
-from constants import COL_SELLER
+from typing import Dict, List, Tuple, Optional
+from constants import (
+    COL_SELLER, COL_ORDER_ID, COL_ITEM_ORDER_ID,
+    ANALYSIS_COLUMNS, ORDER_SCHEMA
+)
+from data_processing.transformers import to_datetime_safe, to_number_safe
+from data_processing.validation import concat_preserving_categories
+from data_processing.order_store import IncrementalOrderStore
 
-def load_excel_data(xlsx_path: str) -> pd.DataFrame:
-    """엑셀 파일에서 가장 큰 시트 로드 (개선된 에러 처리)"""
+# 원본 엑셀 옆에 생성되는 캐시 폴더명
+CACHE_DIR_NAME = ".cache"
+# 캐시 포맷이 바뀌면 올려서 기존 캐시를 무효화
+CACHE_VERSION = 2
+
+# xlsx 워크북 XML 네임스페이스
+_XLSX_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_XLSX_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+# 디렉토리 입력 시 찾을 주문 export 파일 패턴 / 파일명의 export 시각
+ORDER_EXPORT_PATTERN = "order_list_*.xlsx"
+_EXPORT_TIMESTAMP_RE = re.compile(r"(\d{14})")
+
+def load_excel_data(xlsx_path: str, columns: Optional[List[str]] = None,
+                    schema: Optional[Dict[str, str]] = None,
+                    use_cache: bool = True, cache_dir: Optional[str] = None) -> pd.DataFrame:
+    """엑셀 파일에서 가장 큰 시트 로드 (컬럼형 캐시 우선 사용)
+    
+    columns: 로드할 칼럼 목록 (None이면 전체). 없는 칼럼은 무시
+    schema: 칼럼별 타입 {"칼럼명": "category" | "numeric" | "datetime" | "string"}
+    """
     path = Path(xlsx_path)
     if not path.exists():
         raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
     
+    if use_cache:
+        cached = _load_cached_frame(path, columns, schema, cache_dir)
+        if cached is not None:
+            return cached
+    
+    df = _apply_schema(_read_main_sheet(path, columns), schema)
+    
+    if use_cache:
+        _save_cached_frame(path, df, columns, schema, cache_dir)
+    
+    return df
+
+def load_order_data(xlsx_path: str, use_cache: bool = True) -> pd.DataFrame:
+    """분석용 칼럼만 타입을 지정해 주문 데이터 로드"""
+    return load_excel_data(xlsx_path, columns=ANALYSIS_COLUMNS, schema=ORDER_SCHEMA, use_cache=use_cache)
+
+def resolve_input_files(source: str) -> List[Path]:
+    """파일/디렉토리/glob 패턴을 export 시각 순으로 정렬된 파일 목록으로 변환"""
+    path = Path(source)
+    if path.is_file():
+        return [path]
+    if path.is_dir():
+        files = list(path.glob(ORDER_EXPORT_PATTERN))
+    else:
+        files = [Path(p) for p in glob.glob(str(source))]
+    
+    # 엑셀 임시 파일(~$...) 제외
+    files = [f for f in files if f.is_file() and not f.name.startswith("~$")]
+    return sorted(files, key=_export_sort_key)
+
+def _export_sort_key(path: Path) -> Tuple[str, float]:
+    """파일명의 YYYYMMDDhhmmss, 없으면 수정시각 기준 정렬 키"""
+    match = _EXPORT_TIMESTAMP_RE.search(path.name)
+    return (match.group(1) if match else "", path.stat().st_mtime)
+
+def load_order_exports(source: str, max_workers: Optional[int] = None, use_cache: bool = True) -> pd.DataFrame:
+    """여러 주문 export를 병렬로 로드해 병합 (주문번호+품목 라인 기준 최신 상태만 유지)"""
+    files = resolve_input_files(source)
+    if not files:
+        raise FileNotFoundError(f"주문 파일을 찾을 수 없습니다: {source}")
+    if len(files) == 1:
+        return load_order_data(str(files[0]), use_cache=use_cache)
+    
+    workers = max_workers or min(len(files), os.cpu_count() or 1)
+    paths = [str(f) for f in files]
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            frames = list(pool.map(load_order_data, paths, [use_cache] * len(paths)))
+    except Exception as e:
+        print(f"⚠️ 병렬 로드 실패, 순차 로드로 전환합니다: {e}")
+        frames = [load_order_data(p, use_cache=use_cache) for p in paths]
+    
+    merged = _concat_exports(frames)
+    print(f"✅ {len(files)}개 파일 병합: {sum(len(f) for f in frames):,}건 → 중복 제거 후 {len(merged):,}건")
+    return merged
+
+def dataset_fingerprint(source: str, extra_paths: Optional[List[str]] = None) -> Optional[str]:
+    """입력 export 파일들(+ 카테고리 매핑 등 부가 파일)의 이름/크기/수정시각 기반 지문 (파일이 없으면 None)"""
+    files = resolve_input_files(source)
+    if not files:
+        return None
+    
+    entries = [(f.name, _file_signature(f)) for f in files]
+    for extra in extra_paths or []:
+        if extra and Path(extra).is_file():
+            entries.append((Path(extra).name, _file_signature(Path(extra))))
+    
+    payload = json.dumps(entries, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def sync_order_store(source: str, store_dir: str, start: Optional[str] = None,
+                     end: Optional[str] = None) -> pd.DataFrame:
+    """새 export의 신규/변경 주문만 증분 저장소에 반영한 뒤 전처리된 데이터 반환"""
+    store = IncrementalOrderStore(store_dir)
+    
+    for path in resolve_input_files(source):
+        export_key = _export_sort_key(path)[0]
+        signature = _file_signature(path)
+        if store.is_ingested(path.name, export_key, signature):
+            continue
+        
+        stats = store.upsert(load_order_data(str(path)), path.name, export_key, signature)
+        print(f"✅ {path.name} 반영: 신규 {stats['inserted']:,}건 / 변경 {stats['updated']:,}건")
+    
+    return store.load(start, end)
+
+def _concat_exports(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """export 시각 순서의 프레임들을 병합하고 겹치는 주문 라인은 마지막 것만 유지"""
+    merged = concat_preserving_categories(frames)
+    
+    keys = [COL_ORDER_ID, COL_ITEM_ORDER_ID]
+    if not all(k in merged.columns for k in keys):
+        # 주문번호+상품명은 같은 상품의 별도 라인을 합칠 수 있어 중복 제거하지 않음
+        print(f"⚠️ '{COL_ITEM_ORDER_ID}' 칼럼이 없어 export 간 중복 주문을 제거하지 않고 병합합니다.")
+        return merged
+    
+    # 키가 비어 있는 행은 서로 다른 주문일 수 있으므로 중복 제거 대상에서 제외
+    has_key = merged[keys].notna().all(axis=1)
+    duplicated = merged[keys].duplicated(keep="last") & has_key
+    return merged[~duplicated].reset_index(drop=True)
+
+def _read_main_sheet(path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """엑셀 파일에서 가장 큰 시트 로드 (개선된 에러 처리)"""
+    # 필요한 칼럼만 디코딩 (헤더 공백은 제거 후 비교)
+    usecols = None
+    if columns is not None:
+        wanted = set(columns)
+        usecols = lambda c: str(c).strip() in wanted
+    
     try:
         xls = pd.ExcelFile(path)
         if not xls.sheet_names:
             raise ValueError("엑셀 파일에 시트가 없습니다.")
         
-        sheets = {}
-        for name in xls.sheet_names:
-            try:
-                sheet_df = xls.parse(name)
+        # 시트 메타데이터로 행 수를 먼저 파악하면 가장 큰 시트 하나만 파싱
+        row_counts = _sheet_row_counts(path)
+        if row_counts:
+            ordered = sorted(xls.sheet_names, key=lambda n: row_counts.get(n, 0), reverse=True)
+            df = None
+            for name in ordered:
+                try:
+                    sheet_df = xls.parse(name, usecols=usecols)
+                except Exception as e:
+                    print(f"시트 '{name}' 로드 실패: {e}")
+                    continue
                 if not sheet_df.empty:
-                    sheets[name] = sheet_df
-            except Exception as e:
-                print(f"시트 '{name}' 로드 실패: {e}")
-                continue
-        
-        if not sheets:
-            raise ValueError("읽을 수 있는 시트가 없습니다.")
+                    df = sheet_df
+                    break
+            if df is None:
+                raise ValueError("읽을 수 있는 시트가 없습니다.")
+        else:
+            sheets = {}
+            for name in xls.sheet_names:
+                try:
+                    sheet_df = xls.parse(name, usecols=usecols)
+                    if not sheet_df.empty:
+                        sheets[name] = sheet_df
+                except Exception as e:
+                    print(f"시트 '{name}' 로드 실패: {e}")
+                    continue
+            
+            if not sheets:
+                raise ValueError("읽을 수 있는 시트가 없습니다.")
+            
+            main_name, df = max(sheets.items(), key=lambda kv: len(kv[1]))
         
-        main_name, df = max(sheets.items(), key=lambda kv: len(kv[1]))
         df.columns = [str(c).strip() for c in df.columns]
         
         if df.empty:
@@ -41,6 +201,192 @@ def load_excel_data(xlsx_path: str) -> pd.DataFrame:
     except Exception as e:
         raise ValueError(f"엑셀 파일 읽기 실패: {e}")
 
+def _apply_schema(df: pd.DataFrame, schema: Optional[Dict[str, str]]) -> pd.DataFrame:
+    """스키마에 지정된 칼럼 타입 적용"""
+    if not schema:
+        return df
+    
+    for col, kind in schema.items():
+        if col not in df.columns:
+            continue
+        if kind == "category":
+            df[col] = df[col].astype("category")
+        elif kind == "numeric":
+            df[col] = to_number_safe(df[col])
+        elif kind == "datetime":
+            df[col] = to_datetime_safe(df[col])
+        elif kind == "string":
+            df[col] = _to_key_string(df[col])
+        else:
+            raise ValueError(f"알 수 없는 스키마 타입: {col}={kind}")
+    return df
+
+def _to_key_string(s: pd.Series) -> pd.Series:
+    """식별번호 칼럼을 문자열로 통일 (숫자/문자 혼재 export 간 비교용)"""
+    if pd.api.types.is_float_dtype(s) and (s.dropna() % 1 == 0).all():
+        s = s.astype("Int64")
+    return s.astype("string").str.strip()
+
+def _sheet_row_counts(path: Path) -> Optional[Dict[str, int]]:
+    """xlsx 메타데이터(dimension 레코드)에서 시트별 행 수 조회. 실패하면 None"""
+    if not zipfile.is_zipfile(path):
+        return None
+    
+    try:
+        with zipfile.ZipFile(path) as zf:
+            workbook = ET.fromstring(zf.read("xl/workbook.xml"))
+            rels = ET.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+            targets = {rel.get("Id"): rel.get("Target") for rel in rels}
+            
+            counts = {}
+            for sheet in workbook.iter(f"{{{_XLSX_MAIN_NS}}}sheet"):
+                target = targets.get(sheet.get(f"{{{_XLSX_REL_NS}}}id"))
+                if not target:
+                    continue
+                member = target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+                counts[sheet.get("name")] = _worksheet_row_count(zf, member)
+            return counts or None
+            
+    except Exception:
+        return None
+
+def _worksheet_row_count(zf: zipfile.ZipFile, member: str) -> int:
+    """워크시트 XML의 dimension ref로 행 수 계산 (범위가 아니거나 없으면 row 태그 개수)"""
+    rows = 0
+    with zf.open(member) as f:
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            tag = elem.tag.rsplit("}", 1)[-1]
+            if event == "start" and tag == "dimension":
+                # 일부 도구는 데이터가 있어도 dimension을 "A1" 한 칸으로 기록하므로 범위(A1:X123)만 신뢰
+                ref = elem.get("ref", "")
+                if ":" in ref:
+                    digits = "".join(ch for ch in ref.split(":")[-1] if ch.isdigit())
+                    if digits:
+                        return int(digits)
+            elif event == "end" and tag == "row":
+                rows += 1
+                elem.clear()
+    return rows
+
+def _cache_prefix(path: Path, schema: Optional[Dict[str, str]]) -> str:
+    """원본 파일 + 스키마별 캐시 파일 접두어"""
+    if not schema:
+        return f"{path.stem}.raw"
+    schema_key = hashlib.sha1(json.dumps(sorted(schema.items()), ensure_ascii=False).encode("utf-8")).hexdigest()[:8]
+    return f"{path.stem}.{schema_key}"
+
+def _cache_meta_path(path: Path, schema: Optional[Dict[str, str]], cache_dir: Optional[str]) -> Path:
+    """캐시 메타데이터 파일 경로"""
+    base = Path(cache_dir) if cache_dir else path.parent / CACHE_DIR_NAME
+    return base / f"{_cache_prefix(path, schema)}.meta.json"
+
+def _file_signature(path: Path) -> dict:
+    """파일 크기/수정시각 기반의 빠른 식별 정보"""
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+def _file_hash(path: Path, chunk_size: int = 1 << 20) -> str:
+    """파일 내용 해시 (sha256)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _read_cache_file(data_path: Path, fmt: str, columns: List[str]) -> pd.DataFrame:
+    """캐시 파일 로드 (Parquet은 필요한 칼럼만 디코딩)"""
+    if fmt == "parquet":
+        return pd.read_parquet(data_path, columns=columns)
+    return pd.read_pickle(data_path)[columns]
+
+def _load_cached_frame(path: Path, columns: Optional[List[str]], schema: Optional[Dict[str, str]],
+                       cache_dir: Optional[str]) -> Optional[pd.DataFrame]:
+    """원본이 바뀌지 않았고 요청 칼럼이 캐시에 있으면 캐시에서 로드, 아니면 None"""
+    meta_path = _cache_meta_path(path, schema, cache_dir)
+    if not meta_path.exists():
+        return None
+    
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if meta.get("version") != CACHE_VERSION:
+            return None
+        
+        data_path = meta_path.parent / meta["data_file"]
+        if not data_path.exists():
+            return None
+        
+        # 캐시가 일부 칼럼만 갖고 있으면 요청 칼럼이 그 안에 있어야 함
+        if meta["projected"] and (columns is None or not set(columns) <= set(meta["requested"])):
+            return None
+        
+        signature = _file_signature(path)
+        if signature["size"] != meta["size"]:
+            return None
+        
+        # 크기는 같고 수정시각만 다르면 내용 해시로 재확인
+        if signature["mtime_ns"] != meta["mtime_ns"]:
+            if _file_hash(path) != meta["sha256"]:
+                return None
+            meta.update(signature)
+            _write_json_atomic(meta_path, meta)
+        
+        stored = meta["columns"]
+        selected = stored if columns is None else [c for c in stored if c in set(columns)]
+        return _read_cache_file(data_path, meta["format"], selected)
+        
+    except Exception as e:
+        print(f"⚠️ 캐시 로드 실패, 원본 파일을 다시 읽습니다: {e}")
+        return None
+
+def _save_cached_frame(path: Path, df: pd.DataFrame, columns: Optional[List[str]],
+                       schema: Optional[Dict[str, str]], cache_dir: Optional[str]) -> None:
+    """로드한 시트를 컬럼형 포맷(Parquet)으로 캐시에 저장"""
+    meta_path = _cache_meta_path(path, schema, cache_dir)
+    prefix = _cache_prefix(path, schema)
+    
+    try:
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        signature = _file_signature(path)
+        content_hash = _file_hash(path)
+        
+        # Parquet 저장이 불가능하면(pyarrow 미설치, 혼합 타입 컬럼 등) pickle로 대체
+        data_path = meta_path.parent / f"{prefix}.{content_hash[:16]}.parquet"
+        fmt = "parquet"
+        try:
+            df.to_parquet(data_path.with_suffix(".tmp"), index=False)
+        except Exception:
+            data_path = data_path.with_suffix(".pkl")
+            fmt = "pickle"
+            df.to_pickle(data_path.with_suffix(".tmp"))
+        os.replace(data_path.with_suffix(".tmp"), data_path)
+        
+        # 이전 버전의 캐시 파일 정리
+        for stale in meta_path.parent.glob(f"{prefix}.*"):
+            if stale not in (data_path, meta_path) and stale.suffix in (".parquet", ".pkl"):
+                stale.unlink()
+        
+        meta = {
+            "version": CACHE_VERSION,
+            "source": path.name,
+            "sha256": content_hash,
+            "data_file": data_path.name,
+            "format": fmt,
+            "columns": [str(c) for c in df.columns],
+            "projected": columns is not None,
+            "requested": list(columns) if columns is not None else None,
+            **signature,
+        }
+        _write_json_atomic(meta_path, meta)
+        
+    except Exception as e:
+        print(f"⚠️ 캐시 저장 실패: {e}")
+
+def _write_json_atomic(target: Path, payload: dict) -> None:
+    """임시 파일에 쓴 뒤 교체하여 JSON 저장"""
+    tmp_path = target.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp_path, target)
+
 def determine_sellers(df: pd.DataFrame, wanted_sellers: List[str]) -> List[str]:
     """생성 대상 셀러 목록 결정"""
     if wanted_sellers:
@@ -15,7 +15,7 @@ import warnings
 warnings.filterwarnings('ignore')
 
 from config import CONFIG
-from file_manager import load_excel_data
+from file_manager import load_order_exports
 from constants import *
 from utils import format_currency, pct, sanitize_filename
 
@@ -24,7 +24,8 @@ from data_processing import (
     prepare_dataframe, slice_by_seller, 
     calculate_comprehensive_kpis,
     get_channel_analysis, get_product_analysis, get_category_analysis,
-    get_region_analysis, get_time_analysis
+    get_region_analysis, get_time_analysis, get_seller_main_category,
+    ship_lead_days, delivery_days, claim_flag, top_k, rank_matrix
 )
 
 class SellerDashboardExcel:
@@ -43,8 +44,8 @@ class SellerDashboardExcel:
         """데이터 로딩 및 전처리"""
         try:
             input_path = CONFIG["INPUT_XLSX"]
-            self.df = load_excel_data(input_path)
-            self.dfp = prepare_dataframe(self.df, None, None)
+            self.df = load_order_exports(input_path)
+            self.dfp = prepare_dataframe(self.df, CONFIG.get("START_DATE"), CONFIG.get("END_DATE"))
             self.overall_data = self.dfp.copy()
             
             if self.seller_name != "전체":
@@ -95,15 +96,15 @@ class SellerDashboardExcel:
         
         # 주력 카테고리
         if '__category_mapped__' in self.seller_data.columns:
-            cat_revenue = self.seller_data.groupby('__category_mapped__')['__amount__'].sum()
-            if not cat_revenue.empty:
-                info['main_category'] = cat_revenue.idxmax()
-                info['main_category_share'] = (cat_revenue.max() / self.seller_data['__amount__'].sum()) * 100
+            main_category = get_seller_main_category(self.seller_data)
+            if main_category is not None:
+                info['main_category'] = main_category['main_category']
+                info['main_category_share'] = (main_category['category_revenue'] / main_category['total_revenue']) * 100
                 
                 # 카테고리 내 순위 계산
                 if '__category_mapped__' in self.overall_data.columns and COL_SELLER in self.overall_data.columns:
                     category_data = self.overall_data[self.overall_data['__category_mapped__'] == info['main_category']]
-                    seller_perf = category_data.groupby(COL_SELLER)['__amount__'].sum().sort_values(ascending=False)
+                    seller_perf = category_data.groupby(COL_SELLER, observed=True)['__amount__'].sum().sort_values(ascending=False)
                     
                     if self.seller_name in seller_perf.index:
                         rank = seller_perf.index.get_loc(self.seller_name) + 1
@@ -137,7 +138,7 @@ class SellerDashboardExcel:
         
         # B. 채널별 매출 분석
         if COL_CHANNEL in self.seller_data.columns:
-            channel_analysis = self.seller_data.groupby(COL_CHANNEL).agg({
+            channel_analysis = self.seller_data.groupby(COL_CHANNEL, observed=True).agg({
                 '__amount__': ['sum', 'count', 'mean'],
                 '__qty__': 'sum'
             }).round(2)
@@ -157,7 +158,7 @@ class SellerDashboardExcel:
             
             product_analysis.columns = ['매출액', '주문수', 'AOV', '판매수량']
             product_analysis['매출기여도'] = (product_analysis['매출액'] / product_analysis['매출액'].sum()) * 100
-            product_analysis = product_analysis.sort_values('매출액', ascending=False).head(20)
+            product_analysis = top_k(product_analysis, '매출액', 20)
             
             sales['product_analysis'] = product_analysis
         
@@ -223,7 +224,7 @@ class SellerDashboardExcel:
         
         # C. 지역별 고객 분석
         if '__region__' in customer_data.columns:
-            region_analysis = customer_data.groupby('__region__').agg({
+            region_analysis = customer_data.groupby('__region__', observed=True).agg({
                 '__customer_id__': 'nunique',
                 '__amount__': ['sum', 'mean'],
                 '__dt__': 'count'
@@ -303,7 +304,8 @@ class SellerDashboardExcel:
         
         # A. 주문 처리 현황
         if COL_STATUS in self.seller_data.columns:
-            status_analysis = self.seller_data[COL_STATUS].value_counts()
+            # 범주형이면 동률이 범주 순서로 정렬되므로 문자열로 집계 (동률은 등장 순서)
+            status_analysis = self.seller_data[COL_STATUS].astype(str).value_counts()
             status_df = pd.DataFrame({
                 '상태': status_analysis.index,
                 '건수': status_analysis.values,
@@ -321,32 +323,29 @@ class SellerDashboardExcel:
                 '지연율': (status_analysis.get('배송지연', 0) / total_orders * 100),
                 '반품률': (status_analysis.get('반품', 0) / total_orders * 100)
             }
+            if COL_REFUND_FIELD in self.seller_data.columns:
+                # 환불/취소/반품 클레임 비율 (변환 단계 클레임 플래그의 평균)
+                operations['key_metrics']['클레임률'] = claim_flag(self.seller_data).mean() * 100
         
         # B. 배송 성과 분석
         shipping_metrics = {}
         
         if COL_SHIP_DATE in self.seller_data.columns:
-            ship_data = self.seller_data[self.seller_data[COL_SHIP_DATE].notna()].copy()
-            if not ship_data.empty:
-                ship_data['ship_dt'] = pd.to_datetime(ship_data[COL_SHIP_DATE], errors='coerce')
-                ship_data['출고소요시간'] = (ship_data['ship_dt'] - ship_data['__dt__']).dt.total_seconds() / 86400.0
+            has_ship = self.seller_data[COL_SHIP_DATE].notna()
+            if has_ship.any():
+                lead_times = ship_lead_days(self.seller_data)[has_ship]
                 
-                shipping_metrics['평균출고시간'] = ship_data['출고소요시간'].mean()
-                shipping_metrics['당일발송률'] = (ship_data['출고소요시간'] <= 1).mean() * 100
+                shipping_metrics['평균출고시간'] = lead_times.mean()
+                shipping_metrics['당일발송률'] = (lead_times <= 1).mean() * 100
                 
         if COL_DELIVERED_DATE in self.seller_data.columns and COL_SHIP_DATE in self.seller_data.columns:
-            delivery_data = self.seller_data[
-                self.seller_data[COL_DELIVERED_DATE].notna() & 
-                self.seller_data[COL_SHIP_DATE].notna()
-            ].copy()
+            has_delivery = self.seller_data[COL_DELIVERED_DATE].notna() & self.seller_data[COL_SHIP_DATE].notna()
             
-            if not delivery_data.empty:
-                delivery_data['delivery_dt'] = pd.to_datetime(delivery_data[COL_DELIVERED_DATE], errors='coerce')
-                delivery_data['ship_dt'] = pd.to_datetime(delivery_data[COL_SHIP_DATE], errors='coerce')
-                delivery_data['배송소요시간'] = (delivery_data['delivery_dt'] - delivery_data['ship_dt']).dt.total_seconds() / 86400.0
+            if has_delivery.any():
+                delivery_times = delivery_days(self.seller_data)[has_delivery]
                 
-                shipping_metrics['평균배송시간'] = delivery_data['배송소요시간'].mean()
-                shipping_metrics['빠른배송률'] = (delivery_data['배송소요시간'] <= 2).mean() * 100
+                shipping_metrics['평균배송시간'] = delivery_times.mean()
+                shipping_metrics['빠른배송률'] = (delivery_times <= 2).mean() * 100
         
         operations['shipping_metrics'] = shipping_metrics
         
@@ -375,17 +374,20 @@ class SellerDashboardExcel:
             category_data = self.overall_data[self.overall_data['__category_mapped__'] == main_category]
             
             # 셀러별 성과 집계
-            seller_performance = category_data.groupby(COL_SELLER).agg({
+            seller_performance = category_data.groupby(COL_SELLER, observed=True).agg({
                 '__amount__': ['sum', 'count', 'mean'],
                 '__customer_id__': 'nunique' if '__customer_id__' in category_data.columns else lambda x: np.nan
             }).round(2)
             
             seller_performance.columns = ['총매출', '주문수', 'AOV', '고객수']
-            seller_performance = seller_performance.sort_values('총매출', ascending=False)
+            
+            # 지표별 순위 행렬 (지표마다 argsort 한 번, 매출은 동률이면 원래 순서로 매출순위와 공유)
+            metrics = ['총매출', '주문수', 'AOV', '고객수']
+            ranks = rank_matrix(seller_performance, metrics, method={'총매출': 'first'})
             
             # 내 순위 정보
             if self.seller_name in seller_performance.index:
-                my_rank = seller_performance.index.get_loc(self.seller_name) + 1
+                my_rank = int(ranks['총매출'][self.seller_name])
                 total_sellers = len(seller_performance)
                 
                 position_metrics = {
@@ -394,15 +396,15 @@ class SellerDashboardExcel:
                 }
                 
                 # 각 지표별 순위
-                for metric in ['총매출', '주문수', 'AOV', '고객수']:
+                for metric in metrics:
                     if not seller_performance[metric].isna().all():
-                        metric_rank = seller_performance[metric].rank(ascending=False)[self.seller_name]
+                        metric_rank = ranks[metric][self.seller_name]
                         position_metrics[f'{metric}_순위'] = f"{int(metric_rank)}/{total_sellers}"
                 
                 benchmarking['position_metrics'] = position_metrics
                 
-                # 경쟁사 TOP 5 (나를 포함)
-                top_competitors = seller_performance.head(10)
+                # 경쟁사 TOP 10 (나를 포함, 전체 정렬 없이 선택)
+                top_competitors = top_k(seller_performance, '총매출', 10)
                 benchmarking['top_competitors'] = top_competitors
         
         # B. 상대적 성과 분석
@@ -470,7 +472,7 @@ class SellerDashboardExcel:
     def _get_performance_grade(self, value: float, metric_name: str) -> str:
         """성과 등급 계산"""
         # 낮을수록 좋은 지표들
-        if any(bad_word in metric_name for bad_word in ['cancel', 'delay', 'return']):
+        if any(bad_word in metric_name for bad_word in ['cancel', 'delay', 'return', 'claim']):
             if value <= 0.7: return 'A+'
             elif value <= 0.8: return 'A'
             elif value <= 0.9: return 'B+'
@@ -487,7 +489,7 @@ class SellerDashboardExcel:
     def _get_improvement_potential(self, value: float, metric_name: str) -> str:
         """개선 여지 평가"""
         # 낮을수록 좋은 지표들
-        if any(bad_word in metric_name for bad_word in ['cancel', 'delay', 'return']):
+        if any(bad_word in metric_name for bad_word in ['cancel', 'delay', 'return', 'claim']):
             if value <= 0.8: return '유지'
             elif value <= 1.1: return '중간'
             else: return '높음'
@@ -986,11 +988,11 @@ def main():
     else:
         # 기본값: 매출 상위 셀러 자동 선택
         try:
-            df = load_excel_data(CONFIG["INPUT_XLSX"])
+            df = load_order_exports(CONFIG["INPUT_XLSX"])
             dfp = prepare_dataframe(df, None, None)
             
             if COL_SELLER in dfp.columns:
-                seller_revenue = dfp.groupby(COL_SELLER)['__amount__'].sum().sort_values(ascending=False)
+                seller_revenue = dfp.groupby(COL_SELLER, observed=True)['__amount__'].sum().sort_values(ascending=False)
                 target_seller = seller_revenue.index[0]
                 print(f"💡 매출 1위 셀러 '{target_seller}' 자동 선택")
             else:
@@ -16,7 +16,7 @@ import pandas as pd
 # 로컬 모듈
 sys.path.insert(0, str(Path(__file__).parent))
 from config import CONFIG
-from file_manager import load_excel_data
+from file_manager import load_order_data
 from constants import *
 from utils import format_currency, pct, sanitize_filename
 
@@ -60,13 +60,13 @@ class SellerDashboard:
         """1️⃣ 데이터 로딩 및 전처리"""
         try:
             input_path = CONFIG["INPUT_XLSX"]
-            self.df = load_excel_data(input_path)
+            self.df = load_order_data(input_path)
             self.dfp = prepare_dataframe(self.df, None, None)
             
             # 셀러 결정 (지정되지 않으면 자동 선택)
             if not self.seller_name:
                 if COL_SELLER in self.dfp.columns:
-                    seller_revenue = self.dfp.groupby(COL_SELLER)['__amount__'].sum().sort_values(ascending=False)
+                    seller_revenue = self.dfp.groupby(COL_SELLER, observed=True)['__amount__'].sum().sort_values(ascending=False)
                     self.seller_name = seller_revenue.index[0]
                 else:
                     self.seller_name = "전체"
@@ -144,7 +144,7 @@ class SellerDashboard:
         
         # 주력 카테고리 분석
         if '__category_mapped__' in self.seller_data.columns:
-            category_revenue = self.seller_data.groupby('__category_mapped__')['__amount__'].sum()
+            category_revenue = self.seller_data.groupby('__category_mapped__', observed=True)['__amount__'].sum()
             if not category_revenue.empty:
                 profile['main_category'] = category_revenue.idxmax()
                 profile['main_category_share'] = (category_revenue.max() / profile['total_revenue']) * 100 if profile['total_revenue'] else None
@@ -155,7 +155,7 @@ class SellerDashboard:
         
         # 채널 믹스
         if COL_CHANNEL in self.seller_data.columns:
-            channel_revenue = self.seller_data.groupby(COL_CHANNEL)['__amount__'].sum()
+            channel_revenue = self.seller_data.groupby(COL_CHANNEL, observed=True)['__amount__'].sum()
             profile['channel_count'] = len(channel_revenue)
             profile['main_channel'] = channel_revenue.idxmax() if not channel_revenue.empty else None
         else:
@@ -184,6 +184,7 @@ class SellerDashboard:
         main_category = None
         if '__category_mapped__' in self.dfp.columns and '__category_mapped__' in self.seller_data.columns:
             seller_categories = self.seller_data['__category_mapped__'].value_counts()
+            seller_categories = seller_categories[seller_categories > 0]
             if not seller_categories.empty:
                 main_category = seller_categories.index[0]
                 
@@ -191,7 +192,7 @@ class SellerDashboard:
                 category_data = self.dfp[self.dfp['__category_mapped__'] == main_category]
                 
                 if COL_SELLER in category_data.columns and len(category_data) > 0:
-                    seller_performance = category_data.groupby(COL_SELLER)['__amount__'].sum().sort_values(ascending=False)
+                    seller_performance = category_data.groupby(COL_SELLER, observed=True)['__amount__'].sum().sort_values(ascending=False)
                     
                     if self.seller_name in seller_performance.index:
                         rank = seller_performance.index.get_loc(self.seller_name) + 1
@@ -821,12 +822,12 @@ def test_multiple_sellers():
     
     try:
         # 데이터 로드
-        df = load_excel_data(CONFIG["INPUT_XLSX"])
+        df = load_order_data(CONFIG["INPUT_XLSX"])
         dfp = prepare_dataframe(df, None, None)
         
         # 상위 매출 셀러들 찾기
         if COL_SELLER in dfp.columns:
-            seller_revenue = dfp.groupby(COL_SELLER)['__amount__'].sum().sort_values(ascending=False)
+            seller_revenue = dfp.groupby(COL_SELLER, observed=True)['__amount__'].sum().sort_values(ascending=False)
             top_sellers = seller_revenue.head(5).index.tolist()
             
             print(f"📊 상위 5개 셀러 비교:")
@@ -857,7 +858,7 @@ def test_data_quality_diagnosis():
     print("=" * 100)
     
     try:
-        df = load_excel_data(CONFIG["INPUT_XLSX"])
+        df = load_order_data(CONFIG["INPUT_XLSX"])
         dfp = prepare_dataframe(df, None, None)
         
         print(f"📊 데이터 개요:")
@@ -890,11 +891,12 @@ def test_data_quality_diagnosis():
         print(f"\n🎯 벤치마킹 분석 가능성:")
         if '__category_mapped__' in dfp.columns:
             categories = dfp['__category_mapped__'].value_counts()
+            categories = categories[categories > 0]
             print(f"  ✅ 카테고리 매핑: {len(categories)}개 카테고리")
             print(f"  📂 주요 카테고리: {categories.head(3).index.tolist()}")
             
             if COL_SELLER in dfp.columns:
-                sellers_per_category = dfp.groupby('__category_mapped__')[COL_SELLER].nunique()
+                sellers_per_category = dfp.groupby('__category_mapped__', observed=True)[COL_SELLER].nunique()
                 avg_competitors = sellers_per_category.mean()
                 print(f"  🏆 평균 경쟁사 수: {avg_competitors:.1f}개/카테고리")
                 print(f"  💪 벤치마킹 신뢰도: {'높음' if avg_competitors >= 5 else '보통' if avg_competitors >= 3 else '낮음'}")
@@ -0,0 +1,40 @@
+# tests/test_file_manager.py
+"""file_manager 시트 행 수(dimension) 판별 / export 병합 테스트"""
+
+from pathlib import Path
+
+import pandas as pd
+
+from file_manager import _sheet_row_counts, _read_main_sheet, _concat_exports
+
+FIXTURE = Path(__file__).resolve().parent.parent / "files" / "fixtures" / "sheet_dimensions.xlsx"
+
+def test_sheet_row_counts_ignore_single_cell_dimension():
+    # 요약: A1:B3 범위 / 주문: dimension "A1"이지만 6행 / 메모: dimension 없음 2행
+    assert _sheet_row_counts(FIXTURE) == {"요약": 3, "주문": 6, "메모": 2}
+
+def test_read_main_sheet_picks_largest_sheet():
+    df = _read_main_sheet(FIXTURE)
+    assert list(df.columns) == ["주문번호", "상품주문번호", "최종 상품별 총 주문금액"]
+    assert len(df) == 5
+
+def _export(rows, statuses):
+    frame = pd.DataFrame(rows, columns=["주문번호", "상품주문번호", "상품명"])
+    frame["주문상태"] = pd.Categorical(statuses)
+    return frame
+
+def test_concat_exports_keeps_last_line_per_item_order():
+    older = _export([["O1", "I1", "A"], ["O1", "I2", "A"], ["O2", None, "B"]], ["결제확인", "결제확인", "결제확인"])
+    newer = _export([["O1", "I1", "A"], ["O2", None, "B"]], ["배송완료", "배송중"])
+
+    merged = _concat_exports([older, newer])
+
+    # 같은 주문번호+상품주문번호는 최신 export만, 같은 상품의 다른 라인(I2)과 키가 빈 행은 유지
+    keys = merged["주문번호"] + "/" + merged["상품주문번호"].fillna("-")
+    assert keys.tolist() == ["O1/I2", "O2/-", "O1/I1", "O2/-"]
+    assert merged.loc[merged["상품주문번호"] == "I1", "주문상태"].tolist() == ["배송완료"]
+    assert isinstance(merged["주문상태"].dtype, pd.CategoricalDtype)
+
+    # 입력 export의 범주는 바뀌지 않음
+    assert list(older["주문상태"].cat.categories) == ["결제확인"]
+    assert list(newer["주문상태"].cat.categories) == ["배송완료", "배송중"]
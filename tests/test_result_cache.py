@@ -0,0 +1,53 @@
+# tests/test_result_cache.py
+"""대시보드 결과 캐시 적중 테스트"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+# dashboard/main.py와 같은 경로 구성 (상위 디렉토리 우선)
+sys.path.insert(0, str(ROOT / "dashboard"))
+sys.path.insert(0, str(ROOT))
+
+from config import CONFIG
+from analyzers import basic_info_analyzer
+from analyzers.basic_info_analyzer import BasicInfoAnalyzer
+from core.dashboard import SellerDashboard
+
+SELLER = "포레스트핏"
+
+def _analysis_date(path: Path) -> str:
+    summary = pd.read_excel(path, sheet_name="대시보드요약", header=None)
+    row = summary[summary[0] == "분석일시"]
+    return row.iloc[0, 1]
+
+def _fixed_now(monkeypatch, stamp: str) -> None:
+    monkeypatch.setattr(BasicInfoAnalyzer, "current_analysis_date", staticmethod(lambda: stamp))
+
+def test_cache_hit_skips_analyzers_and_restamps_analysis_date(tmp_path, monkeypatch):
+    monkeypatch.setitem(CONFIG, "INPUT_XLSX", str(ROOT / "files" / "order_list_20250818120157_497.xlsx"))
+    monkeypatch.setitem(CONFIG, "CATEGORY_MAPPING_PATH", str(ROOT / CONFIG["CATEGORY_MAPPING_PATH"]))
+    monkeypatch.setitem(CONFIG, "RESULT_CACHE_DIR", str(tmp_path / "results"))
+    monkeypatch.setitem(CONFIG, "ORDER_STORE_DIR", None)
+
+    # 첫 실행: 분석 후 결과 캐시 저장
+    _fixed_now(monkeypatch, "2025-01-01 09:00")
+    first = SellerDashboard(SELLER)
+    assert first.load_data()
+    first.analyze_all_data()
+    assert not first.from_cache
+    assert _analysis_date(Path(first.export_to_excel(str(tmp_path / "first.xlsx")))) == "2025-01-01 09:00"
+
+    # 재실행: 캐시 적중이면 분석기를 실행하지 않고 분석일시만 새로 기록
+    _fixed_now(monkeypatch, "2025-01-02 10:30")
+    def fail(self):
+        raise AssertionError("캐시 적중 시 분석기가 실행되면 안 됩니다")
+    monkeypatch.setattr(basic_info_analyzer.BasicInfoAnalyzer, "analyze", fail)
+
+    second = SellerDashboard(SELLER)
+    assert second.load_data()
+    second.analyze_all_data()
+    assert second.from_cache
+    assert _analysis_date(Path(second.export_to_excel(str(tmp_path / "second.xlsx")))) == "2025-01-02 10:30"